@@ -9,10 +9,12 @@ import data_fetcher
 import health_check
 import report_generator
 import visualizations
-from src.gmb_app.core.config import get_gemini_api_key
+from src.gmb_app.core import deadline
+from src.gmb_app.core.config import get_dashboard_budget_s, get_gemini_api_key
 from src.gmb_app.core.i18n import LANGUAGE_OPTIONS, translate
-from src.gmb_app.services.performance_service import fetch_dashboard_data
+from src.gmb_app.services.performance_service import DASHBOARD_RESOURCES, start_dashboard_fetch
 from src.gmb_app.ui.create_post import render_create_post_tab
+from src.gmb_app.ui.portfolio import render_portfolio_tab
 
 # Page Config
 st.set_page_config(page_title="Google My Business Manager", layout="wide")
@@ -60,7 +62,10 @@ def resolve_selected_location(credentials):
         return location_id, selected_location_obj, selected_account_id
 
     st.sidebar.success("Authenticated with Google")
-    all_locations = data_fetcher.get_locations(credentials, account_name=None)
+    if st.sidebar.button("Sign out"):
+        auth.sign_out()
+        st.rerun()
+    all_locations = data_fetcher.get_location_titles(credentials)
     if not all_locations:
         st.sidebar.warning("No locations found. Make sure you have access to at least one Google Business Profile.")
         return location_id, selected_location_obj, selected_account_id
@@ -93,33 +98,98 @@ def resolve_selected_location(credentials):
     return location_id, selected_location_obj, selected_account_id
 
 
+def get_selected_location_details(credentials, location_id, selected_location_obj):
+    return data_fetcher.get_location_details(credentials, location_id) or selected_location_obj
+
+
 def fetch_data_if_requested(credentials, location_id, selected_account_id, start_date, end_date):
     if not st.sidebar.button(t("fetch_data")):
         return
 
-    with st.spinner("Fetching data..."):
-        dashboard_data = fetch_dashboard_data(
-            credentials,
-            location_id,
-            selected_account_id,
-            start_date,
-            end_date,
-        )
-        st.session_state["metrics_df"] = dashboard_data["metrics_df"]
-        st.session_state["keywords_df"] = dashboard_data["keywords_df"]
-        st.session_state["reviews"] = dashboard_data["reviews"]
-        st.session_state["posts"] = dashboard_data["posts"]
-        st.session_state["data_fetched"] = True
+    # Drop the previous location's data; each section refills as its resource arrives
+    for key in DASHBOARD_RESOURCES:
+        st.session_state.pop(key, None)
+    st.session_state["dashboard_fetch"] = start_dashboard_fetch(
+        credentials,
+        location_id,
+        selected_account_id,
+        start_date,
+        end_date,
+    )
+
+
+class DashboardSections:
+    """Renders each dashboard section as soon as the resources it needs are loaded.
+
+    Sections whose data is ready render in place; the others get a loading
+    placeholder that `stream()` fills in as the background fetch completes.
+    """
+
+    def __init__(self, fetch):
+        self.fetch = fetch
+        self.pending = []
+
+    def resource(self, key):
+        # Session state wins so other tabs can replace a resource (e.g. posts after publishing)
+        if key not in st.session_state:
+            st.session_state[key] = self.fetch.result(key)
+        return st.session_state[key]
+
+    def render(self, keys, loading_message, render_fn):
+        if all(self.fetch.ready(key) for key in keys):
+            self._render(keys, render_fn)
+            return
+        placeholder = st.empty()
+        placeholder.info(f"⏳ {loading_message}")
+        self.pending.append((keys, placeholder, render_fn))
+
+    def _render(self, keys, render_fn):
+        try:
+            values = [self.resource(key) for key in keys]
+        except Exception as e:
+            st.error(f"Could not load {', '.join(keys)}: {e}")
+            return
+        if any(self.fetch.is_incomplete(key) for key in keys):
+            st.warning("Loading took longer than the time budget; this section shows partial data. Fetch again to retry.")
+        render_fn(*values)
+
+    def stream(self):
+        """Blocks until every pending section is rendered, filling each as its data lands."""
+        while self.pending:
+            waiting = {key for keys, _, _ in self.pending for key in keys if not self.fetch.ready(key)}
+            if waiting:
+                self.fetch.wait_any(sorted(waiting))
+            still_pending = []
+            for keys, placeholder, render_fn in self.pending:
+                if all(self.fetch.ready(key) for key in keys):
+                    with placeholder.container():
+                        self._render(keys, render_fn)
+                else:
+                    still_pending.append((keys, placeholder, render_fn))
+            self.pending = still_pending
 
 
-def render_tab_overview(start_date, end_date):
+def render_tab_overview(sections, start_date, end_date):
     st.header("Performance Overview")
-    if not st.session_state.get("data_fetched"):
+    if not sections:
         st.info("Click 'Fetch Data' in the sidebar to view the report.")
         return
 
-    metrics_df = st.session_state["metrics_df"]
-    keywords_df = st.session_state["keywords_df"]
+    sections.render(("metrics_df",), "Loading daily metrics...", render_metrics_section)
+    sections.render(("keywords_df",), "Loading search keywords...", render_keywords_section)
+    sections.render(
+        ("metrics_df", "keywords_df"),
+        "Preparing the report...",
+        lambda metrics_df, keywords_df: render_export_section(metrics_df, keywords_df, start_date, end_date),
+    )
+
+
+def render_metrics_section(metrics_df):
+    failed_metrics = metrics_df.attrs.get("failed_metrics", [])
+    if failed_metrics:
+        st.warning(
+            "Some metrics could not be fetched and are shown as zero: " + ", ".join(failed_metrics)
+        )
 
     st.subheader("Daily Trends")
     if not metrics_df.empty:
@@ -168,6 +238,8 @@ def render_tab_overview(start_date, end_date):
     if fig_platform:
         st.plotly_chart(fig_platform, use_container_width=True)
 
+
+def render_keywords_section(keywords_df):
     col1, col2 = st.columns([2, 1])
     with col1:
         st.subheader("Top Keywords")
@@ -187,6 +259,8 @@ def render_tab_overview(start_date, end_date):
         else:
             st.info("No keywords found.")
 
+
+def render_export_section(metrics_df, keywords_df, start_date, end_date):
     st.subheader("Export Report")
     if st.button("Generate PDF Report"):
         pdf_path = report_generator.generate_pdf(metrics_df, keywords_df, start_date, end_date)
@@ -199,13 +273,16 @@ def render_tab_overview(start_date, end_date):
             )
 
 
-def render_tab_reviews():
+def render_tab_reviews(sections):
     st.header("Reviews Analysis")
-    if not st.session_state.get("data_fetched"):
+    if not sections:
         st.info("Click 'Fetch Data' in the sidebar to view reviews.")
         return
 
-    reviews = st.session_state.get("reviews", [])
+    sections.render(("reviews",), "Loading reviews...", render_reviews_section)
+
+
+def render_reviews_section(reviews):
     if not reviews:
         st.info("No reviews found.")
         return
@@ -277,13 +354,16 @@ def render_tab_reviews():
                         st.text_area("Suggested Reply:", value=reply, height=100, key=f"reply_area_{i}")
 
 
-def render_tab_posts():
+def render_tab_posts(sections):
     st.header("Posts Analysis")
-    if not st.session_state.get("data_fetched"):
+    if not sections:
         st.info("Click 'Fetch Data' in the sidebar to view posts.")
         return
 
-    posts = st.session_state.get("posts", [])
+    sections.render(("posts",), "Loading posts...", render_posts_section)
+
+
+def render_posts_section(posts):
     if not posts:
         st.info("No posts found.")
         return
@@ -293,33 +373,52 @@ def render_tab_posts():
     if fig_posts:
         st.plotly_chart(fig_posts, use_container_width=True)
 
+    insights = [post.get("insights") or {} for post in posts]
+    col_p1, col_p2, col_p3 = st.columns(3)
+    col_p1.metric("Posts", len(posts))
+    col_p2.metric("Post Views", sum(i.get("LOCAL_POST_VIEWS_SEARCH", 0) for i in insights))
+    col_p3.metric("Button Clicks", sum(i.get("LOCAL_POST_ACTIONS_CALL_TO_ACTION", 0) for i in insights))
+
     st.subheader("Recent Posts")
     for post in posts[:5]:
         with st.expander(f"Post: {post.get('summary', 'No Summary')[:50]}..."):
             st.write(post.get("summary", ""))
             st.caption(f"Type: {post.get('topicType')} | State: {post.get('state')}")
+            post_insights = post.get("insights") or {}
+            if post_insights:
+                st.caption(
+                    f"Views: {post_insights.get('LOCAL_POST_VIEWS_SEARCH', 0)} | "
+                    f"Button Clicks: {post_insights.get('LOCAL_POST_ACTIONS_CALL_TO_ACTION', 0)}"
+                )
             if post.get("callToAction"):
                 st.write(f"CTA: {post.get('callToAction').get('actionType')}")
 
 
-def render_tab_health(credentials, selected_location_obj, location_id):
+def render_tab_health(sections, credentials, selected_location_obj, location_id):
     st.header("Profile Health Check")
     if not selected_location_obj:
         st.info("Select a location in the sidebar to view health analysis.")
         return
 
-    if not st.session_state.get("data_fetched"):
+    if not sections:
         st.info("Click 'Fetch Data' in the sidebar to view health analysis.")
         return
 
-    with st.spinner("Analyzing profile health..."):
+    sections.render(
+        ("reviews", "posts"),
+        "Waiting for reviews and posts...",
+        lambda reviews, posts: render_health_section(credentials, selected_location_obj, location_id, reviews, posts),
+    )
+
+
+def render_health_section(credentials, selected_location_obj, location_id, reviews, posts):
+    with st.spinner("Analyzing profile health..."), deadline.within(get_dashboard_budget_s()):
+        location_details = get_selected_location_details(credentials, location_id, selected_location_obj)
         media_items = data_fetcher.get_media(credentials, location_id)
         questions = data_fetcher.get_questions(credentials, location_id)
-        reviews = st.session_state.get("reviews", [])
-        posts = st.session_state.get("posts", [])
-        results = health_check.analyze_profile_health(selected_location_obj, reviews, posts, media_items, questions)
+        results = health_check.analyze_profile_health(location_details, reviews, posts, media_items, questions)
 
-    st.subheader(f"Análise de Saúde da {selected_location_obj.get('title', 'Empresa')}")
+    st.subheader(f"Análise de Saúde da {location_details.get('title', 'Empresa')}")
     weak = sum(1 for r in results if r["status"] == "Weak")
     reasonable = sum(1 for r in results if r["status"] == "Reasonable")
     good = sum(1 for r in results if r["status"] == "Good")
@@ -389,20 +488,29 @@ def main():
 
     fetch_data_if_requested(credentials, location_id, selected_account_id, start_date, end_date)
 
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(
-        [t("overview"), t("reviews"), t("posts"), t("health"), t("create_post")]
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(
+        [t("overview"), t("reviews"), t("posts"), t("health"), t("create_post"), t("portfolio")]
     )
 
+    fetch = st.session_state.get("dashboard_fetch")
+    sections = DashboardSections(fetch) if fetch else None
+
     with tab1:
-        render_tab_overview(start_date, end_date)
+        render_tab_overview(sections, start_date, end_date)
     with tab2:
-        render_tab_reviews()
+        render_tab_reviews(sections)
     with tab3:
-        render_tab_posts()
+        render_tab_posts(sections)
     with tab4:
-        render_tab_health(credentials, selected_location_obj, location_id)
+        render_tab_health(sections, credentials, selected_location_obj, location_id)
     with tab5:
         render_tab_create_post(credentials, location_id, selected_account_id)
+    with tab6:
+        render_portfolio_tab(credentials, start_date, end_date, t)
+
+    # Every tab is laid out; fill the sections still loading as their data arrives
+    if sections:
+        sections.stream()
 
 
 if __name__ == "__main__":
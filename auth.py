@@ -1,14 +1,22 @@
 import os
 
 import streamlit as st
-from google.auth.transport.requests import Request
+import streamlit.components.v1 as components
+from google.auth.exceptions import RefreshError
 from google_auth_oauthlib.flow import Flow
 
 from src.gmb_app.core import config
+from src.gmb_app.core.cache import invalidate_resource
+from src.gmb_app.core.identity import credential_identity
 from src.gmb_app.core.logging import get_logger
+from src.gmb_app.integrations import credential_manager
+from src.gmb_app.integrations.client_registry import clear_services
 
 logger = get_logger("auth")
 
+# Cookie holding the id that restores a persisted sign-in after a server restart
+SESSION_COOKIE = "gmb_sid"
+
 # Scopes required for Google Business Profile and Drive
 SCOPES = [
     "https://www.googleapis.com/auth/business.manage",
@@ -92,21 +100,72 @@ def get_flow():
     
     return None
 
+def _client_secret(flow):
+    """Returns the OAuth client secret, which persisted sign-ins are stored without."""
+    return flow.client_config.get("client_secret") if flow else None
+
+
+def _write_session_cookie(session_id, max_age_s):
+    """Sets (or with max_age_s=0 clears) the session cookie from the browser.
+
+    Streamlit cannot set cookies on its responses, so a zero-height component
+    writes it on the app's own document.
+    """
+    secure = "; Secure" if config.get_google_redirect_uri().startswith("https://") else ""
+    cookie = f"{SESSION_COOKIE}={session_id}; Max-Age={max_age_s}; Path=/; SameSite=Lax{secure}"
+    components.html(f"<script>window.parent.document.cookie = {cookie!r};</script>", height=0)
+
+
+def sign_out():
+    """Forgets the signed-in account: stored tokens, session cookie and cached API data."""
+    creds = st.session_state.get("credentials")
+    session_id = st.session_state.pop("credential_session_id", None) or st.context.cookies.get(SESSION_COOKIE)
+    try:
+        credential_manager.forget_session(session_id)
+    except Exception:
+        logger.exception("Failed deleting persisted credentials")
+    if creds:
+        clear_services(creds)
+        invalidate_resource(identity=credential_identity, credentials=creds)
+    st.session_state.credentials = None
+    st.session_state.pending_session_cookie = ""
+
+
 def authenticate():
     """Handles the authentication flow."""
     
     if "credentials" not in st.session_state:
         st.session_state.credentials = None
 
+    # Written here rather than before the rerun that follows login, which would drop it
+    pending_cookie = st.session_state.pop("pending_session_cookie", None)
+    if pending_cookie is not None:
+        _write_session_cookie(pending_cookie, config.get_session_max_age_s() if pending_cookie else 0)
+
+    session_id = st.session_state.get("credential_session_id") or st.context.cookies.get(SESSION_COOKIE)
+    if not st.session_state.credentials and session_id:
+        try:
+            st.session_state.credentials = credential_manager.restore_credentials(
+                session_id, _client_secret(get_flow()), SCOPES
+            )
+            if st.session_state.credentials:
+                st.session_state.credential_session_id = session_id
+        except Exception:
+            logger.exception("Failed restoring persisted credentials")
+
     if st.session_state.credentials:
         creds = st.session_state.credentials
         if not _has_required_scopes(creds):
-            st.session_state.credentials = None
+            sign_out()
             st.warning("Reconnect Google account to grant Drive access.")
             return None
-        if creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-            st.session_state.credentials = creds
+        try:
+            # Refreshes inline only when expired; near-expiry tokens renew in the background
+            credential_manager.ensure_fresh(creds)
+        except RefreshError:
+            logger.warning("Stored Google token was revoked or expired; asking to log in again")
+            sign_out()
+            st.rerun()
         return creds
 
     # If not authenticated, show login button
@@ -137,6 +196,10 @@ def authenticate():
         st.session_state.credentials = creds
         # Clear query params to avoid re-using code
         st.query_params.clear()
+        session_id = credential_manager.remember_credentials(creds)
+        if session_id:
+            st.session_state.credential_session_id = session_id
+            st.session_state.pending_session_cookie = session_id
         st.rerun()
         
     return None
@@ -1,13 +1,33 @@
+import contextvars
+import numpy as np
 import pandas as pd
 import time
+from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import quote
-from urllib.request import Request as UrlRequest, urlopen
-from urllib.error import HTTPError
 
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-from google.auth.transport.requests import Request
+from src.gmb_app.core import deadline, tracing
+from src.gmb_app.core.cache import cached_read
+from src.gmb_app.core.config import (
+    get_backfill_months,
+    get_backfill_workers,
+    get_http_timeout_s,
+    get_metrics_unsettled_days,
+    get_post_insights_refresh_days,
+    get_reviews_full_sync_hours,
+)
+from src.gmb_app.core.errors import AppError, AuthError
+from src.gmb_app.core.identity import credential_identity
 from src.gmb_app.core.logging import get_logger
+from src.gmb_app.integrations.batch_executor import RequestBatch
+from src.gmb_app.integrations.client_registry import (
+    get_api_root_url,
+    get_service,
+    get_session,
+)
+from src.gmb_app.integrations.pagination import PageIterator
+from src.gmb_app.integrations.request_executor import get_bucket
+from src.gmb_app.storage import keyword_store, location_index, metrics_store, post_store, review_store
 
 MYBUSINESS_V4_DISCOVERY_URL = "https://developers.google.com/my-business/samples/mybusiness_google_rest_v4p9.json"
 POST_TOPIC_TYPES = {"STANDARD", "OFFER", "EVENT"}
@@ -19,34 +39,126 @@ POST_CTA_TYPES = {
     "SIGN_UP",
     "CALL",
 }
+LOCATION_READ_MASK = "name,title,storefrontAddress,phoneNumbers,websiteUri,regularHours,categories,specialHours,serviceArea"
+# Just enough for the location picker; details are fetched for the selected location only
+LOCATION_TITLE_READ_MASK = "name,title"
+LOCATION_DETAIL_READ_MASK = LOCATION_READ_MASK + ",openInfo,profile"
+# Maximum page size of the Account Management accounts.list endpoint
+ACCOUNTS_PAGE_SIZE = 20
+# Maximum page size of the Business Information locations.list endpoint
+LOCATIONS_PAGE_SIZE = 100
+# Maximum page size of the v4 reviews.list endpoint
+REVIEWS_PAGE_SIZE = 50
+# Locations sent per batchGetReviews request
+REVIEWS_BATCH_LOCATIONS = 50
+# Maximum page size of the v4 localPosts.list endpoint
+POSTS_PAGE_SIZE = 100
+# Posts sent per localPosts.reportInsights request
+POST_INSIGHTS_BATCH_POSTS = 10
+POST_INSIGHT_METRICS = ["LOCAL_POST_VIEWS_SEARCH", "LOCAL_POST_ACTIONS_CALL_TO_ACTION"]
+# Maximum page size of the v4 media.list endpoint
+MEDIA_PAGE_SIZE = 100
+# Maximum page size of the Q&A questions.list endpoint
+QUESTIONS_PAGE_SIZE = 10
+# Accounts listed in parallel by get_all_accessible_locations
+LOCATION_LIST_WORKERS = 8
+# Longest dailyRange sent in one Performance API request; longer ranges are split
+METRICS_CHUNK_DAYS = 90
+DAILY_METRICS = [
+    "BUSINESS_IMPRESSIONS_DESKTOP_MAPS",
+    "BUSINESS_IMPRESSIONS_DESKTOP_SEARCH",
+    "BUSINESS_IMPRESSIONS_MOBILE_MAPS",
+    "BUSINESS_IMPRESSIONS_MOBILE_SEARCH",
+    "WEBSITE_CLICKS",
+    "CALL_CLICKS",
+    "BUSINESS_DIRECTION_REQUESTS",
+    "BUSINESS_CONVERSATIONS",
+    "BUSINESS_BOOKINGS",
+    "BUSINESS_FOOD_ORDERS",
+]
 
 
 
 
 logger = get_logger("data_fetcher")
 
+# Accounts and location listings change rarely; keep them longer than per-location data
+LISTING_CACHE_TTL_S = 15 * 60
+
+def _cached(resource, ttl_s=None):
+    """Caches a read function in memory per credential identity, location and params."""
+    return cached_read(
+        resource,
+        credential_identity,
+        ttl_s=ttl_s,
+        location_key=lambda location: _location_key(location),
+    )
+
 def get_mybusiness_service(_credentials):
     """Returns a mybusiness v4 service client."""
-    return build(
+    return get_service(
         "mybusiness",
         "v4",
-        credentials=_credentials,
-        discoveryServiceUrl=MYBUSINESS_V4_DISCOVERY_URL,
+        _credentials,
+        discovery_url=MYBUSINESS_V4_DISCOVERY_URL,
         static_discovery=False,
     )
 
+def get_account_management_service(_credentials):
+    """Returns a mybusinessaccountmanagement v1 service client."""
+    return get_service("mybusinessaccountmanagement", "v1", _credentials)
+
+def get_business_information_service(_credentials):
+    """Returns a mybusinessbusinessinformation v1 service client."""
+    return get_service("mybusinessbusinessinformation", "v1", _credentials)
+
+def get_performance_service(_credentials):
+    """Returns a businessprofileperformance v1 service client.
+
+    Uses live discovery (cached on disk) to pick up the latest API definition.
+    """
+    return get_service("businessprofileperformance", "v1", _credentials, static_discovery=False)
+
+def iter_accounts(_credentials, page_token=None, limit=None):
+    """Streams the accounts of the authenticated user as pages arrive (see PageIterator)."""
+    service_account = get_account_management_service(_credentials)
+    return PageIterator(
+        lambda token: service_account.accounts().list(pageSize=ACCOUNTS_PAGE_SIZE, pageToken=token),
+        'accounts',
+        page_token=page_token,
+        limit=limit,
+    )
+
+@_cached("accounts", ttl_s=LISTING_CACHE_TTL_S)
 def get_accounts(_credentials):
-    """Fetches a list of accounts for the authenticated user."""
+    """Fetches every account of the authenticated user."""
     try:
-        service_account = build('mybusinessaccountmanagement', 'v1', credentials=_credentials)
-        accounts_result = service_account.accounts().list().execute()
-        return accounts_result.get('accounts', [])
+        return list(iter_accounts(_credentials))
     except Exception as e:
         logger.error(f"Error fetching accounts: {e}")
         return []
 
+def _index_locations(_credentials, location_names, account_name=None):
+    """Records location -> account parents in the persistent index without failing the caller."""
+    try:
+        location_index.record_locations(_credentials, location_names, account_name=account_name)
+    except Exception as e:
+        logger.warning(f"Could not update location index: {e}")
+
+def _lookup_indexed_location(_credentials, location_name):
+    try:
+        return location_index.lookup_location_parent(_credentials, location_name)
+    except Exception as e:
+        logger.warning(f"Could not read location index: {e}")
+        return None
+
 def get_account_for_location(_credentials, location_name):
-    """Gets the account ID for a location by iterating through accounts.
+    """Gets the account ID for a location, probing accounts only on an index miss.
+
+    Locations seen by `get_all_accessible_locations`/`get_locations` (or found by a
+    previous probe) resolve from the persistent location index without API calls.
+    A probe lists the locations of every account in batch requests, one page of
+    each account per round trip, and indexes all of them.
 
     Args:
         _credentials: Google API credentials
@@ -66,23 +178,35 @@ def get_account_for_location(_credentials, location_name):
 
         location_id = location_name.replace('locations/', '')
 
-        # Get all accounts and try each one
-        accounts = get_accounts(_credentials)
-        service_business = build('mybusinessbusinessinformation', 'v1', credentials=_credentials)
-
-        for account in accounts:
-            try:
-                full_path = f"{account['name']}/locations/{location_id}"
-                # Try to fetch this location under this account
-                service_business.accounts().locations().get(
-                    name=full_path,
-                    readMask="name"
-                ).execute()
-                # If successful, return the full path
-                return full_path
-            except Exception as e:
-                # Location not in this account, continue to next
-                continue
+        indexed_path = _lookup_indexed_location(_credentials, location_name)
+        if indexed_path:
+            return indexed_path
+
+        # List every account's locations at once, one batch round per page
+        service_business = get_business_information_service(_credentials)
+        page_tokens = {account['name']: None for account in get_accounts(_credentials)}
+        while page_tokens:
+            batch = RequestBatch(service_business)
+            for account_name, page_token in page_tokens.items():
+                request_params = {'parent': account_name, 'readMask': 'name', 'pageSize': LOCATIONS_PAGE_SIZE}
+                if page_token:
+                    request_params['pageToken'] = page_token
+                batch.add(service_business.accounts().locations().list(**request_params), key=account_name)
+
+            page_tokens = {}
+            for account_name, locations_result in batch.execute().items():
+                names = [
+                    f"{account_name}/{extract_location_path(loc['name'])}"
+                    for loc in locations_result.get('locations', [])
+                    if loc.get('name')
+                ]
+                # Remember every location seen, so probing for the next one is free
+                _index_locations(_credentials, names)
+                full_path = f"{account_name}/locations/{location_id}"
+                if full_path in names:
+                    return full_path
+                if locations_result.get('nextPageToken'):
+                    page_tokens[account_name] = locations_result['nextPageToken']
 
         # If not found in any account, return original
         return location_name
@@ -90,13 +214,91 @@ def get_account_for_location(_credentials, location_name):
         # On error, return original name
         return location_name
 
-def get_all_accessible_locations(_credentials):
+def _full_location_names(account_name, locations):
+    """Rewrites location names in place to 'accounts/{accountId}/locations/{locationId}'."""
+    for loc in locations:
+        if not loc.get('name', '').startswith('accounts/'):
+            # Fix the path if it's not in full format
+            if loc.get('name', '').startswith('locations/'):
+                loc['name'] = f"{account_name}/{loc['name']}"
+            else:
+                # It's just the ID, need both prefixes
+                loc['name'] = f"{account_name}/locations/{loc['name']}"
+    return locations
+
+def _account_location_pages(_credentials, account_name, read_mask, page_token=None, limit=None):
+    # Shared service: requests go through a per-thread transport (see client_registry)
+    service_business = get_business_information_service(_credentials)
+    return PageIterator(
+        lambda token: service_business.accounts().locations().list(
+            parent=account_name,
+            readMask=read_mask,
+            pageSize=LOCATIONS_PAGE_SIZE,
+            pageToken=token
+        ),
+        'locations',
+        page_token=page_token,
+        limit=limit,
+    )
+
+def iter_locations(_credentials, account_name=None, read_mask=LOCATION_READ_MASK, limit=None):
+    """Streams locations with full path names as pages arrive, one account after another.
+
+    Unlike `get_locations`, nothing is accumulated: stopping early (or `limit`)
+    skips the remaining pages and accounts.
+
+    Args:
+        _credentials: Google API credentials
+        account_name: Account name in format 'accounts/{accountId}', or None for every account
+        read_mask: Fields to request for each location
+        limit: Maximum number of locations to yield
+    """
+    account_names = [account_name] if account_name else [account['name'] for account in iter_accounts(_credentials)]
+    remaining = limit
+    for name in account_names:
+        if remaining is not None and remaining <= 0:
+            return
+        pages = _account_location_pages(_credentials, name, read_mask, limit=remaining)
+        for locations in pages.pages():
+            _index_locations(_credentials, [loc['name'] for loc in _full_location_names(name, locations)])
+            yield from locations
+        if remaining is not None:
+            remaining -= pages.item_count
+
+def _list_account_locations(_credentials, account_name, read_mask, on_page=None):
+    """Pages through one account's locations, normalizing names to full paths.
+
+    Args:
+        _credentials: Google API credentials
+        account_name: Account name in format 'accounts/{accountId}'
+        read_mask: Fields to request for each location
+        on_page: Optional callback(account_name, locations) invoked as each page arrives
+
+    Returns:
+        List of location objects with full path names in v1 format
+    """
+    account_locations = []
+    for locations in _account_location_pages(_credentials, account_name, read_mask).pages():
+        _full_location_names(account_name, locations)
+        account_locations.extend(locations)
+        if on_page and locations:
+            on_page(account_name, locations)
+
+    _index_locations(_credentials, [loc['name'] for loc in account_locations], account_name=account_name)
+    return account_locations
+
+def get_all_accessible_locations(_credentials, on_page=None, read_mask=LOCATION_READ_MASK):
     """Fetches ALL locations accessible by the user using v1 APIs.
 
-    Iterates through all accounts and fetches locations from each.
+    Accounts are listed concurrently by up to LOCATION_LIST_WORKERS threads. The
+    returned list keeps account order regardless of which account finishes first.
 
     Args:
         _credentials: Google API credentials
+        on_page: Optional callback(account_name, locations) invoked as each page
+            arrives, from the worker thread that fetched it
+        read_mask: Fields to request for each location; LOCATION_TITLE_READ_MASK
+            keeps the payload small when only a picker is needed
 
     Returns:
         List of location objects with full path names in v1 format
@@ -109,106 +311,91 @@ def get_all_accessible_locations(_credentials):
             logger.warning("No accounts found.")
             return []
 
-        all_locations = []
-        service_business = build('mybusinessbusinessinformation', 'v1', credentials=_credentials)
-        read_mask = "name,title,storefrontAddress,phoneNumbers,websiteUri,regularHours,categories,specialHours,serviceArea"
+        locations_by_account = {}
+        max_workers = min(LOCATION_LIST_WORKERS, len(accounts))
 
         # Fetch locations from each account
-        for account in accounts:
-            try:
-                page_token = None
-
-                while True:
-                    request_params = {
-                        'parent': account['name'],
-                        'readMask': read_mask,
-                        'pageSize': 100
-                    }
-                    if page_token:
-                        request_params['pageToken'] = page_token
-
-                    locations_result = service_business.accounts().locations().list(**request_params).execute()
-                    locations = locations_result.get('locations', [])
-
-                    # Ensure all locations have full paths
-                    for loc in locations:
-                        if not loc.get('name', '').startswith('accounts/'):
-                            # Fix the path if it's not in full format
-                            if loc.get('name', '').startswith('locations/'):
-                                loc['name'] = f"{account['name']}/{loc['name']}"
-                            else:
-                                # It's just the ID, need both prefixes
-                                loc['name'] = f"{account['name']}/locations/{loc['name']}"
-
-                    all_locations.extend(locations)
-
-                    page_token = locations_result.get('nextPageToken')
-                    if not page_token:
-                        break
-
-            except Exception as e:
-                # Skip accounts that error (user might not have location access for this account)
-                continue
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gbp-locations") as executor:
+            futures = {
+                # Each task runs in a copy of this context so its spans nest under the caller's
+                executor.submit(
+                    contextvars.copy_context().run,
+                    _list_account_locations,
+                    _credentials,
+                    account['name'],
+                    read_mask,
+                    on_page,
+                ): account['name']
+                for account in accounts
+            }
+            for future in as_completed(futures):
+                account_name = futures[future]
+                try:
+                    locations_by_account[account_name] = future.result()
+                except Exception as e:
+                    # Skip accounts that error (user might not have location access for this account)
+                    logger.warning(f"Skipping locations of {account_name}: {e}")
 
+        all_locations = []
+        for account in accounts:
+            all_locations.extend(locations_by_account.get(account['name'], []))
         return all_locations
 
     except Exception as e:
         logger.error(f"Error fetching locations: {e}")
-        import traceback
-        logger.debug(traceback.format_exc())
+        logger.debug("Location listing failure", exc_info=True)
         return []
 
-def get_locations(_credentials, account_name=None):
+@_cached("locations", ttl_s=LISTING_CACHE_TTL_S)
+def get_locations(_credentials, account_name=None, read_mask=LOCATION_READ_MASK):
     """Fetches a list of locations for the specified account, or all locations if account_name is None.
 
     Args:
         _credentials: Google API credentials
         account_name: Account name in format 'accounts/{accountId}', or None to fetch all locations
+        read_mask: Fields to request for each location
 
     """
     if account_name is None:
         # Fetch from all accounts
-        return get_all_accessible_locations(_credentials)
+        return get_all_accessible_locations(_credentials, read_mask=read_mask)
 
     try:
-        service_business = build('mybusinessbusinessinformation', 'v1', credentials=_credentials)
-        read_mask = "name,title,storefrontAddress,phoneNumbers,websiteUri,regularHours,categories,specialHours,serviceArea"
+        return _list_account_locations(_credentials, account_name, read_mask)
+    except Exception as e:
+        logger.error(f"Error fetching locations from {account_name}: {e}")
+        return []
 
-        all_locations = []
-        page_token = None
+def get_location_titles(_credentials, account_name=None):
+    """Fetches only name and title of each location, for pickers."""
+    return get_locations(_credentials, account_name=account_name, read_mask=LOCATION_TITLE_READ_MASK)
 
-        while True:
-            request_params = {
-                'parent': account_name,
-                'readMask': read_mask,
-                'pageSize': 100
-            }
-            if page_token:
-                request_params['pageToken'] = page_token
-
-            locations_result = service_business.accounts().locations().list(**request_params).execute()
-            locations = locations_result.get('locations', [])
-
-            # Ensure all locations have full paths
-            for loc in locations:
-                if not loc.get('name', '').startswith('accounts/'):
-                    # Fix the path if it's not in full format
-                    if loc.get('name', '').startswith('locations/'):
-                        loc['name'] = f"{account_name}/{loc['name']}"
-                    else:
-                        # It's just the ID, need both prefixes
-                        loc['name'] = f"{account_name}/locations/{loc['name']}"
-
-            all_locations.extend(locations)
-
-            page_token = locations_result.get('nextPageToken')
-            if not page_token:
-                break
+@_cached("location_details", ttl_s=LISTING_CACHE_TTL_S)
+def get_location_details(_credentials, location_id):
+    """Fetches the full profile of a single location (everything the health check reads).
 
-        return all_locations
+    Args:
+        _credentials: Google API credentials
+        location_id: Location ID in any format accepted by extract_location_path
+
+    Returns:
+        Location object with its name in the format it was requested, or {} on error
+    """
+    if not _credentials:
+        return {}
+
+    try:
+        service_business = get_business_information_service(_credentials)
+        details = service_business.locations().get(
+            name=extract_location_path(location_id),
+            readMask=LOCATION_DETAIL_READ_MASK
+        ).execute()
+        if location_id.startswith('accounts/'):
+            details['name'] = location_id
+        return details
     except Exception as e:
-        logger.error(f"Error fetching locations from {account_name}: {e}")
-        return []
+        logger.warning(f"Could not fetch location details for {location_id}: {e}")
+        return {}
 
 def extract_location_path(location_id):
     """Extracts the locations/{locationId} part from a full path.
@@ -235,6 +422,11 @@ def extract_location_path(location_id):
     return f"locations/{location_id}"
 
 
+def _location_key(location_id):
+    """Returns the bare location ID used to key locally stored data."""
+    return extract_location_path(location_id).split('/', 1)[1]
+
+
 def resolve_location_parent(_credentials, location_id, account_name=None):
     """Resolves a location to accounts/{accountId}/locations/{locationId} format."""
     if location_id.startswith("accounts/"):
@@ -261,6 +453,35 @@ def resolve_location_parent(_credentials, location_id, account_name=None):
     )
 
 
+def _with_current_parent(_credentials, location_id, account_name, call):
+    """Runs `call()`, re-resolving the location's account once if its indexed parent is denied.
+
+    A location moved to another account keeps its old parent in the location index,
+    so a 401/403/404 through an indexed parent drops the entry, probes the accounts
+    again and, when the location turned up under another account, retries `call()`.
+    Explicit account names and full location paths are never second-guessed.
+    """
+    try:
+        return call()
+    except Exception as e:
+        if account_name or location_id.startswith('accounts/') or not _is_access_denied(e):
+            raise
+        location_name = extract_location_path(location_id)
+        indexed_path = _lookup_indexed_location(_credentials, location_name)
+        if not indexed_path:
+            raise
+        logger.info(f"Indexed parent of {location_name} was denied; resolving it again")
+        try:
+            location_index.forget_location(_credentials, location_name)
+        except Exception as forget_error:
+            logger.warning(f"Could not update location index: {forget_error}")
+            raise e
+        current_path = get_account_for_location(_credentials, location_name)
+        if not current_path.startswith('accounts/') or current_path == indexed_path:
+            raise
+        return call()
+
+
 def build_local_post_payload(summary, topic_type="STANDARD", language_code="pt-BR", cta_type=None, cta_url=None, image_url=None):
     """Builds a validated local post payload for GBP API."""
     summary_clean = (summary or "").strip()
@@ -296,8 +517,204 @@ def build_local_post_payload(summary, topic_type="STANDARD", language_code="pt-B
 
     return payload
 
-def get_daily_metrics(_credentials, location_id, start_date, end_date):
-    """Fetches daily metrics from API."""
+def _daily_range_params(start_date, end_date):
+    """Flattens a date range into the dailyRange query parameters of the Performance API."""
+    return {
+        "dailyRange_startDate_year": start_date.year,
+        "dailyRange_startDate_month": start_date.month,
+        "dailyRange_startDate_day": start_date.day,
+        "dailyRange_endDate_year": end_date.year,
+        "dailyRange_endDate_month": end_date.month,
+        "dailyRange_endDate_day": end_date.day,
+    }
+
+def _collect_dated_values(time_series):
+    """Returns the datedValues of a timeSeries, which may be a single object or a list."""
+    if time_series and isinstance(time_series, dict):
+        return list(time_series.get('datedValues', []))
+    if time_series and isinstance(time_series, list):
+        dated_values = []
+        for series in time_series:
+            dated_values.extend(series.get('datedValues', []))
+        return dated_values
+    return []
+
+def fetch_daily_metric_series(service, location_path, start_date, end_date, metrics=DAILY_METRICS):
+    """Fetches dated values for several metrics, batching them into a single request.
+
+    Falls back to one getDailyMetricsTimeSeries request per metric only when the
+    fetchMultiDailyMetricsTimeSeries request fails.
+
+    Returns:
+        Tuple (series, failed_metrics): series maps metric -> list of datedValues and
+        failed_metrics maps metric -> error message for metrics that could not be fetched.
+    """
+    range_params = _daily_range_params(start_date, end_date)
+    series = {}
+    failed_metrics = {}
+
+    try:
+        response = service.locations().fetchMultiDailyMetricsTimeSeries(
+            location=location_path,
+            dailyMetrics=list(metrics),
+            **range_params
+        ).execute()
+        for multi_series in response.get('multiDailyMetricTimeSeries', []):
+            for metric_series in multi_series.get('dailyMetricTimeSeries', []):
+                metric = metric_series.get('dailyMetric')
+                series.setdefault(metric, []).extend(
+                    _collect_dated_values(metric_series.get('timeSeries'))
+                )
+        return series, failed_metrics
+    except Exception as batch_e:
+        logger.warning(f"Multi-metric fetch failed, falling back to per-metric requests: {batch_e}")
+
+    for metric in metrics:
+        try:
+            response = service.locations().getDailyMetricsTimeSeries(
+                name=location_path,
+                dailyMetric=metric,
+                **range_params
+            ).execute()
+            series[metric] = _collect_dated_values(response.get('timeSeries'))
+        except Exception as metric_e:
+            logger.warning(f"Could not fetch data for {metric}: {metric_e}")
+            failed_metrics[metric] = str(metric_e)
+
+    return series, failed_metrics
+
+def _dated_values_to_arrays(dated_values):
+    """Converts a datedValues list into (datetime64[D] dates, int64 values) arrays."""
+    years = np.fromiter((val['date']['year'] for val in dated_values), dtype=np.int64, count=len(dated_values))
+    months = np.fromiter((val['date']['month'] for val in dated_values), dtype=np.int64, count=len(dated_values))
+    days = np.fromiter((val['date']['day'] for val in dated_values), dtype=np.int64, count=len(dated_values))
+    values = np.fromiter((int(val.get('value', 0)) for val in dated_values), dtype=np.int64, count=len(dated_values))
+
+    months_since_epoch = (years - 1970) * 12 + (months - 1)
+    dates = months_since_epoch.astype('datetime64[M]').astype('datetime64[D]') + (days - 1).astype('timedelta64[D]')
+    return dates, values
+
+def build_daily_metrics_frame(series, metrics=DAILY_METRICS):
+    """Pivots {metric: datedValues} into a date-sorted DataFrame with one column per metric.
+
+    Every metric in `metrics` gets a column (zero where the API returned nothing);
+    metrics present in `series` but not in `metrics` are appended after them.
+    """
+    columns = list(metrics) + [metric for metric in series if metric not in metrics]
+    column_index = {metric: i for i, metric in enumerate(columns)}
+
+    date_chunks = []
+    value_chunks = []
+    column_chunks = []
+    for metric, dated_values in series.items():
+        if not dated_values:
+            continue
+        dates, values = _dated_values_to_arrays(dated_values)
+        date_chunks.append(dates)
+        value_chunks.append(values)
+        column_chunks.append(np.full(len(dates), column_index[metric], dtype=np.int64))
+
+    if not date_chunks:
+        return pd.DataFrame(columns=['date'] + columns)
+
+    all_dates = np.concatenate(date_chunks)
+    unique_dates, row_index = np.unique(all_dates, return_inverse=True)
+    matrix = np.zeros((len(unique_dates), len(columns)), dtype=np.int64)
+    matrix[row_index, np.concatenate(column_chunks)] = np.concatenate(value_chunks)
+
+    df = pd.DataFrame(matrix, columns=columns)
+    df.insert(0, 'date', unique_dates.astype('datetime64[ns]'))
+    return df
+
+def _as_date(value):
+    """Normalizes a date, datetime or ISO string to a datetime.date."""
+    return pd.Timestamp(value).date()
+
+def _missing_date_ranges(_credentials, location_key, start_date, end_date, metrics, unsettled_from):
+    """Returns contiguous (start, end) ranges of days that must be fetched from the API.
+
+    A day must be fetched when the store lacks any of `metrics` for it, or when it is
+    on or after `unsettled_from` (recent days Google may still revise). Only days stored
+    for these credentials count, so another account's history never stands in for a fetch.
+    """
+    complete = metrics_store.complete_dates(_credentials, location_key, start_date, end_date, metrics)
+    ranges = []
+    range_start = None
+    day = start_date
+    while day <= end_date:
+        if day >= unsettled_from or day.isoformat() not in complete:
+            if range_start is None:
+                range_start = day
+        elif range_start is not None:
+            ranges.append((range_start, day - timedelta(days=1)))
+            range_start = None
+        day += timedelta(days=1)
+    if range_start is not None:
+        ranges.append((range_start, end_date))
+    return ranges
+
+def _store_daily_metrics(_credentials, location_key, series, start_date, end_date, metrics):
+    """Writes one row per day and metric in range, zero where the API returned nothing."""
+    if not metrics:
+        return
+    df = build_daily_metrics_frame({m: series.get(m, []) for m in metrics}, metrics)
+    days = pd.date_range(start_date, end_date, freq='D')
+    df = df.set_index('date').reindex(days, fill_value=0)[list(metrics)]
+    df.index = df.index.strftime('%Y-%m-%d')
+    long_df = df.stack()
+    metrics_store.save_daily_values(
+        _credentials,
+        location_key,
+        zip(long_df.index.get_level_values(0), long_df.index.get_level_values(1), long_df.to_numpy()),
+    )
+
+def _split_date_ranges(ranges, chunk_days=METRICS_CHUNK_DAYS):
+    """Splits (start, end) date ranges into consecutive chunks of at most `chunk_days` days."""
+    chunks = []
+    for range_start, range_end in ranges:
+        chunk_start = range_start
+        while chunk_start <= range_end:
+            chunk_end = min(range_end, chunk_start + timedelta(days=chunk_days - 1))
+            chunks.append((chunk_start, chunk_end))
+            chunk_start = chunk_end + timedelta(days=1)
+    return chunks
+
+def _fetch_metrics_chunk(_credentials, service, location_path, location_key, range_start, range_end):
+    """Fetches one date-range chunk into the store and returns {metric: error} of the failed metrics."""
+    series, failed_metrics = fetch_daily_metric_series(
+        service, location_path, range_start, range_end, DAILY_METRICS
+    )
+    _store_daily_metrics(
+        _credentials,
+        location_key,
+        series,
+        range_start,
+        range_end,
+        [m for m in DAILY_METRICS if m not in failed_metrics],
+    )
+    return failed_metrics
+
+def _load_daily_metrics_frame(_credentials, location_key, start_date, end_date, metrics):
+    rows = metrics_store.load_daily_values(_credentials, location_key, start_date, end_date, metrics)
+    if not rows:
+        return pd.DataFrame()
+    long_df = pd.DataFrame(rows, columns=['date', 'metric', 'value'])
+    df = long_df.pivot(index='date', columns='metric', values='value')
+    df = df.reindex(columns=list(metrics), fill_value=0).fillna(0).astype('int64')
+    df.index = pd.to_datetime(df.index).astype('datetime64[ns]')
+    df.columns.name = None
+    return df.rename_axis('date').reset_index()
+
+@_cached("metrics")
+def get_daily_metrics(_credentials, location_id, start_date, end_date, unsettled_days=None):
+    """Fetches daily metrics, downloading only the days missing from the local store.
+
+    Days already stored for these credentials are served locally; missing days and the trailing
+    `unsettled_days` window (default from GMB_METRICS_UNSETTLED_DAYS) are fetched
+    from the API, METRICS_CHUNK_DAYS at most per request, and stored. Metrics that could not be fetched are listed in
+    `df.attrs["failed_metrics"]` (their columns are still zero-filled so downstream
+    charts keep working).
+    """
     if not _credentials:
         logger.error("No credentials provided.")
         return pd.DataFrame()
@@ -305,92 +722,34 @@ def get_daily_metrics(_credentials, location_id, start_date, end_date):
     try:
         # Extract just the locations/{locationId} part for the performance API
         location_path = extract_location_path(location_id)
+        location_key = _location_key(location_id)
+        start_date, end_date = _as_date(start_date), _as_date(end_date)
+        if unsettled_days is None:
+            unsettled_days = get_metrics_unsettled_days()
+        unsettled_from = date.today() - timedelta(days=unsettled_days)
+
+        failed_metrics = {}
+        missing_ranges = _missing_date_ranges(
+            _credentials, location_key, start_date, end_date, DAILY_METRICS, unsettled_from
+        )
+        if missing_ranges:
+            service = get_performance_service(_credentials)
+        for range_start, range_end in _split_date_ranges(missing_ranges):
+            failed_metrics.update(
+                _fetch_metrics_chunk(_credentials, service, location_path, location_key, range_start, range_end)
+            )
 
-        # Use static_discovery=False to ensure we get the latest API definition
-        service = build('businessprofileperformance', 'v1', credentials=_credentials, static_discovery=False)
-        
-        # List of metrics to fetch
-        metrics_to_fetch = [
-            "BUSINESS_IMPRESSIONS_DESKTOP_MAPS",
-            "BUSINESS_IMPRESSIONS_DESKTOP_SEARCH",
-            "BUSINESS_IMPRESSIONS_MOBILE_MAPS",
-            "BUSINESS_IMPRESSIONS_MOBILE_SEARCH",
-            "WEBSITE_CLICKS",
-            "CALL_CLICKS",
-            "BUSINESS_DIRECTION_REQUESTS",
-            "BUSINESS_CONVERSATIONS",
-            "BUSINESS_BOOKINGS",
-            "BUSINESS_FOOD_ORDERS"
-        ]
-        
-        # Dictionary to store aggregated data: date -> {metric: value}
-        data = {}
-        
-        for metric in metrics_to_fetch:
-            try:
-                # Flatten dailyRange for GET request
-                request = service.locations().getDailyMetricsTimeSeries(
-                    name=location_path,
-                    dailyMetric=metric,
-                    dailyRange_startDate_year=start_date.year,
-                    dailyRange_startDate_month=start_date.month,
-                    dailyRange_startDate_day=start_date.day,
-                    dailyRange_endDate_year=end_date.year,
-                    dailyRange_endDate_month=end_date.month,
-                    dailyRange_endDate_day=end_date.day
-                )
-                response = request.execute()
-                
-                time_series = response.get('timeSeries')
-                
-                if time_series and isinstance(time_series, dict):
-                    # It's a single object, not a list
-                    dated_values = time_series.get('datedValues', [])
-                    
-                    for val in dated_values:
-                        date_str = f"{val['date']['year']}-{val['date']['month']}-{val['date']['day']}"
-                        date = pd.to_datetime(date_str)
-                        value = int(val.get('value', 0))
-                        
-                        if date not in data:
-                            data[date] = {'date': date}
-                        
-                        # Store metric directly
-                        data[date][metric] = value
-
-                elif time_series and isinstance(time_series, list):
-                     # Fallback if it is a list
-                     for series in time_series:
-                        dated_values = series.get('datedValues', [])
-                        for val in dated_values:
-                            date_str = f"{val['date']['year']}-{val['date']['month']}-{val['date']['day']}"
-                            date = pd.to_datetime(date_str)
-                            value = int(val.get('value', 0))
-                            
-                            if date not in data:
-                                data[date] = {'date': date}
-                            
-                            data[date][metric] = value
-                            
-            except Exception as loop_e:
-                # Log warning but continue with other metrics
-                # logger.warning(f"Could not fetch data for {metric}: {loop_e}")
-                pass
-
-        # Convert to list and then DataFrame
-        final_data = list(data.values())
-        if not final_data:
-             logger.info("No metrics data found for this period.")
-             return pd.DataFrame()
-             
-        df = pd.DataFrame(final_data).sort_values('date')
-        
-        # Fill missing columns with 0
-        for metric in metrics_to_fetch:
-            if metric not in df.columns:
-                df[metric] = 0
-        
-        return df.fillna(0)
+        if failed_metrics:
+            logger.warning(
+                f"Metrics unavailable for {location_path}: {', '.join(sorted(failed_metrics))}"
+            )
+
+        df = _load_daily_metrics_frame(_credentials, location_key, start_date, end_date, DAILY_METRICS)
+        if df.empty:
+            logger.info("No metrics data found for this period.")
+
+        df.attrs["failed_metrics"] = sorted(failed_metrics)
+        return df
 
     except Exception as e:
         logger.error(f"Error fetching daily metrics: {e}")
@@ -398,74 +757,305 @@ def get_daily_metrics(_credentials, location_id, start_date, end_date):
         logger.debug(traceback.format_exc())
         return pd.DataFrame()
 
-def get_search_keywords(_credentials, location_id, start_date, end_date):
-    """Fetches search keywords from API."""
+def backfill_daily_metrics(
+    _credentials,
+    location_id,
+    start_date=None,
+    end_date=None,
+    max_workers=None,
+    chunk_days=METRICS_CHUNK_DAYS,
+    on_chunk=None,
+):
+    """Fills the local store with a long history of daily metrics, fetching chunks in parallel.
+
+    The range (by default the last GMB_BACKFILL_MONTHS months up to today) is split
+    into chunks of at most `chunk_days` days, fetched by up to `max_workers`
+    (GMB_BACKFILL_WORKERS) threads. Each chunk is stored as soon as it arrives, keyed
+    by day and metric, so overlapping fetches never duplicate a day. Days already
+    stored are skipped, so running it again after an interruption (or a failed
+    chunk) only fetches what is still missing. Like everything in the metrics store,
+    the history is scoped to these credentials and never served to another identity.
+
+    Args:
+        _credentials: Google API credentials
+        location_id: Location ID in any format accepted by extract_location_path
+        on_chunk: Optional callback(range_start, range_end, failed_metrics) invoked
+            from the calling thread as each chunk completes
+
+    Returns:
+        {"chunks": number of chunks fetched, "failed": {"start/end": error}} where
+        failed chunks (or metrics of a chunk) are left for the next run
+    """
+    end_date = _as_date(end_date or date.today())
+    start_date = _as_date(start_date or (pd.Timestamp(end_date) - pd.DateOffset(months=get_backfill_months())))
+    location_path = extract_location_path(location_id)
+    location_key = _location_key(location_id)
+    unsettled_from = date.today() - timedelta(days=get_metrics_unsettled_days())
+    chunks = _split_date_ranges(
+        _missing_date_ranges(_credentials, location_key, start_date, end_date, DAILY_METRICS, unsettled_from),
+        chunk_days,
+    )
+    summary = {"chunks": len(chunks), "failed": {}}
+    if not chunks:
+        return summary
+
+    service = get_performance_service(_credentials)
+    max_workers = min(max_workers or get_backfill_workers(), len(chunks))
+    with tracing.span("metrics.backfill", location=location_key, chunks=len(chunks)):
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gbp-backfill") as executor:
+            futures = {
+                # Each chunk runs in a copy of this context so its spans nest under metrics.backfill
+                executor.submit(
+                    contextvars.copy_context().run,
+                    _fetch_metrics_chunk,
+                    _credentials,
+                    service,
+                    location_path,
+                    location_key,
+                    range_start,
+                    range_end,
+                ): (range_start, range_end)
+                for range_start, range_end in chunks
+            }
+            for future in as_completed(futures):
+                range_start, range_end = futures[future]
+                try:
+                    failed_metrics = future.result()
+                except Exception as e:
+                    failed_metrics = {metric: str(e) for metric in DAILY_METRICS}
+                if failed_metrics:
+                    summary["failed"][f"{range_start}/{range_end}"] = "; ".join(
+                        f"{metric}: {error}" for metric, error in sorted(failed_metrics.items())
+                    )
+                if on_chunk:
+                    on_chunk(range_start, range_end, failed_metrics)
+
+    if summary["failed"]:
+        logger.warning(f"Backfill of {location_path} left {len(summary['failed'])} chunk(s) for the next run")
+    # Cached frames of this location predate the backfilled days
+    get_daily_metrics.invalidate(_credentials, location_id)
+    return summary
+
+def _months_in_range(start_date, end_date):
+    """Returns 'YYYY-MM' labels for every month touched by the date range."""
+    months = []
+    year, month = start_date.year, start_date.month
+    while (year, month) <= (end_date.year, end_date.month):
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+def _is_closed_month(month_label, today=None):
+    """A month is closed once it ended more than the unsettled window ago."""
+    today = today or date.today()
+    year, month = (int(part) for part in month_label.split('-'))
+    next_month = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return next_month + timedelta(days=get_metrics_unsettled_days()) <= today
+
+def _fetch_month_keywords(service, location_path, month_label):
+    """Pages through the search keyword impressions of a single month.
+
+    Returns:
+        List of (keyword, value, threshold) tuples; value is None when Google only
+        reports that the count is below `threshold`.
+    """
+    year, month = (int(part) for part in month_label.split('-'))
+    rows = []
+    pages = PageIterator(
+        lambda token: service.locations().searchkeywords().impressions().monthly().list(
+            parent=location_path,
+            monthlyRange_startMonth_year=year,
+            monthlyRange_startMonth_month=month,
+            monthlyRange_endMonth_year=year,
+            monthlyRange_endMonth_month=month,
+            pageSize=100,
+            pageToken=token
+        ),
+        'searchKeywordsCounts',
+    )
+
+    for item in pages:
+        insights_value = item.get('insightsValue', {})
+        count = insights_value.get('value')
+        threshold = insights_value.get('threshold')
+        if count or threshold:
+            rows.append((
+                item.get('searchKeyword'),
+                int(count) if count else None,
+                int(threshold) if threshold else None,
+            ))
+
+    return rows
+
+def get_monthly_search_keywords(_credentials, location_id, start_date, end_date):
+    """Fetches search keyword impressions per month, from the local store when possible.
+
+    Closed months are immutable, so they are fetched once per credentials identity and
+    served from the store; only months still open (or never fetched) hit the API.
+
+    Returns:
+        DataFrame with columns month ('YYYY-MM'), keyword, value, threshold
+    """
+    columns = ['month', 'keyword', 'value', 'threshold']
     if not _credentials:
-        return pd.DataFrame()
+        return pd.DataFrame(columns=columns)
 
-    try:
-        # Extract just the locations/{locationId} part for the performance API
-        location_path = extract_location_path(location_id)
+    location_path = extract_location_path(location_id)
+    location_key = _location_key(location_id)
+    months = _months_in_range(_as_date(start_date), _as_date(end_date))
 
-        service = build('businessprofileperformance', 'v1', credentials=_credentials, static_discovery=False)
+    stored_months = keyword_store.fetched_months(_credentials, location_key, months)
+    months_to_fetch = [
+        month for month in months
+        if month not in stored_months or not _is_closed_month(month)
+    ]
 
-        all_keywords = []
-        next_page_token = None
+    if months_to_fetch:
+        service = get_performance_service(_credentials)
+    for month in months_to_fetch:
+        try:
+            keyword_store.save_month(_credentials, location_key, month, _fetch_month_keywords(service, location_path, month))
+        except Exception as e:
+            logger.warning(f"Could not fetch keywords for {month}: {e}")
 
-        while True:
-            request = service.locations().searchkeywords().impressions().monthly().list(
-                parent=location_path,
-                monthlyRange_startMonth_year=start_date.year,
-                monthlyRange_startMonth_month=start_date.month,
-                monthlyRange_endMonth_year=end_date.year,
-                monthlyRange_endMonth_month=end_date.month,
-                pageSize=100,
-                pageToken=next_page_token
-            )
-            response = request.execute()
-            
-            keywords_counts = response.get('searchKeywordsCounts', [])
-            all_keywords.extend(keywords_counts)
-            
-            next_page_token = response.get('nextPageToken')
-            if not next_page_token:
-                break
-        
-        data = []
-        for item in all_keywords:
-            keyword = item.get('searchKeyword')
-            insights_value = item.get('insightsValue', {})
-            
-            count = insights_value.get('value')
-            threshold = insights_value.get('threshold')
-            
-            if count:
-                data.append({
-                    "keyword": keyword,
-                    "count": int(count),
-                    "display_count": str(count)
-                })
-            elif threshold:
-                data.append({
-                    "keyword": keyword,
-                    "count": int(threshold), # Use threshold for sorting
-                    "display_count": f"< {threshold}"
-                })
-            
-        if not data:
+    rows = keyword_store.load_months(_credentials, location_key, months)
+    return pd.DataFrame(rows, columns=columns)
+
+@_cached("keywords")
+def get_search_keywords(_credentials, location_id, start_date, end_date):
+    """Fetches search keywords for the months of the date range, summed across months.
+
+    Keywords whose count Google hid in any month (reported only as "below threshold")
+    get an upper-bound count and a display like "< 45".
+    """
+    if not _credentials:
+        return pd.DataFrame()
+
+    try:
+        monthly_df = get_monthly_search_keywords(_credentials, location_id, start_date, end_date)
+        if monthly_df.empty:
             logger.info("No search keywords found for this period.")
             return pd.DataFrame(columns=['keyword', 'count', 'display_count'])
-            
-        return pd.DataFrame(data).sort_values("count", ascending=False)
+
+        # Thresholds are used for sorting when the exact count is hidden
+        monthly_df['count'] = monthly_df['value'].fillna(monthly_df['threshold']).astype('int64')
+        monthly_df['is_estimate'] = monthly_df['value'].isna()
+        df = monthly_df.groupby('keyword', as_index=False).agg(
+            count=('count', 'sum'),
+            is_estimate=('is_estimate', 'any'),
+        )
+        df['display_count'] = np.where(
+            df['is_estimate'],
+            '< ' + df['count'].astype(str),
+            df['count'].astype(str),
+        )
+        return df[['keyword', 'count', 'display_count']].sort_values("count", ascending=False)
 
     except Exception as e:
         logger.error(f"Error fetching keywords: {e}")
-        # import traceback
-        # logger.debug(traceback.format_exc())
+        logger.debug("Keyword fetch failure", exc_info=True)
         return pd.DataFrame()
 
+def _is_access_denied(error):
+    """True when an error means these credentials may not read the resource (401/403/404).
+
+    Stored copies must not be served after such an error: access may have been revoked.
+    """
+    return isinstance(error, AuthError) or getattr(error, 'status_code', None) in (401, 403, 404)
+
+def _is_newer(timestamp, other):
+    """True when RFC 3339 `timestamp` is strictly after `other`; anything beats None."""
+    if not timestamp:
+        return False
+    if not other:
+        return True
+    return pd.Timestamp(timestamp) > pd.Timestamp(other)
+
+def _needs_full_review_sync(_credentials, location_key, state):
+    """A full reconcile is due on the first sync, every GMB_REVIEWS_FULL_SYNC_HOURS, and
+    whenever more reviews are stored than Google's `totalReviewCount` (some were deleted).
+    """
+    if not state or not state.get('full_synced_at'):
+        return True
+    if time.time() - state['full_synced_at'] >= get_reviews_full_sync_hours() * 3600:
+        return True
+    total = state.get('total_review_count')
+    return total is not None and review_store.count_reviews(_credentials, location_key) > total
+
+def sync_reviews(_credentials, location_id, account_name=None, full=False):
+    """Syncs a location's reviews into the local review store.
+
+    Reviews are paged newest-update first. Unless the sync is full, paging stops at
+    the first review not updated after the previous sync's newest `updateTime`, so
+    repeat syncs usually cost one or two pages. A full sync pages everything and
+    drops stored reviews that no longer exist on Google; it runs when `full` is set
+    or when `_needs_full_review_sync` says a reconcile is due.
+
+    Returns:
+        Number of reviews fetched from the API
+    """
+    location_key = _location_key(location_id)
+    state = review_store.get_sync_state(_credentials, location_key)
+    full = full or _needs_full_review_sync(_credentials, location_key, state)
+    watermark = None if full or not state else state['last_update_time']
+
+    service = get_mybusiness_service(_credentials)
+    parent = resolve_location_parent(_credentials, location_id, account_name)
+
+    sync_started_at = time.time()
+    newest_update_time = watermark
+    fetched_count = 0
+    pages = PageIterator(
+        lambda token: service.accounts().locations().reviews().list(
+            parent=parent,
+            pageSize=REVIEWS_PAGE_SIZE,
+            orderBy='updateTime desc',
+            pageToken=token
+        ),
+        'reviews',
+    )
+
+    for reviews in pages.pages():
+        page_reviews = []
+        reached_watermark = False
+        for review in reviews:
+            update_time = review.get('updateTime')
+            if watermark and update_time and not _is_newer(update_time, watermark):
+                reached_watermark = True
+                break
+            page_reviews.append(review)
+            if _is_newer(update_time, newest_update_time):
+                newest_update_time = update_time
+
+        # Saved page by page so an interrupted sync keeps its progress; the watermark
+        # only moves once the sync completes.
+        review_store.save_reviews(_credentials, location_key, page_reviews)
+        fetched_count += len(page_reviews)
+        if reached_watermark:
+            break
+
+    if full:
+        review_store.delete_reviews_synced_before(_credentials, location_key, sync_started_at)
+
+    reviews_result = pages.response or {}
+    review_store.save_sync_state(
+        _credentials,
+        location_key,
+        newest_update_time,
+        total_review_count=reviews_result.get('totalReviewCount'),
+        average_rating=reviews_result.get('averageRating'),
+        full_synced_at=sync_started_at if full else None,
+    )
+    return fetched_count
+
+@_cached("reviews")
 def get_reviews(_credentials, location_id, account_name=None):
-    """Fetches reviews for the specified location.
+    """Fetches all reviews for the specified location.
+
+    Syncs new and updated reviews into the local review store, then returns the
+    full stored history (most recently updated first). If the sync fails, the
+    reviews previously stored for these credentials are returned, unless Google
+    denied access to the location.
 
     Args:
         _credentials: Google API credentials
@@ -476,23 +1066,292 @@ def get_reviews(_credentials, location_id, account_name=None):
         return []
 
     try:
-        service = get_mybusiness_service(_credentials)
-        parent = resolve_location_parent(_credentials, location_id, account_name)
-
-        reviews_result = service.accounts().locations().reviews().list(
-            parent=parent,
-            pageSize=50
-        ).execute()
-
-        return reviews_result.get('reviews', [])
+        _with_current_parent(
+            _credentials, location_id, account_name, lambda: sync_reviews(_credentials, location_id, account_name)
+        )
     except Exception as e:
-        logger.warning(f"Could not fetch reviews: {e}")
+        logger.warning(f"Could not sync reviews: {e}")
         import traceback
         logger.debug(traceback.format_exc())
+        if _is_access_denied(e):
+            return []
+
+    try:
+        return review_store.load_reviews(_credentials, _location_key(location_id))
+    except Exception as e:
+        logger.warning(f"Could not load stored reviews: {e}")
         return []
 
+def _reviews_by_account(_credentials, location_ids):
+    """Groups locations by account as {account_name: [accounts/{a}/locations/{l}, ...]}."""
+    by_account = {}
+    for location_id in location_ids:
+        try:
+            parent = resolve_location_parent(_credentials, location_id)
+        except ValueError as e:
+            logger.warning(f"Skipping reviews of {location_id}: {e}")
+            continue
+        account_name = '/'.join(parent.split('/')[:2])
+        locations = by_account.setdefault(account_name, [])
+        if parent not in locations:
+            locations.append(parent)
+    return by_account
+
+def _review_watermark(state):
+    """The updateTime a location's reviews must beat to be new, or None if never synced.
+
+    A location synced with no reviews at all has nothing new from before that sync.
+    """
+    if not state:
+        return None
+    if state['last_update_time']:
+        return state['last_update_time']
+    return pd.Timestamp(state['synced_at'], unit='s', tz='UTC').strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+def _sync_review_batch(_credentials, service, account_name, location_names):
+    """Pages one batchGetReviews request, stopping once every location reached its watermark.
+
+    Reviews arrive newest-update first across all the locations, so a location is
+    done at its first review not newer than its previous sync, and every location
+    is done once a review is not newer than the oldest watermark still pending.
+    Only locations never synced before need their full history paged.
+    """
+    keys = {name: _location_key(name) for name in location_names}
+    states = {name: review_store.get_sync_state(_credentials, key) for name, key in keys.items()}
+    watermarks = {name: _review_watermark(state) for name, state in states.items()}
+    newest = {name: state['last_update_time'] if state else None for name, state in states.items()}
+    fetched = dict.fromkeys(location_names, 0)
+    done = set()
+    sync_started_at = time.time()
+
+    def request_for(page_token):
+        body = {
+            'locationNames': location_names,
+            'pageSize': REVIEWS_PAGE_SIZE,
+            'orderBy': 'updateTime desc',
+            'ignoreRatingOnlyReviews': False,
+        }
+        if page_token:
+            body['pageToken'] = page_token
+        return service.accounts().locations().batchGetReviews(name=account_name, body=body)
+
+    def reached_every_watermark(update_time):
+        pending = [watermarks[name] for name in location_names if name not in done]
+        if not update_time or not all(pending):
+            return False
+        return not _is_newer(update_time, min(pending, key=pd.Timestamp))
+
+    for location_reviews in PageIterator(request_for, 'locationReviews').pages():
+        page_reviews = {}
+        for location_review in location_reviews:
+            name, review = location_review.get('name'), location_review.get('review') or {}
+            update_time = review.get('updateTime')
+            if reached_every_watermark(update_time):
+                done.update(location_names)
+                break
+            if name not in keys or name in done:
+                continue
+            if watermarks[name] and update_time and not _is_newer(update_time, watermarks[name]):
+                done.add(name)
+                continue
+            page_reviews.setdefault(name, []).append(review)
+            if _is_newer(update_time, newest[name]):
+                newest[name] = update_time
+
+        # Saved page by page like sync_reviews; watermarks only move once the batch completes
+        for name, reviews in page_reviews.items():
+            review_store.save_reviews(_credentials, keys[name], reviews)
+            fetched[name] += len(reviews)
+        if len(done) == len(location_names):
+            break
+
+    for name, key in keys.items():
+        state = states[name] or {}
+        review_store.save_sync_state(
+            _credentials,
+            key,
+            newest[name],
+            total_review_count=state.get('total_review_count'),
+            average_rating=state.get('average_rating'),
+            # Never-synced locations had their whole history paged, with nothing stored to reconcile
+            full_synced_at=sync_started_at if not states[name] else None,
+        )
+    return fetched
+
+def _review_reconcile_due(_credentials, location_name):
+    """True for a previously synced location whose full reconcile is due."""
+    location_key = _location_key(location_name)
+    state = review_store.get_sync_state(_credentials, location_key)
+    return state is not None and _needs_full_review_sync(_credentials, location_key, state)
+
+def _sync_reviews_batch(_credentials, location_ids):
+    """Runs sync_reviews_batch, also returning the location keys Google denied access to."""
+    service = get_mybusiness_service(_credentials)
+    fetched = {}
+    denied = set()
+    for account_name, location_names in _reviews_by_account(_credentials, location_ids).items():
+        # Locations due a full reconcile page their own history; the rest sync in bulk
+        reconcile = [name for name in location_names if _review_reconcile_due(_credentials, name)]
+        location_names = [name for name in location_names if name not in reconcile]
+        for location_name in reconcile:
+            try:
+                fetched[location_name] = sync_reviews(_credentials, location_name, account_name, full=True)
+            except Exception as e:
+                logger.warning(f"Could not sync reviews of {location_name}: {e}")
+                if _is_access_denied(e):
+                    denied.add(_location_key(location_name))
+        for start in range(0, len(location_names), REVIEWS_BATCH_LOCATIONS):
+            batch = location_names[start:start + REVIEWS_BATCH_LOCATIONS]
+            try:
+                fetched.update(_sync_review_batch(_credentials, service, account_name, batch))
+            except Exception as e:
+                logger.warning(f"Batched review sync failed for {account_name}, syncing one by one: {e}")
+                for location_name in batch:
+                    try:
+                        fetched[location_name] = sync_reviews(_credentials, location_name, account_name)
+                    except Exception as e:
+                        logger.warning(f"Could not sync reviews of {location_name}: {e}")
+                        if _is_access_denied(e):
+                            denied.add(_location_key(location_name))
+
+    # Cached get_reviews results predate what was just synced
+    for location_name, count in fetched.items():
+        if count:
+            get_reviews.invalidate(_credentials, location_name)
+    return fetched, denied
+
+def sync_reviews_batch(_credentials, location_ids):
+    """Syncs the reviews of many locations with batchGetReviews, in bulk per account.
+
+    Locations are grouped by account and sent REVIEWS_BATCH_LOCATIONS at a time,
+    so a repeat sync of a 200-location account costs a handful of requests instead
+    of one per location. A batch that fails falls back to per-location syncs.
+
+    Returns:
+        {location name: number of reviews fetched}
+    """
+    if not _credentials:
+        return {}
+    return _sync_reviews_batch(_credentials, location_ids)[0]
+
+def get_reviews_batch(_credentials, location_ids):
+    """Fetches the reviews of many locations, syncing them in bulk first.
+
+    Returns:
+        {location_id: reviews} keyed like `location_ids`, each list as `get_reviews` returns it
+    """
+    if not _credentials:
+        return {}
+
+    denied = set()
+    try:
+        _, denied = _sync_reviews_batch(_credentials, location_ids)
+    except Exception as e:
+        logger.warning(f"Could not sync reviews: {e}")
+        logger.debug("Batched review sync failure", exc_info=True)
+        if _is_access_denied(e):
+            denied = {_location_key(location_id) for location_id in location_ids}
+
+    reviews = {}
+    for location_id in location_ids:
+        if _location_key(location_id) in denied:
+            reviews[location_id] = []
+            continue
+        try:
+            reviews[location_id] = review_store.load_reviews(_credentials, _location_key(location_id))
+        except Exception as e:
+            logger.warning(f"Could not load stored reviews of {location_id}: {e}")
+            reviews[location_id] = []
+    return reviews
+
+def _posts_needing_insights(posts, stored_insights, refresh_days, now=None):
+    """Posts with no stored insights, or young enough that their numbers still move."""
+    now = now or pd.Timestamp.now(tz='UTC')
+    cutoff = now - pd.Timedelta(days=refresh_days)
+    stale = []
+    for post in posts:
+        create_time = post.get('createTime')
+        if post['name'] not in stored_insights or not create_time or pd.Timestamp(create_time) >= cutoff:
+            stale.append(post)
+    return stale
+
+def _fetch_post_insights(service, parent, posts):
+    """Fetches POST_INSIGHT_METRICS totals of posts, POST_INSIGHTS_BATCH_POSTS per request.
+
+    Returns:
+        {post name: {metric: value}}
+    """
+    end_time = pd.Timestamp.now(tz='UTC')
+    insights = {}
+    for start in range(0, len(posts), POST_INSIGHTS_BATCH_POSTS):
+        batch = posts[start:start + POST_INSIGHTS_BATCH_POSTS]
+        # The range has to cover the oldest post of the batch for its totals to be complete
+        create_times = [pd.Timestamp(post['createTime']) for post in batch if post.get('createTime')]
+        start_time = min(create_times) if create_times else end_time - pd.Timedelta(days=get_post_insights_refresh_days())
+        body = {
+            'localPostNames': [post['name'] for post in batch],
+            'basicRequest': {
+                'metricRequests': [{'metric': metric} for metric in POST_INSIGHT_METRICS],
+                'timeRange': {
+                    'startTime': start_time.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                    'endTime': end_time.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                },
+            },
+        }
+        response = service.accounts().locations().localPosts().reportInsights(name=parent, body=body).execute()
+        for post_metrics in response.get('localPostMetrics', []):
+            insights[post_metrics.get('localPostName')] = {
+                metric_value.get('metric'): int((metric_value.get('totalValue') or {}).get('value') or 0)
+                for metric_value in post_metrics.get('metricValues', [])
+            }
+    return insights
+
+def sync_posts(_credentials, location_id, account_name=None):
+    """Syncs a location's local posts and their insights into the local post store.
+
+    Every page of posts is listed (posts have no update order to stop at), and
+    posts no longer on Google are dropped. Insights are fetched in bulk with
+    localPosts.reportInsights, only for posts without stored insights and posts
+    younger than GMB_POST_INSIGHTS_REFRESH_DAYS, whose numbers still move.
+
+    Returns:
+        Number of posts whose insights were fetched
+    """
+    location_key = _location_key(location_id)
+    service = get_mybusiness_service(_credentials)
+    parent = resolve_location_parent(_credentials, location_id, account_name)
+
+    sync_started_at = time.time()
+    posts = []
+    pages = PageIterator(
+        lambda token: service.accounts().locations().localPosts().list(
+            parent=parent,
+            pageSize=POSTS_PAGE_SIZE,
+            pageToken=token
+        ),
+        'localPosts',
+    )
+    for page_posts in pages.pages():
+        page_posts = [post for post in page_posts if post.get('name')]
+        post_store.save_posts(_credentials, location_key, page_posts)
+        posts.extend(page_posts)
+    post_store.delete_posts_synced_before(_credentials, location_key, sync_started_at)
+
+    stale = _posts_needing_insights(
+        posts, post_store.load_insights(_credentials, location_key), get_post_insights_refresh_days()
+    )
+    if stale:
+        post_store.save_insights(_credentials, location_key, _fetch_post_insights(service, parent, stale))
+    return len(stale)
+
+@_cached("posts")
 def get_posts(_credentials, location_id, account_name=None):
-    """Fetches local posts for the specified location.
+    """Fetches every local post of the specified location, with its insights.
+
+    Syncs posts and insights into the local post store, then returns the stored
+    posts newest first. Each post carries an "insights" dict of POST_INSIGHT_METRICS
+    totals (empty until fetched). If the sync fails, the posts previously stored
+    for these credentials are returned, unless Google denied access to the location.
 
     Args:
         _credentials: Google API credentials
@@ -503,20 +1362,26 @@ def get_posts(_credentials, location_id, account_name=None):
         return []
 
     try:
-        service = get_mybusiness_service(_credentials)
-        parent = resolve_location_parent(_credentials, location_id, account_name)
-
-        posts_result = service.accounts().locations().localPosts().list(
-            parent=parent,
-            pageSize=20
-        ).execute()
-
-        return posts_result.get('localPosts', [])
+        _with_current_parent(
+            _credentials, location_id, account_name, lambda: sync_posts(_credentials, location_id, account_name)
+        )
     except Exception as e:
-        logger.warning(f"Could not fetch posts: {e}")
+        logger.warning(f"Could not sync posts: {e}")
         import traceback
         logger.debug(traceback.format_exc())
+        if _is_access_denied(e):
+            return []
+
+    try:
+        location_key = _location_key(location_id)
+        insights = post_store.load_insights(_credentials, location_key)
+        posts = post_store.load_posts(_credentials, location_key)
+    except Exception as e:
+        logger.warning(f"Could not load stored posts: {e}")
         return []
+    for post in posts:
+        post['insights'] = insights.get(post['name'], {}).get('metrics', {})
+    return posts
 
 
 def create_local_post(_credentials, location_id, account_name=None, payload=None):
@@ -527,16 +1392,25 @@ def create_local_post(_credentials, location_id, account_name=None, payload=None
         raise ValueError("A valid post payload is required.")
 
     service = get_mybusiness_service(_credentials)
-    parent = resolve_location_parent(_credentials, location_id, account_name)
-    return service.accounts().locations().localPosts().create(
-        parent=parent,
-        body=payload,
-    ).execute()
+    created = _with_current_parent(
+        _credentials,
+        location_id,
+        account_name,
+        lambda: service.accounts().locations().localPosts().create(
+            parent=resolve_location_parent(_credentials, location_id, account_name),
+            body=payload,
+        ).execute(),
+    )
+    invalidate_posts_cache(_credentials, location_id)
+    return created
 
 
-def invalidate_posts_cache():
-    """Clears cached local posts so the UI can reload fresh data after publish."""
-    get_posts.clear()
+def invalidate_posts_cache(_credentials=None, location_id=None):
+    """Clears cached local posts so the UI can reload fresh data after publish.
+
+    With a location, only that location's posts are dropped; otherwise all of them.
+    """
+    get_posts.invalidate(credentials=_credentials, location_id=location_id)
 
 
 def upload_media_from_file(
@@ -558,9 +1432,6 @@ def upload_media_from_file(
             "Unsupported image format for GBP bytes upload. Use JPG or PNG."
         )
 
-    if _credentials.expired and _credentials.refresh_token:
-        _credentials.refresh(Request())
-
     service = get_mybusiness_service(_credentials)
     parent = resolve_location_parent(_credentials, location_id, account_name)
 
@@ -572,42 +1443,48 @@ def upload_media_from_file(
     if not resource_name:
         raise ValueError("Could not get upload resource name from Google API.")
 
+    root_url = get_api_root_url("mybusiness")
     upload_urls = [
-        f"https://mybusiness.googleapis.com/upload/v4/{quote(resource_name, safe='/')}?uploadType=media",
-        f"https://mybusiness.googleapis.com/upload/v4/{quote(resource_name, safe='')}?uploadType=media",
-        f"https://mybusiness.googleapis.com/upload/v1/media/{quote(resource_name, safe='/')}?uploadType=media",
-        f"https://mybusiness.googleapis.com/upload/v1/media/{quote(resource_name, safe='')}?uploadType=media",
-        f"https://mybusiness.googleapis.com/upload/v1/media/{quote(resource_name, safe='/')}?upload_type=media",
+        f"{root_url}upload/v4/{quote(resource_name, safe='/')}?uploadType=media",
+        f"{root_url}upload/v4/{quote(resource_name, safe='')}?uploadType=media",
+        f"{root_url}upload/v1/media/{quote(resource_name, safe='/')}?uploadType=media",
+        f"{root_url}upload/v1/media/{quote(resource_name, safe='')}?uploadType=media",
+        f"{root_url}upload/v1/media/{quote(resource_name, safe='/')}?upload_type=media",
     ]
     upload_errors = []
     upload_ok = False
 
+    session = get_session(_credentials)
     for upload_url in upload_urls:
-        req = UrlRequest(
-            upload_url,
-            data=file_bytes,
-            method="POST",
-            headers={
-                "Authorization": f"Bearer {_credentials.token}",
-                "Content-Type": mime_type or "application/octet-stream",
-                "Content-Length": str(len(file_bytes)),
-                "X-Goog-Upload-Protocol": "raw",
-                "X-Goog-Upload-File-Name": "post-image",
-            },
-        )
-        try:
-            with urlopen(req):
-                upload_ok = True
-                break
-        except HTTPError as http_error:
-            details = ""
-            try:
-                details = http_error.read().decode("utf-8", errors="ignore")
-            except Exception:
-                details = str(http_error)
-            upload_errors.append(
-                f"upload failed ({http_error.code}) on {upload_url}: {details[:280]}"
+        # Raw uploads bypass googleapiclient, so draw from the mybusiness quota here
+        get_bucket("mybusiness").acquire()
+        with tracing.span(
+            "mybusiness.media.upload",
+            kind="api_call",
+            service="mybusiness",
+            method="mybusiness.media.upload",
+            http_method="POST",
+            location=_location_key(location_id),
+        ) as call:
+            response = session.post(
+                upload_url,
+                data=file_bytes,
+                headers={
+                    "Content-Type": mime_type or "application/octet-stream",
+                    "X-Goog-Upload-Protocol": "raw",
+                    "X-Goog-Upload-File-Name": "post-image",
+                },
+                timeout=deadline.call_timeout_s(get_http_timeout_s(), what="media upload"),
             )
+            call.set(status_code=response.status_code, bytes_sent=len(file_bytes), bytes_received=len(response.content))
+            if not response.ok:
+                call.outcome = "http_error"
+        if response.ok:
+            upload_ok = True
+            break
+        upload_errors.append(
+            f"upload failed ({response.status_code}) on {upload_url}: {response.text[:280]}"
+        )
 
     if not upload_ok:
         joined_errors = " | ".join(upload_errors) if upload_errors else "unknown upload error"
@@ -632,15 +1509,14 @@ def upload_media_from_file(
                 },
             ).execute()
             break
-        except HttpError as http_error:
-            status_code = getattr(http_error, "status_code", None) or getattr(
-                getattr(http_error, "resp", None), "status", None
-            )
+        except AppError as create_error:
+            status_code = create_error.status_code
+            http_error = create_error.__cause__
             details = ""
             try:
                 details = http_error.content.decode("utf-8", errors="ignore")
             except Exception:
-                details = str(http_error)
+                details = str(create_error)
             create_errors.append(
                 f"media.create failed ({status_code}) category={category}: {details[:280]}"
             )
@@ -654,6 +1530,8 @@ def upload_media_from_file(
             + (" | ".join(create_errors) if create_errors else "No details from API.")
         )
 
+    get_media.invalidate(credentials=_credentials, location_id=location_id)
+
     # Google can take a short time to process uploaded bytes into a usable media URL.
     media_name = media_item.get("name")
     if not media_name:
@@ -670,33 +1548,150 @@ def upload_media_from_file(
 
     return media_item
 
+def iter_media(_credentials, location_id, page_token=None, limit=None):
+    """Streams the media items of a location as pages arrive (see PageIterator)."""
+    service_media = get_mybusiness_service(_credentials)
+    parent = resolve_location_parent(_credentials, location_id)
+    return PageIterator(
+        lambda token: service_media.accounts().locations().media().list(
+            parent=parent,
+            pageSize=MEDIA_PAGE_SIZE,
+            pageToken=token
+        ),
+        'mediaItems',
+        page_token=page_token,
+        limit=limit,
+    )
+
+@_cached("media")
 def get_media(_credentials, location_id):
-    """Fetches media items for the specified location."""
+    """Fetches every media item of the specified location."""
     try:
-        service_media = get_mybusiness_service(_credentials)
-        parent = resolve_location_parent(_credentials, location_id)
-        media_result = service_media.accounts().locations().media().list(
-            parent=parent,
-            pageSize=50
-        ).execute()
-        return media_result.get('mediaItems', [])
+        return list(iter_media(_credentials, location_id))
     except Exception as e:
-        # logger.warning(f"Could not fetch media: {e}")
+        logger.warning(f"Could not fetch media: {e}")
         return []
 
-# Note: Q&A API might require 'mybusinessquestions' service
+def _questions_parent(location_id):
+    """Q&A lists questions under locations/{locationId}/questions."""
+    return f"{extract_location_path(location_id)}/questions"
+
+def iter_questions(_credentials, location_id, page_token=None, limit=None):
+    """Streams the questions of a location as pages arrive (see PageIterator)."""
+    service_qa = get_service('mybusinessqanda', 'v1', _credentials)
+    return PageIterator(
+        lambda token: service_qa.locations().questions().list(
+            parent=_questions_parent(location_id),
+            pageSize=QUESTIONS_PAGE_SIZE,
+            pageToken=token
+        ),
+        'questions',
+        page_token=page_token,
+        limit=limit,
+    )
+
+@_cached("questions")
 def get_questions(_credentials, location_id):
-    """Fetches questions for the specified location."""
+    """Fetches every question of the specified location."""
     try:
-        # Extract just the locations/{locationId} part
-        location_path = extract_location_path(location_id)
-
-        service_qa = build('mybusinessquestions', 'v1', credentials=_credentials)
-        questions_result = service_qa.locations().questions().list(
-            parent=location_path,
-            pageSize=20
-        ).execute()
-        return questions_result.get('questions', [])
+        return list(iter_questions(_credentials, location_id))
     except Exception as e:
-        # logger.warning(f"Could not fetch questions: {e}")
+        logger.warning(f"Could not fetch questions: {e}")
         return []
+
+def _execute_batch(service, requests, resource):
+    """Sends {location_id: request} as batch requests, returning {location_id: response}.
+
+    Locations whose call failed map to {}, so one bad location does not hide the rest.
+    """
+    batch = RequestBatch(service)
+    for location_id, request in requests.items():
+        batch.add(request, key=location_id)
+    try:
+        responses = batch.execute()
+    except Exception as e:
+        logger.warning(f"Could not fetch {resource} in batch: {e}")
+        responses = {}
+    return {location_id: responses.get(location_id, {}) for location_id in requests}
+
+def get_location_details_batch(_credentials, location_ids):
+    """Fetches the full profiles of many locations in batch requests, as {location_id: details}."""
+    if not _credentials:
+        return {}
+
+    service_business = get_business_information_service(_credentials)
+    requests = {
+        location_id: service_business.locations().get(
+            name=extract_location_path(location_id),
+            readMask=LOCATION_DETAIL_READ_MASK
+        )
+        for location_id in location_ids
+    }
+    details = _execute_batch(service_business, requests, "location details")
+    for location_id, location in details.items():
+        if location and location_id.startswith('accounts/'):
+            location['name'] = location_id
+    return details
+
+def _batched_pages(service, request_for, items_field, resource):
+    """Reads every page of many locations' lists in batch requests, as {location_id: items}.
+
+    `request_for` maps each location to a function building the request of one page.
+    Each round trip carries the next page of every location not finished yet;
+    a location whose call failed keeps the items read so far.
+    """
+    items = {location_id: [] for location_id in request_for}
+    page_tokens = dict.fromkeys(request_for)
+    while page_tokens:
+        batch = RequestBatch(service)
+        for location_id, page_token in page_tokens.items():
+            batch.add(request_for[location_id](page_token), key=location_id)
+        try:
+            responses = batch.execute()
+        except Exception as e:
+            logger.warning(f"Could not fetch {resource} in batch: {e}")
+            break
+
+        page_tokens = {}
+        for location_id, response in responses.items():
+            items[location_id].extend(response.get(items_field, []))
+            if response.get('nextPageToken'):
+                page_tokens[location_id] = response['nextPageToken']
+    return items
+
+def get_media_batch(_credentials, location_ids):
+    """Fetches every media item of many locations in batch requests, as {location_id: items}."""
+    if not _credentials:
+        return {}
+
+    service_media = get_mybusiness_service(_credentials)
+    request_for = {}
+    for location_id in location_ids:
+        try:
+            parent = resolve_location_parent(_credentials, location_id)
+        except ValueError as e:
+            logger.warning(f"Skipping media of {location_id}: {e}")
+            continue
+        request_for[location_id] = lambda token, parent=parent: service_media.accounts().locations().media().list(
+            parent=parent,
+            pageSize=MEDIA_PAGE_SIZE,
+            pageToken=token
+        )
+    media = _batched_pages(service_media, request_for, 'mediaItems', "media")
+    return {location_id: media.get(location_id, []) for location_id in location_ids}
+
+def get_questions_batch(_credentials, location_ids):
+    """Fetches every question of many locations in batch requests, as {location_id: questions}."""
+    if not _credentials:
+        return {}
+
+    service_qa = get_service('mybusinessqanda', 'v1', _credentials)
+    request_for = {
+        location_id: lambda token, location_id=location_id: service_qa.locations().questions().list(
+            parent=_questions_parent(location_id),
+            pageSize=QUESTIONS_PAGE_SIZE,
+            pageToken=token
+        )
+        for location_id in location_ids
+    }
+    return _batched_pages(service_qa, request_for, 'questions', "questions")
@@ -1,36 +1,53 @@
 import io
-from urllib.request import Request as UrlRequest, urlopen
 
-from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseUpload
 
+from src.gmb_app.core import deadline
+from src.gmb_app.integrations.client_registry import get_service
+from src.gmb_app.integrations.http_transport import get_public_session
+from src.gmb_app.integrations.pagination import PageIterator
+
 
 ALLOWED_IMAGE_MIME_TYPES = {"image/jpeg", "image/jpg", "image/png", "image/webp"}
 MAX_IMAGE_SIZE_BYTES = 10 * 1024 * 1024
+# Maximum page size of files.list
+FOLDERS_PAGE_SIZE = 1000
+# Largest body validate_public_url reads so its keep-alive connection can be reused
+PUBLIC_URL_DRAIN_BYTES = 64 * 1024
 
 
 def get_drive_service(credentials):
     """Builds a Google Drive API service client."""
-    return build("drive", "v3", credentials=credentials)
+    return get_service("drive", "v3", credentials)
 
 
-def list_folders(credentials, parent_id="root"):
-    """Lists subfolders from a given Drive folder id."""
+def iter_folders(credentials, parent_id="root", page_token=None, limit=None):
+    """Streams subfolders of a Drive folder, by name, as pages arrive (see PageIterator)."""
     service = get_drive_service(credentials)
     query = (
         "mimeType = 'application/vnd.google-apps.folder' "
         "and trashed = false "
         f"and '{parent_id}' in parents"
     )
-    response = service.files().list(
-        q=query,
-        fields="files(id,name)",
-        orderBy="name",
-        pageSize=200,
-        supportsAllDrives=True,
-        includeItemsFromAllDrives=True,
-    ).execute()
-    return response.get("files", [])
+    return PageIterator(
+        lambda token: service.files().list(
+            q=query,
+            fields="nextPageToken,files(id,name)",
+            orderBy="name",
+            pageSize=FOLDERS_PAGE_SIZE,
+            pageToken=token,
+            supportsAllDrives=True,
+            includeItemsFromAllDrives=True,
+        ),
+        "files",
+        page_token=page_token,
+        limit=limit,
+    )
+
+
+def list_folders(credentials, parent_id="root"):
+    """Lists every subfolder of a given Drive folder id."""
+    return list(iter_folders(credentials, parent_id))
 
 
 def upload_file_to_folder(credentials, folder_id, file_name, file_bytes, mime_type):
@@ -72,6 +89,13 @@ def build_public_file_url(file_id):
 
 def validate_public_url(url, timeout_s=8):
     """Checks if a URL is publicly accessible."""
-    req = UrlRequest(url, method="GET")
-    with urlopen(req, timeout=timeout_s) as resp:
-        return 200 <= resp.status < 400
+    timeout_s = deadline.call_timeout_s(timeout_s, what="public URL check")
+    with get_public_session().get(url, timeout=timeout_s, stream=True) as resp:
+        # A body read to the end hands the connection back to the pool; a larger one
+        # (e.g. the image itself) is not downloaded, and its connection is dropped on close
+        drained = 0
+        for chunk in resp.iter_content(chunk_size=8192):
+            drained += len(chunk)
+            if drained > PUBLIC_URL_DRAIN_BYTES:
+                break
+        return 200 <= resp.status_code < 400
@@ -0,0 +1,143 @@
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+from src.gmb_app.core import deadline
+from src.gmb_app.core.config import get_cache_max_entries, get_cache_ttl_s
+
+
+class TTLCache:
+    """Thread-safe in-memory LRU cache whose entries also expire after a TTL."""
+
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries or get_cache_max_entries()
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Returns (hit, value)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key, value, ttl_s):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_s, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, predicate=None):
+        """Drops every entry whose key matches `predicate` (all entries when None)."""
+        with self._lock:
+            if predicate is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_cache = TTLCache()
+
+
+def _is_empty(value):
+    if value is None:
+        return True
+    if isinstance(value, pd.DataFrame):
+        return value.empty
+    if isinstance(value, (list, dict, tuple)):
+        return not value
+    return False
+
+
+def _is_partial(value):
+    """True for metric frames listing metrics that failed to load (`attrs["failed_metrics"]`)."""
+    return isinstance(value, pd.DataFrame) and bool(value.attrs.get("failed_metrics"))
+
+
+def cached_read(resource, identity, ttl_s=None, location_key=None, location_arg="location_id"):
+    """Caches a read function by credential identity, location and remaining arguments.
+
+    The wrapped function must take credentials as its first argument. Keys are
+    (resource, identity(credentials), location_key(location), other args), so the
+    same location in different formats shares an entry. Empty results are not
+    cached because the read functions return them on API errors, nor are partial
+    results (frames with failed metrics) or results a deadline may have cut short,
+    so a transient failure is retried on the next read instead of pinned for the TTL.
+
+    Cached values are shared between callers and must not be mutated.
+
+    The wrapper gains `invalidate(credentials=None, location_id=None)` and `clear()`.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        credentials_arg = next(iter(signature.parameters))
+
+        def normalize_location(location):
+            if location is None or location_key is None:
+                return location
+            return location_key(location)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            credentials = arguments.pop(credentials_arg)
+            if not credentials:
+                return func(*args, **kwargs)
+
+            location = normalize_location(arguments.pop(location_arg, None))
+            key = (resource, identity(credentials), location, tuple(sorted(arguments.items())))
+
+            hit, value = _cache.get(key)
+            if hit:
+                return value
+
+            value = func(*args, **kwargs)
+            if not _is_empty(value) and not _is_partial(value) and not deadline.cut_short():
+                _cache.set(key, value, get_cache_ttl_s() if ttl_s is None else ttl_s)
+            return value
+
+        def invalidate(credentials=None, location_id=None):
+            invalidate_resource(resource, identity, credentials, normalize_location(location_id))
+
+        wrapper.invalidate = invalidate
+        wrapper.clear = lambda: invalidate()
+        return wrapper
+
+    return decorator
+
+
+def invalidate_resource(resource=None, identity=None, credentials=None, location=None):
+    """Drops cached reads of one resource (or all), optionally for one identity/location."""
+    credential_key = identity(credentials) if credentials and identity else None
+
+    def matches(key):
+        key_resource, key_identity, key_location, _ = key
+        return (
+            (resource is None or key_resource == resource)
+            and (credential_key is None or key_identity == credential_key)
+            and (location is None or key_location == location)
+        )
+
+    _cache.invalidate(matches)
+
+
+def clear_cache():
+    _cache.invalidate()
@@ -4,6 +4,45 @@ DEFAULT_REDIRECT_URI = "http://localhost:8501"
 DEFAULT_AUTH_URI = "https://accounts.google.com/o/oauth2/auth"
 DEFAULT_TOKEN_URI = "https://oauth2.googleapis.com/token"
 DEFAULT_LOG_LEVEL = "INFO"
+DEFAULT_CACHE_DIR = ".cache/gmb_app"
+DEFAULT_DISCOVERY_CACHE_TTL_S = 24 * 60 * 60
+DEFAULT_CACHE_TTL_S = 5 * 60
+DEFAULT_CACHE_MAX_ENTRIES = 512
+DEFAULT_API_MAX_RETRIES = 4
+# Requests per minute allowed per Google API; GBP APIs default to 300 QPM per project
+DEFAULT_API_QPM = {
+    "mybusiness": 300,
+    "mybusinessaccountmanagement": 300,
+    "mybusinessbusinessinformation": 300,
+    "businessprofileperformance": 300,
+    "mybusinessqanda": 300,
+    "drive": 6000,
+}
+DEFAULT_API_QPM_FALLBACK = 300
+# Fraction of each quota the app allows itself, leaving room for clock skew and other clients
+DEFAULT_QUOTA_HEADROOM = 0.9
+DEFAULT_QUOTA_GOVERNOR = "sqlite"
+# Recent days the Performance API may still revise; always refetched
+DEFAULT_METRICS_UNSETTLED_DAYS = 3
+DEFAULT_HTTP_TIMEOUT_S = 60
+# Keep-alive connections kept open per Google host
+DEFAULT_HTTP_POOL_SIZE = 16
+# Tokens this close to expiry are renewed in the background
+DEFAULT_TOKEN_REFRESH_AHEAD_S = 5 * 60
+DEFAULT_PERSIST_CREDENTIALS = "false"
+# Persisted sign-ins older than this must log in with Google again
+DEFAULT_SESSION_MAX_AGE_S = 7 * 24 * 60 * 60
+# Upper bound on one dashboard load; whatever is not loaded by then is shown as incomplete
+DEFAULT_DASHBOARD_BUDGET_S = 90
+# Locations fetched at once by the portfolio view; the quota governor still paces the calls
+DEFAULT_PORTFOLIO_WORKERS = 4
+# Reviews are fully reconciled (dropping ones deleted on Google) at most this often per location
+DEFAULT_REVIEWS_FULL_SYNC_HOURS = 24
+# Posts younger than this get their insights refreshed; older ones keep their stored insights
+DEFAULT_POST_INSIGHTS_REFRESH_DAYS = 30
+# History fetched by a metrics backfill, and date-range chunks fetched at once per location
+DEFAULT_BACKFILL_MONTHS = 18
+DEFAULT_BACKFILL_WORKERS = 4
 
 
 def get_env(name, default=""):
@@ -36,3 +75,106 @@ def get_gemini_api_key():
 
 def get_log_level():
     return get_env("LOG_LEVEL", DEFAULT_LOG_LEVEL).upper()
+
+
+def get_cache_dir():
+    return get_env("GMB_CACHE_DIR", DEFAULT_CACHE_DIR)
+
+
+def get_store_path():
+    return get_env("GMB_STORE_PATH") or os.path.join(get_cache_dir(), "gmb_store.sqlite3")
+
+
+def get_quota_db_path():
+    return get_env("GMB_QUOTA_DB_PATH") or os.path.join(get_cache_dir(), "quota.sqlite3")
+
+
+def get_discovery_cache_ttl_s():
+    return int(get_env("GMB_DISCOVERY_CACHE_TTL_S", str(DEFAULT_DISCOVERY_CACHE_TTL_S)))
+
+
+def get_metrics_unsettled_days():
+    return int(get_env("GMB_METRICS_UNSETTLED_DAYS", str(DEFAULT_METRICS_UNSETTLED_DAYS)))
+
+
+def get_cache_ttl_s():
+    return int(get_env("GMB_CACHE_TTL_S", str(DEFAULT_CACHE_TTL_S)))
+
+
+def get_cache_max_entries():
+    return int(get_env("GMB_CACHE_MAX_ENTRIES", str(DEFAULT_CACHE_MAX_ENTRIES)))
+
+
+def get_api_max_retries():
+    return int(get_env("GMB_API_MAX_RETRIES", str(DEFAULT_API_MAX_RETRIES)))
+
+
+def get_api_qpm(api_name):
+    default = DEFAULT_API_QPM.get(api_name, DEFAULT_API_QPM_FALLBACK)
+    return int(get_env(f"GMB_QPM_{api_name.upper()}", str(default)))
+
+
+def get_quota_headroom():
+    return float(get_env("GMB_QUOTA_HEADROOM", str(DEFAULT_QUOTA_HEADROOM)))
+
+
+def get_quota_governor():
+    return get_env("GMB_QUOTA_GOVERNOR", DEFAULT_QUOTA_GOVERNOR).lower()
+
+
+def get_http_timeout_s():
+    return float(get_env("GMB_HTTP_TIMEOUT_S", str(DEFAULT_HTTP_TIMEOUT_S)))
+
+
+def get_http_pool_size():
+    return int(get_env("GMB_HTTP_POOL_SIZE", str(DEFAULT_HTTP_POOL_SIZE)))
+
+
+def get_token_refresh_ahead_s():
+    return int(get_env("GMB_TOKEN_REFRESH_AHEAD_S", str(DEFAULT_TOKEN_REFRESH_AHEAD_S)))
+
+
+def get_persist_credentials():
+    return get_env("GMB_PERSIST_CREDENTIALS", DEFAULT_PERSIST_CREDENTIALS).lower() in ("1", "true", "yes")
+
+
+def get_session_max_age_s():
+    return int(get_env("GMB_SESSION_MAX_AGE_S", str(DEFAULT_SESSION_MAX_AGE_S)))
+
+
+def get_dashboard_budget_s():
+    return float(get_env("GMB_DASHBOARD_BUDGET_S", str(DEFAULT_DASHBOARD_BUDGET_S)))
+
+
+def get_portfolio_workers():
+    return max(1, int(get_env("GMB_PORTFOLIO_WORKERS", str(DEFAULT_PORTFOLIO_WORKERS))))
+
+
+def get_reviews_full_sync_hours():
+    return float(get_env("GMB_REVIEWS_FULL_SYNC_HOURS", str(DEFAULT_REVIEWS_FULL_SYNC_HOURS)))
+
+
+def get_post_insights_refresh_days():
+    return int(get_env("GMB_POST_INSIGHTS_REFRESH_DAYS", str(DEFAULT_POST_INSIGHTS_REFRESH_DAYS)))
+
+
+def get_backfill_months():
+    return int(get_env("GMB_BACKFILL_MONTHS", str(DEFAULT_BACKFILL_MONTHS)))
+
+
+def get_backfill_workers():
+    return max(1, int(get_env("GMB_BACKFILL_WORKERS", str(DEFAULT_BACKFILL_WORKERS))))
+
+
+def get_google_api_endpoint():
+    """Base URL of a stand-in server serving every Google API (empty for the real ones)."""
+    return get_env("GMB_GOOGLE_API_ENDPOINT").rstrip("/")
+
+
+def get_trace_export():
+    """Span export format: '' (off), 'jsonl' or 'otlp'."""
+    return get_env("GMB_TRACE_EXPORT").lower()
+
+
+def get_trace_path():
+    return get_env("GMB_TRACE_PATH") or os.path.join(get_cache_dir(), "traces.jsonl")
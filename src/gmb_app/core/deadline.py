@@ -0,0 +1,96 @@
+import contextlib
+import contextvars
+import time
+
+from src.gmb_app.core.errors import DeadlineExceeded
+
+_current_deadline = contextvars.ContextVar("gmb_deadline", default=None)
+
+
+class Deadline:
+    """A point in time by which a unit of work (e.g. one dashboard load) must be done.
+
+    `exceeded` is set once work under this deadline was cut short, and propagates to
+    the deadline it was derived from.
+    """
+
+    def __init__(self, expires_at, parent=None):
+        self.expires_at = expires_at
+        self.parent = parent
+        self.exceeded = False
+
+    def child(self):
+        """A deadline with the same expiry whose `exceeded` flag is tracked separately."""
+        return Deadline(self.expires_at, parent=self)
+
+    def remaining_s(self):
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self):
+        return time.monotonic() >= self.expires_at
+
+    def mark_exceeded(self):
+        deadline = self
+        while deadline is not None:
+            deadline.exceeded = True
+            deadline = deadline.parent
+
+    def check(self, what="request", needed_s=0.0):
+        """Raises DeadlineExceeded if `what` cannot start (and wait `needed_s`) in time."""
+        if self.remaining_s() <= needed_s:
+            self.mark_exceeded()
+            raise DeadlineExceeded(f"Deadline exceeded before {what}")
+
+
+@contextlib.contextmanager
+def use(instance):
+    """Runs the enclosed block under an existing Deadline."""
+    token = _current_deadline.set(instance)
+    try:
+        yield instance
+    finally:
+        _current_deadline.reset(token)
+
+
+def start(budget_s):
+    """A Deadline `budget_s` seconds from now, never later than the one already in effect."""
+    parent = _current_deadline.get()
+    expires_at = time.monotonic() + budget_s
+    if parent is not None:
+        expires_at = min(expires_at, parent.expires_at)
+    return Deadline(expires_at, parent=parent)
+
+
+def within(budget_s):
+    """Bounds the enclosed block by `budget_s` seconds."""
+    return use(start(budget_s))
+
+
+def current_deadline():
+    return _current_deadline.get()
+
+
+def call_timeout_s(default_s, what="request"):
+    """Timeout for one call: `default_s`, shortened to what is left of the current deadline."""
+    current = _current_deadline.get()
+    if current is None:
+        return default_s
+    current.check(what)
+    return min(default_s, current.remaining_s())
+
+
+def check(what="request", needed_s=0.0):
+    current = _current_deadline.get()
+    if current is not None:
+        current.check(what, needed_s)
+
+
+def expired():
+    current = _current_deadline.get()
+    return current is not None and current.expired()
+
+
+def cut_short():
+    """True if work under the current deadline may have been left incomplete."""
+    current = _current_deadline.get()
+    return current is not None and (current.exceeded or current.expired())
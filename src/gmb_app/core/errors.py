@@ -1,20 +1,34 @@
 class AppError(Exception):
-    def __init__(self, message, code="app_error", retryable=False):
+    def __init__(self, message, code="app_error", retryable=False, status_code=None):
         super().__init__(message)
         self.code = code
         self.retryable = retryable
+        self.status_code = status_code
 
 
 class AuthError(AppError):
-    def __init__(self, message, retryable=False):
-        super().__init__(message, code="auth_error", retryable=retryable)
+    def __init__(self, message, retryable=False, status_code=None):
+        super().__init__(message, code="auth_error", retryable=retryable, status_code=status_code)
 
 
 class IntegrationError(AppError):
-    def __init__(self, message, retryable=True):
-        super().__init__(message, code="integration_error", retryable=retryable)
+    def __init__(self, message, retryable=True, status_code=None):
+        super().__init__(message, code="integration_error", retryable=retryable, status_code=status_code)
+
+
+class QuotaError(IntegrationError):
+    def __init__(self, message, retryable=True, status_code=429, retry_after_s=None):
+        super().__init__(message, retryable=retryable, status_code=status_code)
+        self.code = "quota_error"
+        self.retry_after_s = retry_after_s
 
 
 class ValidationError(AppError):
+    def __init__(self, message, status_code=None):
+        super().__init__(message, code="validation_error", retryable=False, status_code=status_code)
+
+
+class DeadlineExceeded(IntegrationError):
     def __init__(self, message):
-        super().__init__(message, code="validation_error", retryable=False)
+        super().__init__(message, retryable=False)
+        self.code = "deadline_exceeded"
@@ -48,6 +48,18 @@ TRANSLATIONS = {
         "posts": "Posts",
         "health": "Health",
         "fetch_data": "Fetch Data",
+        "portfolio": "Portfolio",
+        "portfolio_locations": "Locations",
+        "fetch_portfolio": "Fetch Portfolio",
+        "portfolio_hint": "Select locations and click 'Fetch Portfolio' to compare them.",
+        "portfolio_empty": "No data found for the selected locations.",
+        "portfolio_location_failed": "Could not fetch",
+        "portfolio_location_incomplete": "Time budget ran out; partial data for",
+        "portfolio_download": "Download CSV",
+        "portfolio_health_running": "Scoring profile health...",
+        "portfolio_backfill": "Backfill Metrics History",
+        "portfolio_backfill_partial": "Chunks left for the next backfill of",
+        "portfolio_backfill_done": "Metrics history stored. Run it again to retry anything that failed.",
     },
     "pt-BR": {
         "configuration": "Configuração",
@@ -96,6 +108,18 @@ TRANSLATIONS = {
         "posts": "Posts",
         "health": "Saúde",
         "fetch_data": "Buscar Dados",
+        "portfolio": "Portfólio",
+        "portfolio_locations": "Empresas",
+        "fetch_portfolio": "Buscar Portfólio",
+        "portfolio_hint": "Selecione empresas e clique em 'Buscar Portfólio' para compará-las.",
+        "portfolio_empty": "Nenhum dado encontrado para as empresas selecionadas.",
+        "portfolio_location_failed": "Não foi possível buscar",
+        "portfolio_location_incomplete": "Tempo esgotado; dados parciais de",
+        "portfolio_download": "Baixar CSV",
+        "portfolio_health_running": "Avaliando a saúde dos perfis...",
+        "portfolio_backfill": "Baixar Histórico de Métricas",
+        "portfolio_backfill_partial": "Períodos pendentes para a próxima carga de",
+        "portfolio_backfill_done": "Histórico de métricas salvo. Execute de novo para repetir o que falhou.",
     },
 }
 
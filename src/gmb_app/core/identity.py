@@ -0,0 +1,20 @@
+import hashlib
+
+
+def credential_identity(credentials):
+    """Returns a stable key for the account behind a credentials object.
+
+    Refreshing a token changes `credentials.token` but not the refresh token, so the
+    identity survives refreshes. Objects without a refresh token are keyed by id().
+    Service registries, the memory cache and every local store are scoped by it.
+    """
+    refresh_token = getattr(credentials, "refresh_token", None)
+    if refresh_token:
+        client_id = getattr(credentials, "client_id", None) or ""
+        return hashlib.sha256(f"{client_id}:{refresh_token}".encode()).hexdigest()
+    return f"object:{id(credentials)}"
+
+
+def is_persistent_identity(identity):
+    """False for id()-based identities: a later, unrelated object may get the same id()."""
+    return not identity.startswith("object:")
@@ -0,0 +1,224 @@
+import contextlib
+import contextvars
+import json
+import os
+import secrets
+import threading
+import time
+
+from src.gmb_app.core.config import get_trace_export, get_trace_path
+from src.gmb_app.core.logging import get_logger
+
+logger = get_logger("tracing")
+
+SERVICE_NAME = "gmb_app"
+
+_current_span = contextvars.ContextVar("gmb_current_span", default=None)
+# Attributes every span opened in this context inherits (e.g. the page being fetched)
+_context_attributes = contextvars.ContextVar("gmb_span_attributes", default={})
+
+
+class Span:
+    """One timed operation: an API call or a dashboard phase."""
+
+    def __init__(self, name, kind, attributes=None, parent=None):
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = {**_context_attributes.get(), **(attributes or {})}
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.outcome = "ok"
+        self.error = None
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @property
+    def duration_ms(self):
+        return round((self.end_ns - self.start_ns) / 1e6, 3) if self.end_ns else None
+
+    def set(self, **attributes):
+        with self._lock:
+            self.attributes.update(attributes)
+
+    def add(self, **counters):
+        """Adds to numeric attributes, e.g. bytes received over several attempts."""
+        with self._lock:
+            for key, value in counters.items():
+                self.attributes[key] = self.attributes.get(key, 0) + value
+
+    def fail(self, error):
+        self.outcome = getattr(error, "code", None) or type(error).__name__
+        self.error = str(error)
+
+    def finish(self):
+        self.end_ns = self.start_ns + int((time.perf_counter() - self._started) * 1e9)
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": self.duration_ms,
+            "outcome": self.outcome,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class JsonLinesExporter:
+    """Appends one JSON object per finished span to a file."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, span):
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+def _otlp_value(value):
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(spans):
+    """Encodes spans as an OTLP/JSON ExportTraceServiceRequest."""
+    otlp_spans = []
+    for span in spans:
+        attributes = {"gmb.kind": span.kind, "gmb.outcome": span.outcome, **span.attributes}
+        otlp_span = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            # SPAN_KIND_CLIENT for API calls, SPAN_KIND_INTERNAL for phases
+            "kind": 3 if span.kind == "api_call" else 1,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)} for key, value in attributes.items() if value is not None
+            ],
+            # STATUS_CODE_OK / STATUS_CODE_ERROR
+            "status": {"code": 1} if span.outcome == "ok" else {"code": 2, "message": span.error or span.outcome},
+        }
+        if span.parent_id:
+            otlp_span["parentSpanId"] = span.parent_id
+        otlp_spans.append(otlp_span)
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]},
+                "scopeSpans": [{"scope": {"name": "gmb_app.tracing"}, "spans": otlp_spans}],
+            }
+        ]
+    }
+
+
+class OtlpJsonExporter(JsonLinesExporter):
+    """Writes each span as an OTLP/JSON line, the format of the collector's otlpjsonfile receiver."""
+
+    def export(self, span):
+        line = json.dumps(to_otlp([span]), default=str)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+class InMemoryExporter:
+    """Keeps finished spans in a list; meant for tests and benchmarks."""
+
+    def __init__(self):
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def export(self, span):
+        with self._lock:
+            self.spans.append(span)
+
+
+_exporters = []
+_exporters_lock = threading.Lock()
+_configured = False
+
+
+def _configure_from_env():
+    global _configured
+    with _exporters_lock:
+        if _configured:
+            return
+        _configured = True
+        export = get_trace_export()
+        if not export:
+            return
+        path = get_trace_path()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        exporter = OtlpJsonExporter(path) if export == "otlp" else JsonLinesExporter(path)
+        _exporters.append(exporter)
+
+
+def add_exporter(exporter):
+    _configure_from_env()
+    with _exporters_lock:
+        _exporters.append(exporter)
+    return exporter
+
+
+def remove_exporter(exporter):
+    with _exporters_lock:
+        if exporter in _exporters:
+            _exporters.remove(exporter)
+
+
+def _export(span):
+    with _exporters_lock:
+        exporters = list(_exporters)
+    for exporter in exporters:
+        try:
+            exporter.export(span)
+        except Exception as e:
+            logger.warning(f"Could not export span {span.name}: {e}")
+
+
+@contextlib.contextmanager
+def span(name, kind="phase", **attributes):
+    """Times the enclosed block as a span, child of the span already open in this context."""
+    _configure_from_env()
+    current = Span(name, kind, attributes, parent=_current_span.get())
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.fail(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        current.finish()
+        _export(current)
+
+
+def current_span():
+    return _current_span.get()
+
+
+@contextlib.contextmanager
+def tagged(**attributes):
+    """Adds attributes (e.g. page=2) to every span opened inside the block."""
+    token = _context_attributes.set({**_context_attributes.get(), **attributes})
+    try:
+        yield
+    finally:
+        _context_attributes.reset(token)
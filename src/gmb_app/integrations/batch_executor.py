@@ -0,0 +1,120 @@
+from googleapiclient.http import MAX_BATCH_LIMIT
+
+from src.gmb_app.core import tracing
+from src.gmb_app.core.errors import QuotaError
+from src.gmb_app.core.logging import get_logger
+from src.gmb_app.integrations.credential_manager import ensure_fresh
+from src.gmb_app.integrations.request_executor import (
+    classify_exception,
+    execute_with_retry,
+    get_bucket,
+)
+
+logger = get_logger("batch_executor")
+
+# Calls Google accepts in one batch request, per API (Drive documents a lower limit)
+MAX_BATCH_SIZES = {"drive": 100}
+
+
+def max_batch_size(api_name):
+    return MAX_BATCH_SIZES.get(api_name, MAX_BATCH_LIMIT)
+
+
+class RequestBatch:
+    """Sends many requests of one API as a few multipart batch HTTP requests.
+
+    Requests are added with a caller key and sent `max_size` (the API's batch
+    limit) at a time when the batch is executed. Every call in a batch still
+    draws one quota token, but shares one connection round trip and one token
+    check. A call failing with a retryable error is retried on its own through
+    the request executor; other failures are kept in `errors` by key instead of
+    failing the rest of the batch.
+
+    Usage:
+        batch = RequestBatch(service)
+        for location in locations:
+            batch.add(service.locations().get(name=location, readMask="name"), key=location)
+        responses = batch.execute()
+    """
+
+    def __init__(self, service, max_size=None):
+        self.service = service
+        self.max_size = max_size
+        self.errors = {}
+        self._items = []
+
+    def __len__(self):
+        return len(self._items)
+
+    def add(self, request, key=None, callback=None):
+        """Queues a request; `callback(key, response, error)` is called once it completes."""
+        self._items.append((len(self._items) if key is None else key, request, callback))
+
+    def execute(self):
+        """Sends every queued request and returns {key: response} of those that succeeded."""
+        items, self._items = self._items, []
+        responses = {}
+        if not items:
+            return responses
+        api_name = items[0][1].api_name
+        size = min(self.max_size or max_batch_size(api_name), max_batch_size(api_name))
+        for start in range(0, len(items), size):
+            self._send(api_name, items[start:start + size], responses)
+        return responses
+
+    def _send(self, api_name, items, responses):
+        request_http = items[0][1].http
+        outcomes = {}
+
+        def collect(request_id, response, exception):
+            outcomes[int(request_id)] = (response, exception)
+
+        def send():
+            ensure_fresh(getattr(request_http, "credentials", None))
+            bucket = get_bucket(api_name)
+            for _ in items:
+                bucket.acquire()
+            batch = self.service.new_batch_http_request(callback=collect)
+            for index, (_, request, _) in enumerate(items):
+                batch.add(request, request_id=str(index))
+            batch.execute()
+
+        with tracing.span(
+            f"{api_name}.batch",
+            kind="api_call",
+            service=api_name,
+            method=f"{api_name}.batch",
+            http_method="POST",
+            size=len(items),
+            retries=0,
+        ) as call:
+            execute_with_retry(
+                send,
+                description=f"{api_name} batch of {len(items)}",
+                idempotent=all(request.idempotent for _, request, _ in items),
+                span=call,
+            )
+            failed = sum(1 for _, error in outcomes.values() if error is not None)
+            call.set(failed=failed)
+
+        for index, (key, request, callback) in enumerate(items):
+            response, error = outcomes.get(index, (None, None))
+            if error is not None:
+                response, error = self._retry(request, classify_exception(error))
+            if error is None:
+                responses[key] = response
+            else:
+                logger.warning(f"Batched {request.methodId} failed for {key}: {error}")
+                self.errors[key] = error
+            if callback is not None:
+                callback(key, response, error)
+
+    @staticmethod
+    def _retry(request, error):
+        # Like execute_with_retry, writes are only resent when Google rejected them for quota
+        if not error.retryable or not (request.idempotent or isinstance(error, QuotaError)):
+            return None, error
+        try:
+            return request.execute(), None
+        except Exception as e:
+            return None, classify_exception(e)
@@ -0,0 +1,97 @@
+import threading
+from collections import OrderedDict
+
+from googleapiclient.discovery import build
+
+from src.gmb_app.core.config import get_google_api_endpoint
+from src.gmb_app.core.identity import credential_identity
+from src.gmb_app.integrations.credential_manager import ensure_fresh
+from src.gmb_app.integrations.discovery_cache import FileDiscoveryCache
+from src.gmb_app.integrations.http_transport import PooledHttp, get_authorized_session
+from src.gmb_app.integrations.request_executor import ManagedHttpRequest
+
+MAX_CACHED_SERVICES = 256
+# Discovery path served by the stand-in server (src/gmb_app/testing/fake_google_api.py)
+STAND_IN_DISCOVERY_PATH = "/discovery/v1/apis/{api}/{apiVersion}/rest"
+
+_services = OrderedDict()
+_services_lock = threading.Lock()
+_discovery_cache = None
+
+
+def get_discovery_cache():
+    """Returns the process-wide on-disk discovery document cache."""
+    global _discovery_cache
+    if _discovery_cache is None:
+        _discovery_cache = FileDiscoveryCache()
+    return _discovery_cache
+
+
+def get_http(credentials):
+    """Returns a pooled keep-alive transport signing requests with these credentials."""
+    return PooledHttp(credentials, credential_identity(credentials), prepare=ensure_fresh)
+
+
+def get_api_root_url(api_name):
+    """Returns the root URL of an API, for raw requests made outside googleapiclient."""
+    endpoint = get_google_api_endpoint()
+    if endpoint:
+        return f"{endpoint}/{api_name}/"
+    return f"https://{api_name}.googleapis.com/"
+
+
+def get_session(credentials):
+    """Returns the calling thread's pooled requests session for raw authorized calls."""
+    ensure_fresh(credentials)
+    return get_authorized_session(credentials, credential_identity(credentials))
+
+
+def get_service(api_name, api_version, credentials, discovery_url=None, static_discovery=None):
+    """Returns a ready-made API resource, building it once per process and identity.
+
+    Requests made through the resource reuse pooled keep-alive connections, are
+    rate limited and retried by the request executor and raise AppError subclasses
+    instead of HttpError.
+
+    With GMB_GOOGLE_API_ENDPOINT set, every API is discovered from (and sent to)
+    that stand-in server instead of Google.
+    """
+    endpoint = get_google_api_endpoint()
+    if endpoint:
+        discovery_url = endpoint + STAND_IN_DISCOVERY_PATH
+        static_discovery = False
+
+    key = (credential_identity(credentials), api_name, api_version, discovery_url)
+    with _services_lock:
+        service = _services.get(key)
+        if service is not None:
+            _services.move_to_end(key)
+            return service
+
+    service = build(
+        api_name,
+        api_version,
+        http=get_http(credentials),
+        discoveryServiceUrl=discovery_url,
+        static_discovery=static_discovery,
+        cache=get_discovery_cache(),
+        requestBuilder=ManagedHttpRequest,
+    )
+
+    with _services_lock:
+        service = _services.setdefault(key, service)
+        _services.move_to_end(key)
+        while len(_services) > MAX_CACHED_SERVICES:
+            _services.popitem(last=False)
+    return service
+
+
+def clear_services(credentials=None):
+    """Drops cached services, either for one credentials identity or all of them."""
+    with _services_lock:
+        if credentials is None:
+            _services.clear()
+            return
+        identity = credential_identity(credentials)
+        for key in [key for key in _services if key[0] == identity]:
+            del _services[key]
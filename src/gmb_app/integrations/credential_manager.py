@@ -0,0 +1,171 @@
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+
+from src.gmb_app.core.config import (
+    get_persist_credentials,
+    get_session_max_age_s,
+    get_token_refresh_ahead_s,
+)
+from src.gmb_app.core.identity import credential_identity
+from src.gmb_app.core.logging import get_logger
+from src.gmb_app.integrations.http_transport import get_public_session
+from src.gmb_app.storage import credential_store
+
+logger = get_logger("credential_manager")
+
+_locks = {}
+_locks_guard = threading.Lock()
+# identity -> (token, expiry) of the newest refresh, shared by every credentials object of that identity
+_latest_tokens = {}
+_background_refreshes = {}
+
+
+def _lock_for(identity):
+    with _locks_guard:
+        lock = _locks.get(identity)
+        if lock is None:
+            lock = _locks[identity] = threading.Lock()
+        return lock
+
+
+def _utcnow():
+    # google-auth keeps expiry as a naive UTC datetime
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _expires_within(credentials, seconds):
+    if not credentials.token:
+        return True
+    if credentials.expiry is None:
+        return False
+    return credentials.expiry - _utcnow() <= timedelta(seconds=seconds)
+
+
+def _adopt_latest(credentials, identity):
+    """Copies a newer token refreshed through another object of the same identity."""
+    latest = _latest_tokens.get(identity)
+    if latest is None:
+        return
+    token, expiry = latest
+    if expiry is not None and (credentials.expiry is None or expiry > credentials.expiry):
+        credentials.token = token
+        credentials.expiry = expiry
+
+
+def refresh_credentials(credentials, min_remaining_s=0):
+    """Refreshes the token unless one with `min_remaining_s` of life is already available.
+
+    Refreshes are single-flight per identity: concurrent callers wait for the one
+    in progress and reuse its token instead of each hitting the token endpoint.
+    """
+    identity = credential_identity(credentials)
+    with _lock_for(identity):
+        _adopt_latest(credentials, identity)
+        if credentials.valid and not _expires_within(credentials, min_remaining_s):
+            return credentials
+        credentials.refresh(Request(session=get_public_session()))
+        _latest_tokens[identity] = (credentials.token, credentials.expiry)
+    _persist(credentials, identity)
+    return credentials
+
+
+def _refresh_in_background(credentials, identity, ahead_s):
+    try:
+        refresh_credentials(credentials, min_remaining_s=ahead_s)
+    except Exception as e:
+        # The next request refreshes inline if the token actually runs out
+        logger.warning(f"Background token refresh failed: {e}")
+    finally:
+        with _locks_guard:
+            _background_refreshes.pop(identity, None)
+
+
+def _schedule_refresh(credentials, identity, ahead_s):
+    with _locks_guard:
+        if identity in _background_refreshes:
+            return _background_refreshes[identity]
+        thread = threading.Thread(
+            target=_refresh_in_background,
+            args=(credentials, identity, ahead_s),
+            name="credential-refresh",
+            daemon=True,
+        )
+        _background_refreshes[identity] = thread
+    thread.start()
+    return thread
+
+
+def ensure_fresh(credentials):
+    """Makes sure a request can be signed with these credentials without stalling.
+
+    An expired token is refreshed inline (single-flight). A token that is still
+    valid but close to expiry is renewed by a background thread, so the caller
+    keeps using the current one and interactive requests never wait on the
+    token endpoint.
+    """
+    if not getattr(credentials, "refresh_token", None):
+        return credentials
+    identity = credential_identity(credentials)
+    _adopt_latest(credentials, identity)
+    if not credentials.valid:
+        return refresh_credentials(credentials)
+    ahead_s = get_token_refresh_ahead_s()
+    if _expires_within(credentials, ahead_s):
+        _schedule_refresh(credentials, identity, ahead_s)
+    return credentials
+
+
+def _stored_payload(credentials):
+    """Authorized-user JSON without the OAuth client secret, which stays in the app's config."""
+    info = json.loads(credentials.to_json())
+    info.pop("client_secret", None)
+    return json.dumps(info)
+
+
+def _persist(credentials, identity):
+    if not get_persist_credentials():
+        return
+    try:
+        # Only identities with a stored sign-in are updated; a signed-out one is not written back
+        credential_store.update_credentials(identity, _stored_payload(credentials))
+    except Exception as e:
+        logger.warning(f"Could not persist refreshed credentials: {e}")
+
+
+def remember_credentials(credentials):
+    """Persists freshly granted credentials and returns a session id to restore them, or None."""
+    if not get_persist_credentials() or not getattr(credentials, "refresh_token", None):
+        return None
+    identity = credential_identity(credentials)
+    try:
+        credential_store.save_credentials(identity, _stored_payload(credentials))
+        return credential_store.create_session(identity)
+    except Exception as e:
+        logger.warning(f"Could not persist credentials; sign-in will not survive a restart: {e}")
+        return None
+
+
+def restore_credentials(session_id, client_secret, scopes=None):
+    """Returns the persisted credentials of a session id (with their latest token), or None.
+
+    Sessions older than GMB_SESSION_MAX_AGE_S are not restored. The client secret is
+    not stored with the tokens, so the caller passes the one of its OAuth config.
+    """
+    if not session_id or not client_secret or not get_persist_credentials():
+        return None
+    payload = credential_store.load_session_credentials(session_id, get_session_max_age_s())
+    if not payload:
+        return None
+    info = json.loads(payload)
+    info["client_secret"] = client_secret
+    return Credentials.from_authorized_user_info(info, scopes)
+
+
+def forget_session(session_id):
+    """Deletes a persisted sign-in, and its stored tokens once no other session uses them."""
+    if session_id:
+        credential_store.delete_session(session_id)
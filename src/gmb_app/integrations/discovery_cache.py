@@ -0,0 +1,58 @@
+import hashlib
+import json
+import os
+import time
+
+from googleapiclient.discovery_cache.base import Cache
+from googleapiclient.version import __version__ as googleapiclient_version
+
+from src.gmb_app.core.config import get_cache_dir, get_discovery_cache_ttl_s
+from src.gmb_app.core.logging import get_logger
+
+logger = get_logger("discovery_cache")
+
+# Bump when the on-disk layout changes; the client library version is part of the
+# path too, so upgrading googleapiclient never reuses documents parsed by an older one.
+CACHE_FORMAT_VERSION = 1
+
+
+class FileDiscoveryCache(Cache):
+    """Persists discovery documents on disk so builds skip the network round trip."""
+
+    def __init__(self, cache_dir=None, ttl_s=None):
+        base_dir = cache_dir or get_cache_dir()
+        self.cache_dir = os.path.join(
+            base_dir,
+            "discovery",
+            f"v{CACHE_FORMAT_VERSION}-googleapiclient-{googleapiclient_version}",
+        )
+        self.ttl_s = get_discovery_cache_ttl_s() if ttl_s is None else ttl_s
+
+    def _path(self, url):
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def get(self, url):
+        path = self._path(url)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("url") != url:
+            return None
+        if self.ttl_s >= 0 and time.time() - entry.get("stored_at", 0) > self.ttl_s:
+            return None
+        return entry.get("content")
+
+    def set(self, url, content):
+        path = self._path(url)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"url": url, "stored_at": time.time(), "content": content}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not persist discovery document for {url}: {e}")
@@ -1,6 +1,7 @@
 from drive_helper import (
     build_public_file_url,
     get_drive_service,
+    iter_folders,
     list_folders,
     set_file_public,
     upload_file_to_folder,
@@ -9,6 +10,7 @@ from drive_helper import (
 
 __all__ = [
     "get_drive_service",
+    "iter_folders",
     "list_folders",
     "upload_file_to_folder",
     "set_file_public",
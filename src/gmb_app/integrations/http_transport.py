@@ -0,0 +1,133 @@
+import threading
+
+import httplib2
+import requests
+from google.auth.transport.requests import AuthorizedSession, Request
+
+from src.gmb_app.core import deadline, tracing
+from src.gmb_app.core.config import get_http_pool_size, get_http_timeout_s
+
+# Headers describing the wire encoding, which requests has already undone
+_WIRE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class _SharedHTTPAdapter(requests.adapters.HTTPAdapter):
+    """Adapter that outlives the sessions mounting it.
+
+    Closing a session closes its adapters, and google-auth closes the session of
+    a token-refresh Request when it is garbage collected, so a per-thread session
+    going away must not tear down connections the other threads are using.
+    """
+
+    def close(self):
+        pass
+
+    def close_pool(self):
+        super().close()
+
+
+_adapter = None
+_adapter_lock = threading.Lock()
+_thread_state = threading.local()
+
+
+def get_http_adapter():
+    """Returns the process-wide keep-alive connection pool.
+
+    urllib3 pools are thread-safe, so every session of every thread mounts this
+    one adapter and a TLS connection opened by one request is reused by the next,
+    whichever thread or Streamlit rerun sends it.
+    """
+    global _adapter
+    with _adapter_lock:
+        if _adapter is None:
+            pool_size = get_http_pool_size()
+            _adapter = _SharedHTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        return _adapter
+
+
+def close_http_pool():
+    """Closes every pooled connection; new ones are opened on the next request."""
+    with _adapter_lock:
+        if _adapter is not None:
+            _adapter.close_pool()
+
+
+def _mount(session):
+    adapter = get_http_adapter()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _thread_sessions():
+    sessions = getattr(_thread_state, "sessions", None)
+    if sessions is None:
+        sessions = _thread_state.sessions = {}
+    return sessions
+
+
+def get_public_session():
+    """Returns the calling thread's unauthenticated session on the shared pool."""
+    sessions = _thread_sessions()
+    session = sessions.get(None)
+    if session is None:
+        session = sessions[None] = _mount(requests.Session())
+    return session
+
+
+def get_authorized_session(credentials, identity):
+    """Returns the calling thread's session that signs requests with these credentials.
+
+    requests.Session objects are not safe to share between threads, so each thread
+    keeps its own per identity; they all draw connections from the shared pool.
+    Token refreshes go through the same pool.
+    """
+    sessions = _thread_sessions()
+    session = sessions.get(identity)
+    if session is None or session.credentials is not credentials:
+        session = AuthorizedSession(credentials, auth_request=Request(session=get_public_session()))
+        sessions[identity] = _mount(session)
+    return session
+
+
+class PooledHttp:
+    """httplib2.Http stand-in that sends googleapiclient requests over the shared pool.
+
+    It resolves the calling thread's session on every request, so a service built
+    once per process can be used from any thread. `prepare(credentials)` runs
+    before each request, e.g. to renew the token outside the session.
+    """
+
+    def __init__(self, credentials, identity, timeout_s=None, prepare=None):
+        self.credentials = credentials
+        self.identity = identity
+        self.timeout_s = timeout_s or get_http_timeout_s()
+        self.prepare = prepare
+
+    def request(self, uri, method="GET", body=None, headers=None, redirections=5, connection_type=None):
+        if self.prepare is not None:
+            self.prepare(self.credentials)
+        session = get_authorized_session(self.credentials, self.identity)
+        response = session.request(
+            method,
+            uri,
+            data=body,
+            headers=headers,
+            timeout=deadline.call_timeout_s(self.timeout_s, what=f"{method} {uri.split('?', 1)[0]}"),
+            allow_redirects=redirections > 0,
+        )
+        call = tracing.current_span()
+        if call is not None and call.kind == "api_call":
+            sent = body.encode() if isinstance(body, str) else body or b""
+            call.add(attempts=1, bytes_sent=len(sent), bytes_received=len(response.content))
+            call.set(status_code=response.status_code)
+        info = {key.lower(): value for key, value in response.headers.items() if key.lower() not in _WIRE_HEADERS}
+        info["status"] = str(response.status_code)
+        resp = httplib2.Response(info)
+        resp.reason = response.reason
+        return resp, response.content
+
+    def close(self):
+        # Connections belong to the shared pool and outlive any one service
+        pass
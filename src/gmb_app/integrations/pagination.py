@@ -0,0 +1,65 @@
+from src.gmb_app.core import tracing
+
+
+class PageIterator:
+    """Streams the items of a paginated Google list endpoint, one page request at a time.
+
+    `request_for(page_token)` builds the request of one page (None for the first)
+    and `items_field` names the list in each response. Pages are only requested as
+    the caller iterates, so breaking out of the loop stops paging, and `limit`
+    stops after that many items. Iterate the iterator for items, or `pages()` for
+    each page's items as a list.
+
+    To continue later, pass `resume_token` as `page_token` of a new iterator: it is
+    the next page's token once a page has been consumed, or the current page's
+    token while its items are still being iterated (they are then seen again).
+    `exhausted` is set once the last page was read. `response` holds the latest
+    page's response, for totals such as totalReviewCount.
+
+    Usage:
+        pages = PageIterator(
+            lambda token: service.accounts().list(pageSize=20, pageToken=token), "accounts", limit=50
+        )
+        for account in pages:
+            ...
+    """
+
+    def __init__(self, request_for, items_field, page_token=None, limit=None):
+        self.request_for = request_for
+        self.items_field = items_field
+        self.limit = limit
+        self.resume_token = page_token
+        self.page_token = page_token
+        self.response = None
+        self.exhausted = False
+        self.page_count = 0
+        self.item_count = 0
+
+    def _limit_reached(self):
+        return self.limit is not None and self.item_count >= self.limit
+
+    def pages(self):
+        """Yields the items of each page as a list, as soon as the page arrives."""
+        while not self.exhausted and not self._limit_reached():
+            self.page_token = self.resume_token
+            self.page_count += 1
+            with tracing.tagged(page=self.page_count):
+                self.response = self.request_for(self.page_token).execute()
+            items = self.response.get(self.items_field, [])
+            next_token = self.response.get("nextPageToken")
+            truncated = self.limit is not None and self.item_count + len(items) > self.limit
+            if truncated:
+                # Resuming re-reads this page, whose remaining items were not returned
+                items = items[:self.limit - self.item_count]
+                self.resume_token = self.page_token
+            else:
+                self.resume_token = next_token
+                self.exhausted = not next_token
+            self.item_count += len(items)
+            yield items
+
+    def __iter__(self):
+        for items in self.pages():
+            after_page, self.resume_token = self.resume_token, self.page_token
+            yield from items
+            self.resume_token = after_page
@@ -0,0 +1,61 @@
+import time
+
+from src.gmb_app.core import deadline
+from src.gmb_app.core.config import get_quota_db_path
+from src.gmb_app.storage.db import connect
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quota_buckets (
+    api_name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+_sleep = time.sleep
+
+
+class SharedTokenBucket:
+    """Token bucket whose state lives in SQLite, shared by every process on the host.
+
+    All Streamlit server processes and cron scripts pointing at the same
+    GMB_QUOTA_DB_PATH draw from one bucket per API. Each acquire() reserves a token
+    inside an IMMEDIATE transaction (a cross-process write lock); when the bucket is
+    empty the balance goes negative and the caller sleeps until its reserved slot,
+    so concurrent callers queue instead of all retrying at once.
+    """
+
+    def __init__(self, api_name, rate_per_s, capacity=None, path=None):
+        self.api_name = api_name
+        self.rate_per_s = rate_per_s
+        self.capacity = capacity or max(1.0, rate_per_s)
+        self.path = path
+
+    def _reserve(self):
+        with connect(self.path or get_quota_db_path()) as conn:
+            conn.execute(_SCHEMA)
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM quota_buckets WHERE api_name = ?",
+                (self.api_name,),
+            ).fetchone()
+            if row:
+                tokens, updated_at = row
+                tokens = min(self.capacity, tokens + max(0.0, now - updated_at) * self.rate_per_s)
+            else:
+                tokens = self.capacity
+            tokens -= 1
+            conn.execute(
+                "INSERT OR REPLACE INTO quota_buckets (api_name, tokens, updated_at) VALUES (?, ?, ?)",
+                (self.api_name, tokens, now),
+            )
+        if tokens >= 0:
+            return 0.0
+        return -tokens / self.rate_per_s
+
+    def acquire(self):
+        wait_s = self._reserve()
+        if wait_s > 0:
+            deadline.check("waiting for quota", needed_s=wait_s)
+            _sleep(wait_s)
@@ -0,0 +1,275 @@
+import json
+import random
+import re
+import socket
+import sqlite3
+import ssl
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import httplib2
+import requests
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+
+from src.gmb_app.core import deadline, tracing
+from src.gmb_app.core.config import (
+    get_api_max_retries,
+    get_api_qpm,
+    get_quota_governor,
+    get_quota_headroom,
+)
+from src.gmb_app.core.errors import (
+    AppError,
+    AuthError,
+    DeadlineExceeded,
+    IntegrationError,
+    QuotaError,
+    ValidationError,
+)
+from src.gmb_app.core.logging import get_logger
+from src.gmb_app.integrations.quota_governor import SharedTokenBucket
+
+logger = get_logger("request_executor")
+
+BACKOFF_BASE_S = 0.5
+BACKOFF_MAX_S = 32.0
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+# 403 reasons that mean "slow down" rather than "forbidden"
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded", "RATE_LIMIT_EXCEEDED"}
+# POST methods that only read data and are therefore safe to resend
+READ_ONLY_POST_METHODS = {"batchGetReviews", "reportInsights", "batchGet", "fetchMultiDailyMetricsTimeSeries"}
+TRANSIENT_EXCEPTIONS = (
+    socket.timeout,
+    TimeoutError,
+    ConnectionError,
+    ssl.SSLError,
+    httplib2.HttpLib2Error,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+_LOCATION_IN_URI = re.compile(r"locations/([^/:?]+)")
+
+_sleep = time.sleep
+
+
+class TokenBucket:
+    """Blocking token bucket: `rate_per_s` sustained requests with bursts up to `capacity`."""
+
+    def __init__(self, rate_per_s, capacity=None):
+        self.rate_per_s = rate_per_s
+        self.capacity = capacity or max(1.0, rate_per_s)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self):
+        """Takes a token, returning how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_s)
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_s
+
+    def acquire(self):
+        wait_s = self._reserve()
+        if wait_s > 0:
+            deadline.check("waiting for quota", needed_s=wait_s)
+            _sleep(wait_s)
+
+
+class GovernedBucket:
+    """Draws from the cross-process bucket, falling back to a local one if its store fails."""
+
+    def __init__(self, shared, local):
+        self.shared = shared
+        self.local = local
+
+    def acquire(self):
+        try:
+            self.shared.acquire()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Quota governor unavailable for {self.shared.api_name}, using local limit: {e}")
+            self.local.acquire()
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(api_name):
+    """Returns the token bucket of an API, sized from its QPM quota minus headroom.
+
+    With GMB_QUOTA_GOVERNOR=sqlite (the default) the bucket is shared by every
+    process using the same GMB_QUOTA_DB_PATH; with 'process' it is per process.
+    """
+    with _buckets_lock:
+        bucket = _buckets.get(api_name)
+        if bucket is None:
+            rate_per_s = get_api_qpm(api_name) * get_quota_headroom() / 60.0
+            bucket = TokenBucket(rate_per_s)
+            if get_quota_governor() == "sqlite":
+                bucket = GovernedBucket(SharedTokenBucket(api_name, rate_per_s), bucket)
+            _buckets[api_name] = bucket
+        return bucket
+
+
+def reset_buckets():
+    """Forgets every token bucket so the next call resizes them from the current config."""
+    with _buckets_lock:
+        _buckets.clear()
+
+
+def _error_reasons(error):
+    """Collects machine-readable reasons ('rateLimitExceeded', 'RESOURCE_EXHAUSTED', ...)."""
+    reasons = set()
+    try:
+        data = json.loads(error.content.decode("utf-8"))
+    except (ValueError, AttributeError):
+        return reasons
+    if isinstance(data, list) and data:
+        data = data[0]
+    body = data.get("error", {}) if isinstance(data, dict) else {}
+    if body.get("status"):
+        reasons.add(body["status"])
+    for item in (body.get("errors") or []) + (body.get("details") or []):
+        if isinstance(item, dict) and item.get("reason"):
+            reasons.add(item["reason"])
+    return reasons
+
+
+def _retry_after_s(resp):
+    value = (resp or {}).get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_http_error(error):
+    """Maps a googleapiclient HttpError onto the AppError hierarchy."""
+    status = error.resp.status
+    reasons = _error_reasons(error)
+    message = f"Google API returned {status}: {error.reason or 'no details'}"
+
+    if status == 429 or reasons & RATE_LIMIT_REASONS:
+        return QuotaError(message, status_code=status, retry_after_s=_retry_after_s(error.resp))
+    if "RESOURCE_EXHAUSTED" in reasons or "quotaExceeded" in reasons:
+        # Daily/project quota: retrying within this request will not help
+        return QuotaError(message, retryable=False, status_code=status)
+    if status in (401, 403):
+        return AuthError(message, status_code=status)
+    if status == 400:
+        return ValidationError(message, status_code=status)
+    return IntegrationError(message, retryable=status in RETRYABLE_STATUS_CODES, status_code=status)
+
+
+def classify_exception(error):
+    """Maps any exception raised while executing a request onto the AppError hierarchy."""
+    if isinstance(error, AppError):
+        return error
+    if isinstance(error, HttpError):
+        return classify_http_error(error)
+    if isinstance(error, TRANSIENT_EXCEPTIONS):
+        return IntegrationError(f"Network error talking to Google: {error}", retryable=True)
+    return IntegrationError(f"Unexpected error talking to Google: {error}", retryable=False)
+
+
+def backoff_delay_s(attempt, error=None):
+    """Full-jitter exponential backoff, honouring a server-provided Retry-After."""
+    retry_after_s = getattr(error, "retry_after_s", None)
+    if retry_after_s is not None:
+        return min(BACKOFF_MAX_S, retry_after_s)
+    return random.uniform(0, min(BACKOFF_MAX_S, BACKOFF_BASE_S * (2 ** attempt)))
+
+
+def execute_with_retry(send, api_name=None, max_retries=None, description="request", idempotent=True, span=None):
+    """Runs `send()` under the API's rate limit, retrying retryable failures.
+
+    Requests that are not idempotent are only retried on quota errors, which
+    Google rejects before doing any work, so a create is never applied twice.
+    No attempt or backoff starts that the current deadline cannot fit. The retry
+    count is recorded on `span` when given.
+
+    Raises:
+        AppError subclass describing the last failure (the original exception is
+        chained as __cause__); DeadlineExceeded once the deadline runs out.
+    """
+    max_retries = get_api_max_retries() if max_retries is None else max_retries
+    attempt = 0
+    while True:
+        deadline.check(description)
+        if api_name:
+            get_bucket(api_name).acquire()
+        try:
+            return send()
+        except Exception as e:
+            app_error = classify_exception(e)
+            if deadline.expired() and not isinstance(app_error, DeadlineExceeded):
+                # The call was cut short by the deadline shortening its timeout
+                deadline.current_deadline().mark_exceeded()
+                raise DeadlineExceeded(f"Deadline exceeded during {description}") from e
+            retryable = app_error.retryable and (idempotent or isinstance(app_error, QuotaError))
+            if not retryable or attempt >= max_retries:
+                if app_error is e:
+                    raise
+                raise app_error from e
+            delay_s = backoff_delay_s(attempt, app_error)
+            try:
+                deadline.check(f"retrying {description}", needed_s=delay_s)
+            except DeadlineExceeded as exceeded:
+                raise exceeded from e
+            logger.warning(
+                f"{description} failed ({app_error.code}, status={app_error.status_code}); "
+                f"retry {attempt + 1}/{max_retries} in {delay_s:.2f}s"
+            )
+            _sleep(delay_s)
+            attempt += 1
+            if span is not None:
+                span.set(retries=attempt)
+
+
+class ManagedHttpRequest(HttpRequest):
+    """HttpRequest whose execute() is rate limited, retried and raises AppError subclasses."""
+
+    @property
+    def api_name(self):
+        return (self.methodId or "").split(".", 1)[0] or None
+
+    @property
+    def idempotent(self):
+        if self.method in ("GET", "HEAD", "PUT", "DELETE"):
+            return True
+        return (self.methodId or "").rsplit(".", 1)[-1] in READ_ONLY_POST_METHODS
+
+    def execute(self, http=None, num_retries=0):
+        location = _LOCATION_IN_URI.search(self.uri or "")
+        with tracing.span(
+            self.methodId or "http.request",
+            kind="api_call",
+            service=self.api_name,
+            method=self.methodId,
+            http_method=self.method,
+            location=location.group(1) if location else None,
+            retries=0,
+        ) as call:
+            return execute_with_retry(
+                lambda: super(ManagedHttpRequest, self).execute(http=http, num_retries=0),
+                api_name=self.api_name,
+                max_retries=num_retries or None,
+                description=self.methodId or self.uri,
+                idempotent=self.idempotent,
+                span=call,
+            )
@@ -1,14 +1,386 @@
-from data_fetcher import get_daily_metrics, get_posts, get_reviews, get_search_keywords
-
-
-def fetch_dashboard_data(credentials, location_id, account_id, start_date, end_date):
-    metrics_df = get_daily_metrics(credentials, location_id, start_date, end_date)
-    keywords_df = get_search_keywords(credentials, location_id, start_date, end_date)
-    reviews = get_reviews(credentials, location_id, account_id)
-    posts = get_posts(credentials, location_id, account_id)
-    return {
-        "metrics_df": metrics_df,
-        "keywords_df": keywords_df,
-        "reviews": reviews,
-        "posts": posts,
-    }
+import contextvars
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import pandas as pd
+
+from data_fetcher import (
+    backfill_daily_metrics,
+    get_daily_metrics,
+    get_location_details_batch,
+    get_media_batch,
+    get_posts,
+    get_questions_batch,
+    get_reviews,
+    get_reviews_batch,
+    get_search_keywords,
+)
+from health_check import analyze_profile_health
+from src.gmb_app.core import deadline, tracing
+from src.gmb_app.core.config import get_dashboard_budget_s, get_portfolio_workers
+from src.gmb_app.core.errors import DeadlineExceeded
+from src.gmb_app.core.logging import get_logger
+
+logger = get_logger("performance_service")
+
+PORTFOLIO_COLUMNS = ["location_id", "resource", "date", "metric", "value"]
+STAR_RATING_VALUES = {"ONE": 1, "TWO": 2, "THREE": 3, "FOUR": 4, "FIVE": 5}
+# Extra wait past the deadline for loaders finishing the call the deadline cut short
+DEADLINE_GRACE_S = 2.0
+
+
+# Dashboard resources in display order, with the span of the phase loading each
+DASHBOARD_RESOURCES = {
+    "metrics_df": "dashboard.metrics",
+    "keywords_df": "dashboard.keywords",
+    "reviews": "dashboard.reviews",
+    "posts": "dashboard.posts",
+}
+
+
+def _load_resource(key, credentials, location_id, account_id, start_date, end_date):
+    if key == "metrics_df":
+        return get_daily_metrics(credentials, location_id, start_date, end_date)
+    if key == "keywords_df":
+        return get_search_keywords(credentials, location_id, start_date, end_date)
+    if key == "reviews":
+        return get_reviews(credentials, location_id, account_id)
+    return get_posts(credentials, location_id, account_id)
+
+
+def _empty_resource(key):
+    return pd.DataFrame() if key.endswith("_df") else []
+
+
+class DashboardFetch:
+    """The four dashboard resources of one location, loading concurrently in the background.
+
+    Each resource becomes available as soon as its own calls finish, so a caller can
+    show daily trends while reviews are still paging. The whole load runs under one
+    deadline of `budget_s` seconds (GMB_DASHBOARD_BUDGET_S): calls are bounded by it
+    and none start once it has passed, so a resource left partial or empty by the
+    deadline is flagged in `incomplete` instead of holding up the dashboard.
+
+    Resources already loaded elsewhere (e.g. reviews synced in bulk) can be passed in
+    `preloaded` and are not fetched again.
+    """
+
+    def __init__(self, credentials, location_id, account_id, start_date, end_date, budget_s=None, preloaded=None):
+        self.location_id = location_id
+        self.deadline = deadline.start(budget_s or get_dashboard_budget_s())
+        self.incomplete = set()
+        self._args = (credentials, location_id, account_id, start_date, end_date)
+        self._futures = {key: Future() for key in DASHBOARD_RESOURCES}
+        for key, value in (preloaded or {}).items():
+            self._futures[key].set_result(value)
+        self._done = threading.Condition()
+        # Runs in a copy of the caller's context so dashboard.fetch nests under its spans
+        self._thread = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(self._run,),
+            name="dashboard-fetch",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self):
+        credentials, location_id, account_id, start_date, end_date = self._args
+        with tracing.span(
+            "dashboard.fetch",
+            location=location_id,
+            start_date=str(start_date),
+            end_date=str(end_date),
+        ) as fetch_span:
+            with ThreadPoolExecutor(max_workers=len(DASHBOARD_RESOURCES), thread_name_prefix="dashboard") as executor:
+                for key in DASHBOARD_RESOURCES:
+                    if not self.ready(key):
+                        executor.submit(contextvars.copy_context().run, self._load, key)
+            fetch_span.set(incomplete=",".join(sorted(self.incomplete)) or None)
+
+    def _load(self, key):
+        future = self._futures[key]
+        # Each resource gets its own view of the deadline to tell which ones were cut short
+        with deadline.use(self.deadline.child()) as budget, tracing.span(DASHBOARD_RESOURCES[key]) as phase:
+            try:
+                value = _load_resource(key, *self._args)
+            except Exception as e:
+                phase.fail(e)
+                value, error = None, e
+            else:
+                error = None
+            if budget.exceeded or budget.expired() or isinstance(error, DeadlineExceeded):
+                self.incomplete.add(key)
+                phase.set(incomplete=True)
+                if error is not None:
+                    value, error = _empty_resource(key), None
+        if error is None:
+            future.set_result(value)
+        else:
+            future.set_exception(error)
+        with self._done:
+            self._done.notify_all()
+
+    def ready(self, key):
+        return self._futures[key].done()
+
+    def done(self):
+        return all(future.done() for future in self._futures.values())
+
+    def is_incomplete(self, key):
+        return key in self.incomplete
+
+    def result(self, key, timeout=None):
+        """Returns a resource, waiting up to `timeout` seconds; re-raises its loading error."""
+        return self._futures[key].result(timeout)
+
+    def wait_any(self, keys, timeout=None):
+        """Blocks until one of `keys` is ready and returns the ready ones (empty on timeout)."""
+        with self._done:
+            self._done.wait_for(lambda: any(self.ready(key) for key in keys), timeout)
+        return [key for key in keys if self.ready(key)]
+
+    def results(self):
+        """Waits for every resource, at most until the deadline (plus a short grace).
+
+        Returns them keyed like DASHBOARD_RESOURCES, plus "incomplete": the sorted
+        keys that are partial or, if still loading, returned empty.
+        """
+        results = {}
+        for key in self._futures:
+            try:
+                results[key] = self.result(key, self.deadline.remaining_s() + DEADLINE_GRACE_S)
+            except FutureTimeoutError:
+                logger.warning(f"Dashboard {key} of {self.location_id} still loading after its deadline")
+                self.incomplete.add(key)
+                results[key] = _empty_resource(key)
+        # Let dashboard.fetch close so its span is exported before the caller moves on
+        self._thread.join(self.deadline.remaining_s() + DEADLINE_GRACE_S)
+        results["incomplete"] = sorted(self.incomplete)
+        return results
+
+
+def start_dashboard_fetch(credentials, location_id, account_id, start_date, end_date, budget_s=None, preloaded=None):
+    """Starts loading a location's dashboard in the background and returns its DashboardFetch."""
+    return DashboardFetch(
+        credentials, location_id, account_id, start_date, end_date, budget_s=budget_s, preloaded=preloaded
+    )
+
+
+def fetch_dashboard_data(credentials, location_id, account_id, start_date, end_date, budget_s=None, preloaded=None):
+    """Loads a location's dashboard, returning within `budget_s` seconds (GMB_DASHBOARD_BUDGET_S).
+
+    Resources the deadline cut short are listed under "incomplete".
+    """
+    fetch = start_dashboard_fetch(credentials, location_id, account_id, start_date, end_date, budget_s, preloaded)
+    return fetch.results()
+
+
+def _account_of(location_id):
+    if location_id.startswith("accounts/"):
+        return "/".join(location_id.split("/")[:2])
+    return None
+
+
+def iter_portfolio_data(credentials, location_ids, start_date, end_date, max_workers=None):
+    """Fetches the dashboard data of many locations, yielding each one as it completes.
+
+    Reviews of every location are first synced in bulk (batchGetReviews, a few
+    requests per account); then up to `max_workers` (GMB_PORTFOLIO_WORKERS) locations
+    fetch their other resources at once. Each yielded item is {"location_id", "data",
+    "error"}; a location that fails yields its error instead of stopping the others.
+    Closing the generator early cancels the locations not started yet.
+    """
+    location_ids = list(dict.fromkeys(location_ids))
+    if not location_ids:
+        return
+    max_workers = min(max_workers or get_portfolio_workers(), len(location_ids))
+
+    with tracing.span("portfolio.fetch", locations=len(location_ids), start_date=str(start_date), end_date=str(end_date)):
+        with tracing.span("portfolio.reviews"), deadline.within(get_dashboard_budget_s()):
+            reviews = get_reviews_batch(credentials, location_ids)
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gbp-portfolio")
+        try:
+            pending = {
+                # Each task runs in a copy of this context so its spans nest under portfolio.fetch
+                executor.submit(
+                    contextvars.copy_context().run,
+                    fetch_dashboard_data,
+                    credentials,
+                    location_id,
+                    _account_of(location_id),
+                    start_date,
+                    end_date,
+                    preloaded={"reviews": reviews.get(location_id, [])},
+                ): location_id
+                for location_id in location_ids
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    location_id = pending.pop(future)
+                    try:
+                        result = {"location_id": location_id, "data": future.result(), "error": None}
+                    except Exception as e:
+                        logger.warning(f"Could not fetch portfolio data for {location_id}: {e}")
+                        result = {"location_id": location_id, "data": None, "error": str(e)}
+                    yield result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def score_portfolio_health(credentials, results):
+    """Scores the profile health (0-100, the average of its checks) of each fetched location.
+
+    Reviews and posts come from the `iter_portfolio_data` results; profiles, media
+    and questions of all the locations are read in a few batch requests rather
+    than three calls per location. Locations whose profile could not be read are
+    left out.
+    """
+    fetched = {result["location_id"]: result["data"] for result in results if result["data"]}
+    if not fetched:
+        return {}
+
+    location_ids = list(fetched)
+    with tracing.span("portfolio.health", locations=len(location_ids)), deadline.within(get_dashboard_budget_s()):
+        details = get_location_details_batch(credentials, location_ids)
+        media = get_media_batch(credentials, location_ids)
+        questions = get_questions_batch(credentials, location_ids)
+
+    scores = {}
+    for location_id, data in fetched.items():
+        if not details.get(location_id):
+            continue
+        checks = analyze_profile_health(
+            details[location_id],
+            data.get("reviews") or [],
+            data.get("posts") or [],
+            media.get(location_id, []),
+            questions.get(location_id, []),
+        )
+        if checks:
+            scores[location_id] = round(sum(check["score"] for check in checks) / len(checks))
+    return scores
+
+
+def iter_metrics_backfill(credentials, location_ids, start_date=None, end_date=None):
+    """Backfills the daily metrics history of many locations, yielding each as it finishes.
+
+    Locations are backfilled one after another, each with its date-range chunks
+    fetched in parallel (see `backfill_daily_metrics`), so the number of calls in
+    flight stays at GMB_BACKFILL_WORKERS. Each yielded item is {"location_id",
+    "summary", "error"}. Running it again with the same credentials resumes from
+    the days still missing; other credentials start from their own, empty history.
+    """
+    with tracing.span("portfolio.backfill", locations=len(location_ids)):
+        for location_id in dict.fromkeys(location_ids):
+            try:
+                summary = backfill_daily_metrics(credentials, location_id, start_date, end_date)
+                result = {"location_id": location_id, "summary": summary, "error": None}
+            except Exception as e:
+                logger.warning(f"Could not backfill metrics of {location_id}: {e}")
+                result = {"location_id": location_id, "summary": None, "error": str(e)}
+            yield result
+
+
+def _metric_rows(location_id, metrics_df):
+    if metrics_df is None or metrics_df.empty:
+        return None
+    rows = metrics_df.melt(id_vars="date", var_name="metric", value_name="value")
+    rows["resource"] = "metrics"
+    rows["location_id"] = location_id
+    return rows
+
+
+def _keyword_rows(location_id, keywords_df):
+    if keywords_df is None or keywords_df.empty:
+        return None
+    return pd.DataFrame(
+        {
+            "location_id": location_id,
+            "resource": "keywords",
+            "date": pd.NaT,
+            "metric": keywords_df["keyword"],
+            "value": keywords_df["count"],
+        }
+    )
+
+
+def _dated_rows(location_id, resource, items, metric_of, value_of):
+    if not items:
+        return None
+    return pd.DataFrame(
+        {
+            "location_id": location_id,
+            "resource": resource,
+            "date": [item.get("createTime") for item in items],
+            "metric": [metric_of(item) for item in items],
+            "value": [value_of(item) for item in items],
+        }
+    )
+
+
+def build_portfolio_frame(results):
+    """Combines per-location dashboard data into one long-format DataFrame.
+
+    One row per (location_id, resource, date, metric, value):
+    - metrics: one row per day and daily metric
+    - keywords: one row per keyword (no date), value is its search count
+    - reviews: one row per review dated by createTime, metric STAR_RATING, value 1-5
+    - posts: one row per post dated by createTime, metric is its topicType, value 1
+
+    `results` are the items yielded by `iter_portfolio_data`; failed locations
+    contribute no rows.
+    """
+    frames = []
+    for result in results:
+        location_id, data = result["location_id"], result["data"]
+        if not data:
+            continue
+        frames.extend(
+            [
+                _metric_rows(location_id, data.get("metrics_df")),
+                _keyword_rows(location_id, data.get("keywords_df")),
+                _dated_rows(
+                    location_id,
+                    "reviews",
+                    data.get("reviews"),
+                    lambda review: "STAR_RATING",
+                    lambda review: STAR_RATING_VALUES.get(review.get("starRating")),
+                ),
+                _dated_rows(
+                    location_id,
+                    "posts",
+                    data.get("posts"),
+                    lambda post: post.get("topicType", "STANDARD"),
+                    lambda post: 1,
+                ),
+            ]
+        )
+
+    frames = [frame for frame in frames if frame is not None]
+    if not frames:
+        return pd.DataFrame(columns=PORTFOLIO_COLUMNS)
+
+    frame = pd.concat([frame.astype({"date": "object"}) for frame in frames], ignore_index=True)
+    # Reviews and posts carry RFC 3339 timestamps; reduce everything to naive UTC days
+    frame["date"] = pd.to_datetime(frame["date"], utc=True, format="mixed").dt.tz_localize(None).dt.normalize()
+    frame["value"] = pd.to_numeric(frame["value"])
+    return frame[PORTFOLIO_COLUMNS]
+
+
+def fetch_portfolio_data(credentials, location_ids, start_date, end_date, max_workers=None, on_result=None):
+    """Fetches many locations concurrently and returns their combined long-format DataFrame.
+
+    `on_result`, if given, is called with each item of `iter_portfolio_data` as soon
+    as its location completes (from the calling thread). Locations that failed are
+    listed in the frame's `attrs["failed_locations"]`.
+    """
+    results = []
+    for result in iter_portfolio_data(credentials, location_ids, start_date, end_date, max_workers=max_workers):
+        results.append(result)
+        if on_result:
+            on_result(result)
+    frame = build_portfolio_frame(results)
+    frame.attrs["failed_locations"] = {r["location_id"]: r["error"] for r in results if r["error"]}
+    return frame
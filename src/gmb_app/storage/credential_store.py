@@ -0,0 +1,92 @@
+import secrets
+import time
+
+from src.gmb_app.storage.db import connect
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS oauth_credentials (
+        identity TEXT PRIMARY KEY,
+        payload TEXT NOT NULL,
+        updated_at REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS credential_sessions (
+        session_id TEXT PRIMARY KEY,
+        identity TEXT NOT NULL,
+        created_at REAL NOT NULL
+    )
+    """,
+)
+
+
+def _ensure_schema(conn):
+    for statement in _SCHEMA:
+        conn.execute(statement)
+
+
+def save_credentials(identity, payload):
+    """Stores the latest authorized-user JSON of an identity."""
+    with connect() as conn:
+        _ensure_schema(conn)
+        conn.execute(
+            "INSERT OR REPLACE INTO oauth_credentials (identity, payload, updated_at) VALUES (?, ?, ?)",
+            (identity, payload, time.time()),
+        )
+
+
+def update_credentials(identity, payload):
+    """Replaces the stored JSON of an identity that still has a stored sign-in; no-op otherwise."""
+    with connect() as conn:
+        _ensure_schema(conn)
+        conn.execute(
+            "UPDATE oauth_credentials SET payload = ?, updated_at = ? WHERE identity = ?",
+            (payload, time.time(), identity),
+        )
+
+
+def create_session(identity):
+    """Returns a new opaque session id that can later be exchanged for the identity's credentials."""
+    session_id = secrets.token_urlsafe(32)
+    with connect() as conn:
+        _ensure_schema(conn)
+        conn.execute(
+            "INSERT INTO credential_sessions (session_id, identity, created_at) VALUES (?, ?, ?)",
+            (session_id, identity, time.time()),
+        )
+    return session_id
+
+
+def _delete_orphaned_credentials(conn):
+    conn.execute(
+        "DELETE FROM oauth_credentials WHERE identity NOT IN (SELECT identity FROM credential_sessions)"
+    )
+
+
+def load_session_credentials(session_id, max_age_s):
+    """Returns the stored credentials JSON behind a session id younger than `max_age_s`, or None.
+
+    Expired sessions (and credentials no session refers to anymore) are deleted on the way.
+    """
+    with connect() as conn:
+        _ensure_schema(conn)
+        conn.execute(
+            "DELETE FROM credential_sessions WHERE created_at < ?",
+            (time.time() - max_age_s,),
+        )
+        _delete_orphaned_credentials(conn)
+        row = conn.execute(
+            "SELECT c.payload FROM credential_sessions s "
+            "JOIN oauth_credentials c ON c.identity = s.identity WHERE s.session_id = ?",
+            (session_id,),
+        ).fetchone()
+    return row[0] if row else None
+
+
+def delete_session(session_id):
+    """Deletes a session, and the stored credentials once no other session uses them."""
+    with connect() as conn:
+        _ensure_schema(conn)
+        conn.execute("DELETE FROM credential_sessions WHERE session_id = ?", (session_id,))
+        _delete_orphaned_credentials(conn)
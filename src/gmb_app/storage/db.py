@@ -0,0 +1,114 @@
+import atexit
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import weakref
+from contextlib import contextmanager
+
+import pandas as pd
+
+from src.gmb_app.core.config import get_store_path
+from src.gmb_app.core.identity import credential_identity, is_persistent_identity
+
+_scratch_dir = None
+_scratch_lock = threading.Lock()
+_tracked_identities = set()
+
+
+@contextmanager
+def connect(path=None):
+    """Opens the local SQLite store, committing on success and rolling back on error.
+
+    Connections are short-lived so callers on different threads (and different
+    Streamlit server processes) never share one; WAL mode lets readers proceed
+    while another process writes.
+    """
+    db_path = path or get_store_path()
+    directory = os.path.dirname(db_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def _scratch_path():
+    """Returns this process's private store, removed when the process exits."""
+    global _scratch_dir
+    with _scratch_lock:
+        if _scratch_dir is None:
+            _scratch_dir = tempfile.mkdtemp(prefix="gmb_scratch_")
+            atexit.register(shutil.rmtree, _scratch_dir, ignore_errors=True)
+        return os.path.join(_scratch_dir, "scratch.sqlite3")
+
+
+def _purge_identity(identity):
+    """Deletes every scratch row of an identity once its credentials object is gone."""
+    with _scratch_lock:
+        _tracked_identities.discard(identity)
+    with connect(_scratch_path()) as conn:
+        tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        for table in tables:
+            columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            if "identity" in columns:
+                conn.execute(f"DELETE FROM {table} WHERE identity = ?", (identity,))
+
+
+def _track(credentials, identity):
+    with _scratch_lock:
+        if identity in _tracked_identities:
+            return
+        _tracked_identities.add(identity)
+    try:
+        # Not run at exit: the whole scratch directory is removed then
+        weakref.finalize(credentials, _purge_identity, identity).atexit = False
+    except TypeError:
+        # Objects that cannot be weakly referenced keep their rows until the process exits
+        pass
+
+
+def connect_scoped(credentials):
+    """Opens the store that holds rows of these credentials' identity.
+
+    Identities backed by a refresh token use the on-disk store. Token-only
+    credentials are keyed by id(), which a later object may reuse, so their rows
+    go to a process-private scratch store and are deleted when the object is
+    garbage collected; nothing of theirs reaches the on-disk store.
+    """
+    identity = credential_identity(credentials)
+    if is_persistent_identity(identity):
+        return connect()
+    _track(credentials, identity)
+    return connect(_scratch_path())
+
+
+def drop_unscoped_table(conn, table):
+    """Drops a table created before its rows were scoped by credential identity.
+
+    Such rows cannot be attributed to whoever fetched them, and every table holding
+    them is a cache the next sync refills.
+    """
+    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    if columns and "identity" not in columns:
+        conn.execute(f"DROP TABLE {table}")
+
+
+def epoch_seconds(timestamp):
+    """Epoch seconds of an RFC 3339 timestamp, for ordering; as text '...00.5Z' sorts before '...00Z'."""
+    if not timestamp:
+        return None
+    try:
+        return pd.Timestamp(timestamp).timestamp()
+    except ValueError:
+        return None
@@ -0,0 +1,85 @@
+import time
+
+from src.gmb_app.core.identity import credential_identity
+from src.gmb_app.storage.db import connect_scoped, drop_unscoped_table
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS monthly_keywords (
+        identity TEXT NOT NULL,
+        location_id TEXT NOT NULL,
+        month TEXT NOT NULL,
+        keyword TEXT NOT NULL,
+        value INTEGER,
+        threshold INTEGER,
+        PRIMARY KEY (identity, location_id, month, keyword)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS keyword_months (
+        identity TEXT NOT NULL,
+        location_id TEXT NOT NULL,
+        month TEXT NOT NULL,
+        fetched_at REAL NOT NULL,
+        PRIMARY KEY (identity, location_id, month)
+    )
+    """,
+)
+
+
+def _ensure_schema(conn):
+    for table in ("monthly_keywords", "keyword_months"):
+        drop_unscoped_table(conn, table)
+    for statement in _SCHEMA:
+        conn.execute(statement)
+
+
+def save_month(credentials, location_id, month, rows):
+    """Replaces the stored keywords of one 'YYYY-MM' month with (keyword, value, threshold) rows."""
+    identity = credential_identity(credentials)
+    with connect_scoped(credentials) as conn:
+        _ensure_schema(conn)
+        conn.execute(
+            "DELETE FROM monthly_keywords WHERE identity = ? AND location_id = ? AND month = ?",
+            (identity, location_id, month),
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO monthly_keywords "
+            "(identity, location_id, month, keyword, value, threshold) VALUES (?, ?, ?, ?, ?, ?)",
+            [(identity, location_id, month, keyword, value, threshold) for keyword, value, threshold in rows],
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO keyword_months (identity, location_id, month, fetched_at) VALUES (?, ?, ?, ?)",
+            (identity, location_id, month, time.time()),
+        )
+
+
+def fetched_months(credentials, location_id, months):
+    """Returns which of the given 'YYYY-MM' months have been stored for a location and these credentials."""
+    months = list(months)
+    if not months:
+        return set()
+    placeholders = ", ".join("?" for _ in months)
+    with connect_scoped(credentials) as conn:
+        _ensure_schema(conn)
+        rows = conn.execute(
+            "SELECT month FROM keyword_months "
+            f"WHERE identity = ? AND location_id = ? AND month IN ({placeholders})",
+            (credential_identity(credentials), location_id, *months),
+        ).fetchall()
+    return {row[0] for row in rows}
+
+
+def load_months(credentials, location_id, months):
+    """Returns stored (month, keyword, value, threshold) rows for the given months."""
+    months = list(months)
+    if not months:
+        return []
+    placeholders = ", ".join("?" for _ in months)
+    with connect_scoped(credentials) as conn:
+        _ensure_schema(conn)
+        return conn.execute(
+            "SELECT month, keyword, value, threshold FROM monthly_keywords "
+            f"WHERE identity = ? AND location_id = ? AND month IN ({placeholders}) ORDER BY month",
+            (credential_identity(credentials), location_id, *months),
+        ).fetchall()
@@ -0,0 +1,83 @@
+import time
+
+from src.gmb_app.core.identity import credential_identity
+from src.gmb_app.storage.db import connect_scoped
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS location_accounts (
+    identity TEXT NOT NULL,
+    location_id TEXT NOT NULL,
+    account_name TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (identity, location_id)
+)
+"""
+
+
+def _split_location_name(location_name):
+    """Splits 'accounts/{a}/locations/{l}' into ('accounts/{a}', '{l}'), else (None, None)."""
+    parts = location_name.split("/")
+    if len(parts) >= 4 and parts[0] == "accounts" and parts[2] == "locations":
+        return f"accounts/{parts[1]}", parts[3]
+    return None, None
+
+
+def _location_id(location_name):
+    if location_name.startswith("accounts/"):
+        return _split_location_name(location_name)[1]
+    if location_name.startswith("locations/"):
+        return location_name.split("/", 1)[1]
+    return location_name
+
+
+def record_locations(credentials, location_names, account_name=None):
+    """Stores the account parent of every fully-qualified location name.
+
+    When `account_name` is given, the names are the complete listing of that account,
+    so index entries for locations no longer under it are dropped.
+    """
+    identity = credential_identity(credentials)
+    now = time.time()
+    rows = []
+    for location_name in location_names:
+        parent, location_id = _split_location_name(location_name)
+        if parent:
+            rows.append((identity, location_id, parent, now))
+
+    with connect_scoped(credentials) as conn:
+        conn.execute(_SCHEMA)
+        conn.executemany(
+            "INSERT OR REPLACE INTO location_accounts "
+            "(identity, location_id, account_name, updated_at) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        if account_name:
+            conn.execute(
+                "DELETE FROM location_accounts "
+                "WHERE identity = ? AND account_name = ? AND updated_at < ?",
+                (identity, account_name, now),
+            )
+
+
+def lookup_location_parent(credentials, location_name):
+    """Returns 'accounts/{a}/locations/{l}' for a known location, or None."""
+    location_id = _location_id(location_name)
+    with connect_scoped(credentials) as conn:
+        conn.execute(_SCHEMA)
+        row = conn.execute(
+            "SELECT account_name FROM location_accounts WHERE identity = ? AND location_id = ?",
+            (credential_identity(credentials), location_id),
+        ).fetchone()
+    if not row:
+        return None
+    return f"{row[0]}/locations/{location_id}"
+
+
+def forget_location(credentials, location_name):
+    """Drops a location from the index, e.g. after its indexed parent stopped working."""
+    with connect_scoped(credentials) as conn:
+        conn.execute(_SCHEMA)
+        conn.execute(
+            "DELETE FROM location_accounts WHERE identity = ? AND location_id = ?",
+            (credential_identity(credentials), _location_id(location_name)),
+        )
@@ -0,0 +1,79 @@
+import time
+
+from src.gmb_app.core.identity import credential_identity
+from src.gmb_app.storage.db import connect_scoped, drop_unscoped_table
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_metrics (
+    identity TEXT NOT NULL,
+    location_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (identity, location_id, date, metric)
+)
+"""
+
+
+def _ensure_schema(conn):
+    drop_unscoped_table(conn, "daily_metrics")
+    conn.execute(_SCHEMA)
+
+
+def save_daily_values(credentials, location_id, rows):
+    """Upserts (date 'YYYY-MM-DD', metric, value) rows fetched with these credentials.
+
+    A row is written for every fetched day and metric, zero included, so the
+    presence of a row means "this day was fetched" even when Google reported nothing.
+    Rows are only ever served back to the same credentials identity.
+    """
+    identity = credential_identity(credentials)
+    now = time.time()
+    with connect_scoped(credentials) as conn:
+        _ensure_schema(conn)
+        conn.executemany(
+            "INSERT OR REPLACE INTO daily_metrics "
+            "(identity, location_id, date, metric, value, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+            [(identity, location_id, day, metric, int(value), now) for day, metric, value in rows],
+        )
+
+
+def _metric_placeholders(metrics):
+    return ", ".join("?" for _ in metrics)
+
+
+def complete_dates(credentials, location_id, start_date, end_date, metrics):
+    """Returns the 'YYYY-MM-DD' days in range that have a stored value for every metric."""
+    metrics = list(metrics)
+    with connect_scoped(credentials) as conn:
+        _ensure_schema(conn)
+        rows = conn.execute(
+            "SELECT date FROM daily_metrics "
+            "WHERE identity = ? AND location_id = ? AND date BETWEEN ? AND ? "
+            f"AND metric IN ({_metric_placeholders(metrics)}) "
+            "GROUP BY date HAVING COUNT(*) = ?",
+            (
+                credential_identity(credentials),
+                location_id,
+                start_date.isoformat(),
+                end_date.isoformat(),
+                *metrics,
+                len(metrics),
+            ),
+        ).fetchall()
+    return {row[0] for row in rows}
+
+
+def load_daily_values(credentials, location_id, start_date, end_date, metrics):
+    """Returns stored (date, metric, value) rows for a location and date range."""
+    metrics = list(metrics)
+    with connect_scoped(credentials) as conn:
+        _ensure_schema(conn)
+        return conn.execute(
+            "SELECT date, metric, value FROM daily_metrics "
+            "WHERE identity = ? AND location_id = ? AND date BETWEEN ? AND ? "
+            f"AND metric IN ({_metric_placeholders(metrics)}) "
+            "ORDER BY date",
+            (credential_identity(credentials), location_id, start_date.isoformat(), end_date.isoformat(), *metrics),
+        ).fetchall()
@@ -0,0 +1,118 @@
+import json
+import time
+
+from src.gmb_app.core.identity import credential_identity
+from src.gmb_app.storage.db import connect_scoped, drop_unscoped_table, epoch_seconds
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS local_posts (
+        identity TEXT NOT NULL,
+        location_id TEXT NOT NULL,
+        post_name TEXT NOT NULL,
+        create_time TEXT,
+        create_ts REAL,
+        payload TEXT NOT NULL,
+        synced_at REAL NOT NULL,
+        PRIMARY KEY (identity, location_id, post_name)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS post_insights (
+        identity TEXT NOT NULL,
+        location_id TEXT NOT NULL,
+        post_name TEXT NOT NULL,
+        metrics TEXT NOT NULL,
+        fetched_at REAL NOT NULL,
+        PRIMARY KEY (identity, location_id, post_name)
+    )
+    """,
+)
+
+
+def _ensure_schema(conn):
+    for table in ("local_posts", "post_insights"):
+        drop_unscoped_table(conn, table)
+    for statement in _SCHEMA:
+        conn.execute(statement)
+
+
+def save_posts(credentials, location_id, posts):
+    """Upserts local posts of a location fetched with these credentials, keyed by post name."""
+    identity = credential_identity(credentials)
+    now = time.time()
+    rows = [
+        (
+            identity,
+            location_id,
+            post["name"],
+            post.get("createTime"),
+            epoch_seconds(post.get("createTime")),
+            json.dumps(post),
+            now,
+        )
+        for post in posts
+        if post.get("name")
+    ]
+    with connect_scoped(credentials) as conn:
+        _ensure_schema(conn)
+        conn.executemany(
+            "INSERT OR REPLACE INTO local_posts "
+            "(identity, location_id, post_name, create_time, create_ts, payload, synced_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+
+def load_posts(credentials, location_id):
+    """Returns every post of a location stored for these credentials, newest first."""
+    with connect_scoped(credentials) as conn:
+        _ensure_schema(conn)
+        rows = conn.execute(
+            "SELECT payload FROM local_posts WHERE identity = ? AND location_id = ? ORDER BY create_ts DESC",
+            (credential_identity(credentials), location_id),
+        ).fetchall()
+    return [json.loads(row[0]) for row in rows]
+
+
+def delete_posts_synced_before(credentials, location_id, synced_before):
+    """Removes posts (and their insights) a sync did not see again (deleted on Google's side)."""
+    identity = credential_identity(credentials)
+    with connect_scoped(credentials) as conn:
+        _ensure_schema(conn)
+        conn.execute(
+            "DELETE FROM post_insights WHERE identity = ? AND location_id = ? AND post_name IN "
+            "(SELECT post_name FROM local_posts WHERE identity = ? AND location_id = ? AND synced_at < ?)",
+            (identity, location_id, identity, location_id, synced_before),
+        )
+        conn.execute(
+            "DELETE FROM local_posts WHERE identity = ? AND location_id = ? AND synced_at < ?",
+            (identity, location_id, synced_before),
+        )
+
+
+def save_insights(credentials, location_id, insights):
+    """Stores {post name: {metric: value}} insights of a location's posts."""
+    identity = credential_identity(credentials)
+    now = time.time()
+    with connect_scoped(credentials) as conn:
+        _ensure_schema(conn)
+        conn.executemany(
+            "INSERT OR REPLACE INTO post_insights "
+            "(identity, location_id, post_name, metrics, fetched_at) VALUES (?, ?, ?, ?, ?)",
+            [
+                (identity, location_id, post_name, json.dumps(metrics), now)
+                for post_name, metrics in insights.items()
+            ],
+        )
+
+
+def load_insights(credentials, location_id):
+    """Returns {post name: {"metrics": {metric: value}, "fetched_at": epoch seconds}} of a location."""
+    with connect_scoped(credentials) as conn:
+        _ensure_schema(conn)
+        rows = conn.execute(
+            "SELECT post_name, metrics, fetched_at FROM post_insights WHERE identity = ? AND location_id = ?",
+            (credential_identity(credentials), location_id),
+        ).fetchall()
+    return {row[0]: {"metrics": json.loads(row[1]), "fetched_at": row[2]} for row in rows}
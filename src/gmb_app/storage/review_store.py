@@ -0,0 +1,153 @@
+import json
+import time
+
+from src.gmb_app.core.identity import credential_identity
+from src.gmb_app.storage.db import connect_scoped, drop_unscoped_table, epoch_seconds
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS reviews (
+        identity TEXT NOT NULL,
+        location_id TEXT NOT NULL,
+        review_name TEXT NOT NULL,
+        update_time TEXT,
+        update_ts REAL,
+        payload TEXT NOT NULL,
+        synced_at REAL NOT NULL,
+        PRIMARY KEY (identity, location_id, review_name)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS review_sync_state (
+        identity TEXT NOT NULL,
+        location_id TEXT NOT NULL,
+        last_update_time TEXT,
+        total_review_count INTEGER,
+        average_rating REAL,
+        synced_at REAL NOT NULL,
+        full_synced_at REAL,
+        PRIMARY KEY (identity, location_id)
+    )
+    """,
+)
+
+
+def _ensure_schema(conn):
+    for table in ("reviews", "review_sync_state"):
+        drop_unscoped_table(conn, table)
+    for statement in _SCHEMA:
+        conn.execute(statement)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(review_sync_state)")}
+    if "full_synced_at" not in columns:
+        conn.execute("ALTER TABLE review_sync_state ADD COLUMN full_synced_at REAL")
+
+
+def save_reviews(credentials, location_id, reviews):
+    """Upserts reviews of a location fetched with these credentials, keyed by review name."""
+    identity = credential_identity(credentials)
+    now = time.time()
+    rows = [
+        (
+            identity,
+            location_id,
+            review["name"],
+            review.get("updateTime"),
+            epoch_seconds(review.get("updateTime")),
+            json.dumps(review),
+            now,
+        )
+        for review in reviews
+        if review.get("name")
+    ]
+    with connect_scoped(credentials) as conn:
+        _ensure_schema(conn)
+        conn.executemany(
+            "INSERT OR REPLACE INTO reviews "
+            "(identity, location_id, review_name, update_time, update_ts, payload, synced_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+
+def load_reviews(credentials, location_id):
+    """Returns every review of a location stored for these credentials, most recently updated first."""
+    with connect_scoped(credentials) as conn:
+        _ensure_schema(conn)
+        rows = conn.execute(
+            "SELECT payload FROM reviews WHERE identity = ? AND location_id = ? ORDER BY update_ts DESC",
+            (credential_identity(credentials), location_id),
+        ).fetchall()
+    return [json.loads(row[0]) for row in rows]
+
+
+def count_reviews(credentials, location_id):
+    """Returns how many reviews of a location are stored for these credentials."""
+    with connect_scoped(credentials) as conn:
+        _ensure_schema(conn)
+        return conn.execute(
+            "SELECT COUNT(*) FROM reviews WHERE identity = ? AND location_id = ?",
+            (credential_identity(credentials), location_id),
+        ).fetchone()[0]
+
+
+def delete_reviews_synced_before(credentials, location_id, synced_before):
+    """Removes reviews a full sync did not see again (deleted on Google's side)."""
+    with connect_scoped(credentials) as conn:
+        _ensure_schema(conn)
+        conn.execute(
+            "DELETE FROM reviews WHERE identity = ? AND location_id = ? AND synced_at < ?",
+            (credential_identity(credentials), location_id, synced_before),
+        )
+
+
+def get_sync_state(credentials, location_id):
+    """Returns the last sync watermark and totals for a location, or None if never synced."""
+    with connect_scoped(credentials) as conn:
+        _ensure_schema(conn)
+        row = conn.execute(
+            "SELECT last_update_time, total_review_count, average_rating, synced_at, full_synced_at "
+            "FROM review_sync_state WHERE identity = ? AND location_id = ?",
+            (credential_identity(credentials), location_id),
+        ).fetchone()
+    if not row:
+        return None
+    return {
+        "last_update_time": row[0],
+        "total_review_count": row[1],
+        "average_rating": row[2],
+        "synced_at": row[3],
+        "full_synced_at": row[4],
+    }
+
+
+def save_sync_state(
+    credentials,
+    location_id,
+    last_update_time,
+    total_review_count=None,
+    average_rating=None,
+    full_synced_at=None,
+):
+    """Records a completed sync; `full_synced_at` is kept from the previous state unless given."""
+    with connect_scoped(credentials) as conn:
+        _ensure_schema(conn)
+        conn.execute(
+            "INSERT INTO review_sync_state "
+            "(identity, location_id, last_update_time, total_review_count, average_rating, synced_at, full_synced_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (identity, location_id) DO UPDATE SET "
+            "last_update_time = excluded.last_update_time, "
+            "total_review_count = excluded.total_review_count, "
+            "average_rating = excluded.average_rating, "
+            "synced_at = excluded.synced_at, "
+            "full_synced_at = COALESCE(excluded.full_synced_at, review_sync_state.full_synced_at)",
+            (
+                credential_identity(credentials),
+                location_id,
+                last_update_time,
+                total_review_count,
+                average_rating,
+                time.time(),
+                full_synced_at,
+            ),
+        )
@@ -0,0 +1,334 @@
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from google.oauth2.credentials import Credentials
+
+from src.gmb_app.core.cache import clear_cache
+from src.gmb_app.core.config import DEFAULT_API_QPM
+from src.gmb_app.integrations.client_registry import clear_services
+from src.gmb_app.integrations.request_executor import reset_buckets
+from src.gmb_app.testing.fake_google_api import STAR_RATINGS, FakeGoogleApi
+
+# Dataset sizes per profile; `large` reproduces our biggest clients
+PROFILES = {
+    "smoke": {
+        "locations": 5,
+        "reviews": 200,
+        "fetched_reviews": 100,
+        "metric_days": 60,
+        "posts": 20,
+        "keywords": 50,
+        "latency_ms": 0.0,
+        "repeats": 1,
+    },
+    "default": {
+        "locations": 500,
+        "reviews": 20_000,
+        "fetched_reviews": 1_000,
+        "metric_days": 730,
+        "posts": 200,
+        "keywords": 500,
+        "latency_ms": 20.0,
+        "repeats": 3,
+    },
+    "large": {
+        "locations": 5_000,
+        "reviews": 1_000_000,
+        "fetched_reviews": 10_000,
+        "metric_days": 3 * 365,
+        "posts": 2_000,
+        "keywords": 5_000,
+        "latency_ms": 50.0,
+        "repeats": 3,
+    },
+}
+DEFAULT_THRESHOLD = 0.25
+# Regressions smaller than this are timer noise, whatever their ratio
+MIN_REGRESSION_MS = 5.0
+LOCATIONS_PER_ACCOUNT = 100
+# Locations fetched together by the portfolio benchmark
+PORTFOLIO_LOCATIONS = 20
+
+
+def _timestamp(moment):
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def build_reviews(count):
+    now = datetime.now(timezone.utc)
+    reviews = []
+    for index in range(count):
+        update_time = _timestamp(now - timedelta(minutes=17 * index))
+        review = {
+            "name": f"accounts/100/locations/10000/reviews/r{index}",
+            "starRating": STAR_RATINGS[(index * 7) % 5],
+            "createTime": update_time,
+            "updateTime": update_time,
+        }
+        if index % 3:
+            review["comment"] = f"Synthetic review {index}"
+        if index % 4 == 0:
+            review["reviewReply"] = {"comment": "Thanks!", "updateTime": update_time}
+        reviews.append(review)
+    return reviews
+
+
+def build_posts(count):
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "name": f"accounts/100/locations/10000/localPosts/p{index}",
+            "summary": f"Synthetic post {index}",
+            "topicType": ("STANDARD", "OFFER", "EVENT")[index % 3],
+            "state": "LIVE" if index % 10 else "REJECTED",
+            "createTime": _timestamp(now - timedelta(days=index)),
+            "insights": {"LOCAL_POST_VIEWS_SEARCH": index * 7 % 300, "LOCAL_POST_ACTIONS_CALL_TO_ACTION": index % 30},
+        }
+        for index in range(count)
+    ]
+
+
+def build_metrics_frame(days, end_date=None):
+    from data_fetcher import DAILY_METRICS, build_daily_metrics_frame
+
+    end_date = end_date or date.today()
+    start_date = end_date - timedelta(days=days - 1)
+    series = {}
+    for m, metric in enumerate(DAILY_METRICS):
+        dated_values = []
+        for index in range(days):
+            day = start_date + timedelta(days=index)
+            entry = {"date": {"year": day.year, "month": day.month, "day": day.day}}
+            if (index + m) % 7:
+                entry["value"] = str((index * 31 + m * 17) % 250)
+            dated_values.append(entry)
+        series[metric] = dated_values
+    return build_daily_metrics_frame(series)
+
+
+def build_keywords_frame(count):
+    import pandas as pd
+
+    counts = [(count - index) * 3 + 15 for index in range(count)]
+    return pd.DataFrame(
+        {
+            "keyword": [f"keyword {index}" for index in range(count)],
+            "count": counts,
+            "display_count": [f"< {value}" if index % 9 == 0 else str(value) for index, value in enumerate(counts)],
+        }
+    )
+
+
+def build_location_details():
+    return FakeGoogleApi()._location("10000")
+
+
+def measure(func, repeats, setup=None):
+    """Runs `func(*setup())` `repeats` times and returns timing stats in milliseconds."""
+    timings = []
+    for _ in range(repeats):
+        args = setup() if setup else ()
+        started = time.perf_counter()
+        func(*args)
+        timings.append((time.perf_counter() - started) * 1000.0)
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "max_ms": round(max(timings), 3),
+        "repeats": repeats,
+    }
+
+
+@contextlib.contextmanager
+def offline_environment(api, cache_dir):
+    """Points the app at a running stand-in server, with its own store and no rate limits."""
+    overrides = {
+        "GMB_GOOGLE_API_ENDPOINT": api.url,
+        "GMB_CACHE_DIR": cache_dir,
+        "GMB_QUOTA_GOVERNOR": "process",
+        **{f"GMB_QPM_{api_name.upper()}": "1000000" for api_name in DEFAULT_API_QPM},
+    }
+    previous = {name: os.environ.get(name) for name in [*overrides, "GMB_STORE_PATH"]}
+    os.environ.update(overrides)
+    os.environ.pop("GMB_STORE_PATH", None)
+    reset_buckets()
+    clear_services()
+    clear_cache()
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        reset_buckets()
+        clear_services()
+        clear_cache()
+
+
+def _fetch_benchmarks(sizes, repeats):
+    import data_fetcher
+    from src.gmb_app.services.performance_service import fetch_dashboard_data, fetch_portfolio_data
+
+    results = {}
+    accounts = max(1, -(-sizes["locations"] // LOCATIONS_PER_ACCOUNT))
+    api = FakeGoogleApi(
+        accounts=accounts,
+        locations_per_account=min(sizes["locations"], LOCATIONS_PER_ACCOUNT),
+        reviews_per_location=sizes["fetched_reviews"],
+        posts_per_location=20,
+        latency_ms=sizes["latency_ms"],
+    )
+    credentials = Credentials(token="benchmark")
+    end_date = date.today() - timedelta(days=3)
+    start_date = end_date - timedelta(days=sizes["metric_days"] - 1)
+    location_name = f"accounts/100/locations/{api.location_ids()[0]}"
+    portfolio = api.location_names()[:PORTFOLIO_LOCATIONS]
+
+    with api, tempfile.TemporaryDirectory() as workdir:
+        run = {"count": 0}
+
+        def cold_store():
+            # Fresh store and empty caches: the first dashboard load of a location
+            run["count"] += 1
+            os.environ["GMB_CACHE_DIR"] = os.path.join(workdir, f"cold-{run['count']}")
+            clear_cache()
+            return ()
+
+        with offline_environment(api, os.path.join(workdir, "warm")):
+            results["fetch_dashboard_data.cold"] = measure(
+                lambda: fetch_dashboard_data(credentials, location_name, "accounts/100", start_date, end_date),
+                repeats,
+                setup=cold_store,
+            )
+            # Store already filled, memory cache empty: a dashboard load after a restart
+            results["fetch_dashboard_data.warm_store"] = measure(
+                lambda: fetch_dashboard_data(credentials, location_name, "accounts/100", start_date, end_date),
+                repeats,
+                setup=lambda: clear_cache() or (),
+            )
+            results["fetch_dashboard_data.memory_cache"] = measure(
+                lambda: fetch_dashboard_data(credentials, location_name, "accounts/100", start_date, end_date),
+                repeats,
+            )
+            results["fetch_portfolio_data.cold"] = measure(
+                lambda: fetch_portfolio_data(credentials, portfolio, start_date, end_date),
+                repeats,
+                setup=cold_store,
+            )
+            results["get_all_accessible_locations"] = measure(
+                lambda: data_fetcher.get_all_accessible_locations(credentials),
+                repeats,
+            )
+    return results
+
+
+def _render_benchmarks(sizes, repeats):
+    import health_check
+    import report_generator
+    import visualizations
+
+    results = {}
+    metrics_df = build_metrics_frame(sizes["metric_days"])
+    keywords_df = build_keywords_frame(sizes["keywords"])
+    reviews = build_reviews(sizes["reviews"])
+    posts = build_posts(sizes["posts"])
+    location_details = build_location_details()
+    media_items = [{"name": f"media/m{index}", "mediaFormat": "PHOTO"} for index in range(20)]
+    questions = [{"name": f"questions/q{index}", "totalAnswerCount": index % 2} for index in range(20)]
+
+    results["health_check.analyze_profile_health"] = measure(
+        lambda: health_check.analyze_profile_health(location_details, reviews, posts, media_items, questions),
+        repeats,
+    )
+    results["visualizations.plot_top_keywords"] = measure(lambda: visualizations.plot_top_keywords(keywords_df), repeats)
+    results["visualizations.plot_platform_breakdown"] = measure(
+        lambda: visualizations.plot_platform_breakdown(metrics_df), repeats
+    )
+    results["visualizations.plot_review_sentiment"] = measure(
+        lambda: visualizations.plot_review_sentiment(reviews), repeats
+    )
+    results["visualizations.plot_post_performance"] = measure(
+        lambda: visualizations.plot_post_performance(posts), repeats
+    )
+
+    def generate_pdf():
+        path = report_generator.generate_pdf(metrics_df, keywords_df, metrics_df["date"].min(), metrics_df["date"].max())
+        os.remove(path)
+
+    results["report_generator.generate_pdf"] = measure(generate_pdf, repeats)
+    return results
+
+
+def run_benchmarks(profile="default", repeats=None, include_fetch=True):
+    """Runs every benchmark of a profile and returns the JSON-serializable report."""
+    sizes = PROFILES[profile]
+    repeats = repeats or sizes["repeats"]
+    results = {}
+    if include_fetch:
+        results.update(_fetch_benchmarks(sizes, repeats))
+    results.update(_render_benchmarks(sizes, repeats))
+    return {
+        "profile": profile,
+        "sizes": sizes,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": _timestamp(datetime.now(timezone.utc)),
+        "results": results,
+    }
+
+
+def compare(report, baseline, threshold=DEFAULT_THRESHOLD, min_regression_ms=MIN_REGRESSION_MS):
+    """Returns the benchmarks whose median got slower than the baseline by more than `threshold`."""
+    regressions = []
+    for name, current in report["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous:
+            continue
+        before, after = previous["median_ms"], current["median_ms"]
+        if after - before > min_regression_ms and after > before * (1 + threshold):
+            regressions.append({"name": name, "baseline_ms": before, "current_ms": after, "ratio": round(after / before, 2)})
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the dashboard fetch and render pipeline on synthetic data.")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="default")
+    parser.add_argument("--repeats", type=int, default=None)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed slowdown ratio (0.25 = 25%%)")
+    parser.add_argument("--skip-fetch", action="store_true", help="Only time the in-memory render steps")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.profile, repeats=args.repeats, include_fetch=not args.skip_fetch)
+    for name, stats in report["results"].items():
+        print(f"{name:45s} median {stats['median_ms']:10.2f} ms   min {stats['min_ms']:10.2f} ms")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['name']}: {regression['baseline_ms']:.2f} ms -> "
+                f"{regression['current_ms']:.2f} ms (x{regression['ratio']})"
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
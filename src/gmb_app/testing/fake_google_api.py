@@ -0,0 +1,833 @@
+import argparse
+import email
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from googleapiclient.discovery_cache import get_static_doc
+
+from src.gmb_app.testing import mybusiness_v4
+
+STAR_RATINGS = ["ONE", "TWO", "THREE", "FOUR", "FIVE"]
+_BATCH_PATH = re.compile(r"^(?P<api>[^/]+)/batch(/.*)?$")
+# Maximum page sizes enforced by the real APIs
+MAX_PAGE_SIZES = {
+    "accounts": 20,
+    "locations": 100,
+    "keywords": 100,
+    "reviews": 50,
+    "batch_reviews": 50,
+    "posts": 100,
+    "media": 100,
+    "questions": 10,
+    "files": 1000,
+}
+# Calls allowed in one batch request (https://developers.google.com/drive/api/guides/performance#batch)
+MAX_BATCH_SIZES = {"default": 1000, "drive": 100}
+ERROR_MESSAGES = {
+    429: ("RESOURCE_EXHAUSTED", "rateLimitExceeded", "Quota exceeded for quota metric 'Requests'."),
+    500: ("INTERNAL", "backendError", "Internal error encountered."),
+    503: ("UNAVAILABLE", "backendError", "The service is currently unavailable."),
+}
+
+
+class FakeApiError(Exception):
+    def __init__(self, status, message, reason="badRequest", status_name="INVALID_ARGUMENT"):
+        super().__init__(message)
+        self.status = status
+        self.reason = reason
+        self.status_name = status_name
+
+    def payload(self):
+        return {
+            "error": {
+                "code": self.status,
+                "message": str(self),
+                "status": self.status_name,
+                "errors": [{"message": str(self), "domain": "global", "reason": self.reason}],
+            }
+        }
+
+
+def _not_found(what):
+    return FakeApiError(404, f"Requested entity was not found: {what}", "notFound", "NOT_FOUND")
+
+
+def _timestamp(moment):
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _page(items, page_size, page_token, max_page_size):
+    """Slices `items` (a sequence or a (count, item_at) pair) into one page and its next token."""
+    size = min(int(page_size or max_page_size), max_page_size)
+    offset = int(page_token or 0)
+    if isinstance(items, tuple):
+        count, item_at = items
+        page = [item_at(index) for index in range(offset, min(offset + size, count))]
+    else:
+        count = len(items)
+        page = list(items[offset:offset + size])
+    next_offset = offset + size
+    return page, (str(next_offset) if next_offset < count else None)
+
+
+class FakeGoogleApi:
+    """Local stand-in for the Google Business Profile and Drive APIs.
+
+    Serves discovery documents rooted at itself plus deterministic fake data:
+    accounts, locations, daily metrics, search keywords, reviews, posts, media,
+    questions and Drive folders/files. Latency, error rate and page-size caps are
+    configurable so tests and benchmarks can reproduce production load shapes
+    without the network.
+
+    Point the app at it with GMB_GOOGLE_API_ENDPOINT=<url> and any credentials;
+    access tokens are not checked. Every API is served under /<api name>/, e.g.
+    <url>/mybusiness/v4/accounts/100/locations/10000/reviews.
+    """
+
+    def __init__(
+        self,
+        accounts=1,
+        locations_per_account=3,
+        reviews_per_location=30,
+        posts_per_location=5,
+        media_per_location=4,
+        questions_per_location=3,
+        keywords_per_month=25,
+        drive_folders=3,
+        latency_ms=0.0,
+        jitter_ms=0.0,
+        error_rate=0.0,
+        error_statuses=(503,),
+        max_page_size=None,
+        seed=0,
+        host="127.0.0.1",
+        port=0,
+    ):
+        self.accounts = accounts
+        self.locations_per_account = locations_per_account
+        self.reviews_per_location = reviews_per_location
+        self.posts_per_location = posts_per_location
+        self.media_per_location = media_per_location
+        self.questions_per_location = questions_per_location
+        self.keywords_per_month = keywords_per_month
+        self.drive_folders = drive_folders
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.max_page_size = max_page_size
+        self.seed = seed
+        self.host = host
+        self.port = port
+
+        self.now = datetime.now(timezone.utc).replace(microsecond=0)
+        self.request_counts = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._created_posts = {}
+        self._created_media = {}
+        self._files = {}
+        self._server = None
+        self._thread = None
+        self._routes = self._build_routes()
+
+    # -- lifecycle ----------------------------------------------------------------
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._server.daemon_threads = True
+        self._server.app = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-google-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # -- dataset ------------------------------------------------------------------
+
+    def account_ids(self):
+        return [str(100 + a) for a in range(self.accounts)]
+
+    def location_ids(self, account_id=None):
+        accounts = [account_id] if account_id else self.account_ids()
+        return [
+            str(10_000 + (int(a) - 100) * self.locations_per_account + n)
+            for a in accounts
+            for n in range(self.locations_per_account)
+        ]
+
+    def account_of(self, location_id):
+        index = int(location_id) - 10_000
+        if index < 0 or index >= self.accounts * self.locations_per_account:
+            raise _not_found(f"locations/{location_id}")
+        return str(100 + index // self.locations_per_account)
+
+    def location_names(self):
+        """Returns the v4 'accounts/{a}/locations/{l}' name of every location."""
+        return [f"accounts/{self.account_of(lid)}/locations/{lid}" for lid in self.location_ids()]
+
+    def _noise(self, *parts):
+        return zlib.crc32(":".join(str(part) for part in (self.seed, *parts)).encode())
+
+    def _location(self, location_id):
+        self.account_of(location_id)
+        n = int(location_id)
+        location = {
+            "name": f"locations/{location_id}",
+            "title": f"Fake Business {location_id}",
+            "storefrontAddress": {
+                "regionCode": "BR",
+                "postalCode": f"{n % 90000 + 10000}-000",
+                "administrativeArea": "SP",
+                "locality": "São Paulo",
+                "addressLines": [f"Rua Exemplo, {n % 1000}"],
+            },
+            "phoneNumbers": {"primaryPhone": f"+55 11 9{n % 10000:04d}-{n % 9000 + 1000}"},
+            "categories": {"primaryCategory": {"name": "categories/gcid:restaurant", "displayName": "Restaurant"}},
+            "regularHours": {
+                "periods": [
+                    {"openDay": day, "openTime": {"hours": 9}, "closeDay": day, "closeTime": {"hours": 18}}
+                    for day in ("MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY")
+                ]
+            },
+            "openInfo": {"status": "OPEN", "canReopen": True},
+            "profile": {"description": f"Fake business number {location_id} used for offline tests."},
+        }
+        # Leave gaps in some profiles so health checks have something to find
+        if n % 5 == 0:
+            location["websiteUri"] = f"https://business-{location_id}.example.com"
+        if n % 3 == 0:
+            del location["regularHours"]
+        return location
+
+    def _review(self, account_id, location_id, index):
+        noise = self._noise("review", location_id, index)
+        update_time = self.now - timedelta(hours=6 * (index + 1))
+        review = {
+            "name": f"accounts/{account_id}/locations/{location_id}/reviews/r{index}",
+            "reviewId": f"r{index}",
+            "reviewer": {"displayName": f"Reviewer {noise % 997}"},
+            "starRating": STAR_RATINGS[min(4, noise % 7)],
+            "createTime": _timestamp(update_time - timedelta(hours=noise % 48)),
+            "updateTime": _timestamp(update_time),
+        }
+        if noise % 4:
+            review["comment"] = f"Fake review {index} of location {location_id}."
+        if noise % 3 == 0:
+            review["reviewReply"] = {"comment": "Thanks!", "updateTime": _timestamp(update_time)}
+        return review
+
+    def _post(self, account_id, location_id, index):
+        create_time = self.now - timedelta(days=7 * index + 1)
+        return {
+            "name": f"accounts/{account_id}/locations/{location_id}/localPosts/p{index}",
+            "languageCode": "pt-BR",
+            "summary": f"Fake post {index} of location {location_id}.",
+            "topicType": "STANDARD",
+            "state": "LIVE",
+            "createTime": _timestamp(create_time),
+            "updateTime": _timestamp(create_time),
+            "searchUrl": f"https://local.google.com/place?id={location_id}&post={index}",
+        }
+
+    def _media_item(self, account_id, location_id, index):
+        return {
+            "name": f"accounts/{account_id}/locations/{location_id}/media/m{index}",
+            "mediaFormat": "PHOTO",
+            "locationAssociation": {"category": "ADDITIONAL"},
+            "googleUrl": f"https://lh3.example.com/{location_id}/m{index}.jpg",
+            "createTime": _timestamp(self.now - timedelta(days=30 * index + 1)),
+        }
+
+    def _question(self, location_id, index):
+        return {
+            "name": f"locations/{location_id}/questions/q{index}",
+            "author": {"displayName": f"Customer {index}", "type": "REGULAR_USER"},
+            "text": f"Fake question {index} about location {location_id}?",
+            "upvoteCount": self._noise("question", location_id, index) % 20,
+            "totalAnswerCount": index % 2,
+            "createTime": _timestamp(self.now - timedelta(days=10 * index + 1)),
+            "updateTime": _timestamp(self.now - timedelta(days=10 * index + 1)),
+        }
+
+    def daily_value(self, location_id, metric, day):
+        """Deterministic value of one metric on one day."""
+        scale = 400 if "IMPRESSIONS" in metric else 40
+        return self._noise("metric", location_id, metric, day.isoformat()) % scale
+
+    def keyword_rows(self, location_id, year, month):
+        """Returns the (keyword, value, threshold) rows of one month."""
+        rows = []
+        for index in range(self.keywords_per_month):
+            value = self._noise("keyword", location_id, year, month, index) % 500
+            if value < 15:
+                rows.append((f"keyword {index}", None, 15))
+            else:
+                rows.append((f"keyword {index}", value, None))
+        return rows
+
+    # -- request plumbing ---------------------------------------------------------
+
+    def _build_routes(self):
+        location = r"(?P<location>[^/:]+)"
+        account = r"(?P<account>[^/:]+)"
+        v4_location = rf"mybusiness/v4/accounts/{account}/locations/{location}"
+        routes = [
+            ("GET", r"discovery/v1/apis/(?P<api>[^/]+)/(?P<version>[^/]+)/rest", self._discovery, "discovery"),
+            ("POST", r"token", self._token, "token"),
+            ("GET", r"mybusinessaccountmanagement/v1/accounts", self._list_accounts, "accounts.list"),
+            (
+                "GET",
+                rf"mybusinessbusinessinformation/v1/accounts/{account}/locations",
+                self._list_locations,
+                "locations.list",
+            ),
+            ("GET", rf"mybusinessbusinessinformation/v1/locations/{location}", self._get_location, "locations.get"),
+            (
+                "GET",
+                rf"businessprofileperformance/v1/locations/{location}:fetchMultiDailyMetricsTimeSeries",
+                self._fetch_multi_daily_metrics,
+                "performance.fetchMultiDailyMetricsTimeSeries",
+            ),
+            (
+                "GET",
+                rf"businessprofileperformance/v1/locations/{location}:getDailyMetricsTimeSeries",
+                self._get_daily_metrics,
+                "performance.getDailyMetricsTimeSeries",
+            ),
+            (
+                "GET",
+                rf"businessprofileperformance/v1/locations/{location}/searchkeywords/impressions/monthly",
+                self._list_keywords,
+                "performance.searchkeywords.list",
+            ),
+            ("GET", rf"{v4_location}/reviews", self._list_reviews, "reviews.list"),
+            (
+                "POST",
+                rf"mybusiness/v4/accounts/{account}/locations:batchGetReviews",
+                self._batch_get_reviews,
+                "reviews.batchGet",
+            ),
+            ("GET", rf"{v4_location}/localPosts", self._list_posts, "localPosts.list"),
+            ("POST", rf"{v4_location}/localPosts", self._create_post, "localPosts.create"),
+            ("POST", rf"{v4_location}/localPosts:reportInsights", self._report_post_insights, "localPosts.reportInsights"),
+            ("GET", rf"{v4_location}/media", self._list_media, "media.list"),
+            ("POST", rf"{v4_location}/media:startUpload", self._start_upload, "media.startUpload"),
+            ("POST", rf"{v4_location}/media", self._create_media, "media.create"),
+            ("GET", rf"{v4_location}/media/(?P<media>[^/]+)", self._get_media, "media.get"),
+            ("POST", r"mybusiness/upload/.+", self._upload_bytes, "media.upload"),
+            ("GET", rf"mybusinessqanda/v1/locations/{location}/questions", self._list_questions, "questions.list"),
+            ("GET", r"drive/drive/v3/files", self._list_files, "drive.files.list"),
+            ("POST", r"drive/upload/drive/v3/files", self._create_file, "drive.files.create"),
+            (
+                "POST",
+                r"drive/drive/v3/files/(?P<file>[^/]+)/permissions",
+                self._create_permission,
+                "drive.permissions.create",
+            ),
+        ]
+        return [(method, re.compile(pattern + "$"), handler, name) for method, pattern, handler, name in routes]
+
+    def _simulate_network(self):
+        delay_ms = self.latency_ms
+        if self.jitter_ms:
+            with self._lock:
+                delay_ms += self._rng.uniform(0, self.jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000.0)
+
+    def _injected_error(self):
+        if not self.error_rate:
+            return None
+        with self._lock:
+            if self._rng.random() >= self.error_rate:
+                return None
+            status = self._rng.choice(self.error_statuses)
+        status_name, reason, message = ERROR_MESSAGES.get(status, ("UNKNOWN", "unknown", "Injected failure."))
+        return FakeApiError(status, message, reason, status_name)
+
+    def handle(self, method, raw_path, body, headers):
+        """Returns (status, headers, payload bytes) for one request."""
+        parts = urlsplit(raw_path)
+        path = parts.path.lstrip("/")
+        batch = _BATCH_PATH.match(path)
+        if batch and method == "POST":
+            return self._batch(batch.group("api"), body, headers)
+        query = {key: values[-1] if len(values) == 1 else values for key, values in parse_qs(parts.query).items()}
+
+        for route_method, pattern, handler, name in self._routes:
+            match = pattern.match(path)
+            if route_method != method or not match:
+                continue
+            with self._lock:
+                self.request_counts[name] += 1
+            self._simulate_network()
+            try:
+                if name not in ("discovery", "token"):
+                    error = self._injected_error()
+                    if error:
+                        raise error
+                payload = handler(query=query, body=body, headers=headers, **match.groupdict())
+            except FakeApiError as e:
+                return e.status, {"Content-Type": "application/json"}, json.dumps(e.payload()).encode()
+            return 200, {"Content-Type": "application/json"}, json.dumps(payload).encode()
+
+        error = FakeApiError(404, f"No fake handler for {method} /{path}", "notFound", "NOT_FOUND")
+        return 404, {"Content-Type": "application/json"}, json.dumps(error.payload()).encode()
+
+    def _batch(self, api, body, headers):
+        """Serves a multipart/mixed batch: each application/http part is handled on its own."""
+        with self._lock:
+            self.request_counts["batch"] += 1
+        message = email.message_from_bytes(f"Content-Type: {headers.get('Content-Type', '')}\r\n\r\n".encode() + body)
+        if not message.is_multipart():
+            error = FakeApiError(400, "Batch request must be multipart/mixed.")
+            return 400, {"Content-Type": "application/json"}, json.dumps(error.payload()).encode()
+        parts = message.get_payload()
+        limit = MAX_BATCH_SIZES.get(api, MAX_BATCH_SIZES["default"])
+        if len(parts) > limit:
+            error = FakeApiError(400, f"A batch request cannot contain more than {limit} calls.")
+            return 400, {"Content-Type": "application/json"}, json.dumps(error.payload()).encode()
+
+        boundary = f"batch_{self._noise('batch', len(body))}"
+        chunks = []
+        for part in parts:
+            request_line, _, rest = part.get_payload().partition("\n")
+            inner = email.message_from_string(rest)
+            inner_method, inner_path, _ = request_line.split(" ", 2)
+            inner_body = inner.get_payload().encode() if inner.get_payload() else b""
+            status, _, payload = self.handle(inner_method, inner_path, inner_body, inner)
+            content_id = part["Content-ID"] or ""
+            chunks.append(
+                f"--{boundary}\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id.strip('<>')}>\r\n\r\n"
+                f"HTTP/1.1 {status} {'OK' if status < 300 else 'Error'}\r\n"
+                f"Content-Type: application/json; charset=UTF-8\r\n\r\n"
+                f"{payload.decode()}\r\n"
+            )
+        chunks.append(f"--{boundary}--\r\n")
+        return 200, {"Content-Type": f"multipart/mixed; boundary={boundary}"}, "".join(chunks).encode()
+
+    def _page_size_limit(self, kind):
+        limit = MAX_PAGE_SIZES[kind]
+        return min(limit, self.max_page_size) if self.max_page_size else limit
+
+    @staticmethod
+    def _json_body(body):
+        try:
+            return json.loads(body or b"{}")
+        except ValueError as e:
+            raise FakeApiError(400, f"Invalid JSON payload: {e}") from e
+
+    # -- handlers -----------------------------------------------------------------
+
+    def _discovery(self, api, version, **_):
+        root_url = f"{self.url}/{api}/"
+        if api == "mybusiness" and version == "v4":
+            return mybusiness_v4.build_document(root_url)
+        content = get_static_doc(api, version)
+        if content is None:
+            raise _not_found(f"discovery document {api} {version}")
+        document = json.loads(content)
+        document["rootUrl"] = root_url
+        document["baseUrl"] = root_url + document.get("servicePath", "")
+        document.pop("mtlsRootUrl", None)
+        return document
+
+    def _token(self, **_):
+        return {"access_token": f"fake-token-{time.time():.0f}", "expires_in": 3600, "token_type": "Bearer"}
+
+    def _list_accounts(self, query, **_):
+        accounts = [
+            {"name": f"accounts/{account_id}", "accountName": f"Fake Account {account_id}", "type": "LOCATION_GROUP"}
+            for account_id in self.account_ids()
+        ]
+        page, token = _page(accounts, query.get("pageSize"), query.get("pageToken"), self._page_size_limit("accounts"))
+        return {"accounts": page, **({"nextPageToken": token} if token else {})}
+
+    def _apply_read_mask(self, location, read_mask):
+        if not read_mask:
+            raise FakeApiError(400, "Request must contain a read_mask.")
+        fields = {field.strip() for field in read_mask.split(",")}
+        return {key: value for key, value in location.items() if key in fields}
+
+    def _list_locations(self, account, query, **_):
+        if account not in self.account_ids():
+            raise _not_found(f"accounts/{account}")
+        location_ids = self.location_ids(account)
+        read_mask = query.get("readMask")
+        page, token = _page(
+            (len(location_ids), lambda index: self._apply_read_mask(self._location(location_ids[index]), read_mask)),
+            query.get("pageSize"),
+            query.get("pageToken"),
+            self._page_size_limit("locations"),
+        )
+        return {"locations": page, **({"nextPageToken": token} if token else {})}
+
+    def _get_location(self, location, query, **_):
+        return self._apply_read_mask(self._location(location), query.get("readMask"))
+
+    @staticmethod
+    def _date_param(query, prefix):
+        try:
+            return date(
+                int(query[f"{prefix}.year"]),
+                int(query[f"{prefix}.month"]),
+                int(query.get(f"{prefix}.day", 1)),
+            )
+        except (KeyError, ValueError) as e:
+            raise FakeApiError(400, f"Invalid {prefix}: {e}") from e
+
+    def _time_series(self, location, metric, query):
+        self.account_of(location)
+        start = self._date_param(query, "dailyRange.startDate")
+        end = self._date_param(query, "dailyRange.endDate")
+        if end < start:
+            raise FakeApiError(400, "dailyRange end date is before its start date.")
+        dated_values = []
+        day = start
+        while day <= end:
+            entry = {"date": {"year": day.year, "month": day.month, "day": day.day}}
+            value = self.daily_value(location, metric, day)
+            # Like the real API, zero days carry no value
+            if value:
+                entry["value"] = str(value)
+            dated_values.append(entry)
+            day += timedelta(days=1)
+        return {"datedValues": dated_values}
+
+    def _fetch_multi_daily_metrics(self, location, query, **_):
+        metrics = query.get("dailyMetrics") or []
+        if isinstance(metrics, str):
+            metrics = [metrics]
+        return {
+            "multiDailyMetricTimeSeries": [
+                {
+                    "dailyMetricTimeSeries": [
+                        {"dailyMetric": metric, "timeSeries": self._time_series(location, metric, query)}
+                        for metric in metrics
+                    ]
+                }
+            ]
+        }
+
+    def _get_daily_metrics(self, location, query, **_):
+        return {"timeSeries": self._time_series(location, query.get("dailyMetric"), query)}
+
+    def _list_keywords(self, location, query, **_):
+        self.account_of(location)
+        start = self._date_param(query, "monthlyRange.startMonth")
+        end = self._date_param(query, "monthlyRange.endMonth")
+        counts = {}
+        year, month = start.year, start.month
+        while (year, month) <= (end.year, end.month):
+            for keyword, value, threshold in self.keyword_rows(location, year, month):
+                total_value, total_threshold = counts.get(keyword, (0, None))
+                if value is None:
+                    counts[keyword] = (total_value, threshold)
+                else:
+                    counts[keyword] = (total_value + value, total_threshold)
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        items = []
+        for keyword, (value, threshold) in sorted(counts.items(), key=lambda item: -item[1][0]):
+            insights_value = {"value": str(value)} if value else {"threshold": str(threshold)}
+            items.append({"searchKeyword": keyword, "insightsValue": insights_value})
+        page, token = _page(items, query.get("pageSize"), query.get("pageToken"), self._page_size_limit("keywords"))
+        return {"searchKeywordsCounts": page, **({"nextPageToken": token} if token else {})}
+
+    def _check_location(self, account, location):
+        if self.account_of(location) != account:
+            raise _not_found(f"accounts/{account}/locations/{location}")
+
+    def _review_summary(self, account, location):
+        ratings = [
+            STAR_RATINGS.index(self._review(account, location, index)["starRating"]) + 1
+            for index in range(min(self.reviews_per_location, 200))
+        ]
+        average = round(sum(ratings) / len(ratings), 1) if ratings else 0
+        return {"averageRating": average, "totalReviewCount": self.reviews_per_location}
+
+    def _list_reviews(self, account, location, query, **_):
+        self._check_location(account, location)
+        page, token = _page(
+            (self.reviews_per_location, lambda index: self._review(account, location, index)),
+            query.get("pageSize"),
+            query.get("pageToken"),
+            self._page_size_limit("reviews"),
+        )
+        return {"reviews": page, **self._review_summary(account, location), **({"nextPageToken": token} if token else {})}
+
+    def _batch_get_reviews(self, account, body, **_):
+        request = self._json_body(body)
+        location_names = request.get("locationNames") or []
+        if not location_names:
+            raise FakeApiError(400, "locationNames must not be empty.")
+        location_ids = []
+        for name in location_names:
+            match = re.match(r"^accounts/([^/]+)/locations/([^/]+)$", name)
+            if not match or match.group(1) != account:
+                raise FakeApiError(400, f"Location {name} does not belong to accounts/{account}.")
+            self._check_location(account, match.group(2))
+            location_ids.append(match.group(2))
+
+        def location_review(index):
+            if request.get("orderBy") == "updateTime desc":
+                # Every location's i-th review has the same updateTime, so newest first interleaves them
+                location_id, review_index = location_ids[index % len(location_ids)], index // len(location_ids)
+            else:
+                location_id = location_ids[index // self.reviews_per_location]
+                review_index = index % self.reviews_per_location
+            return {
+                "name": f"accounts/{account}/locations/{location_id}",
+                "review": self._review(account, location_id, review_index),
+            }
+
+        page, token = _page(
+            (len(location_ids) * self.reviews_per_location, location_review),
+            request.get("pageSize"),
+            request.get("pageToken"),
+            self._page_size_limit("batch_reviews"),
+        )
+        return {"locationReviews": page, **({"nextPageToken": token} if token else {})}
+
+    def _posts(self, account, location):
+        with self._lock:
+            created = list(self._created_posts.get(location, []))
+        generated = [self._post(account, location, index) for index in range(self.posts_per_location)]
+        return created[::-1] + generated
+
+    def _list_posts(self, account, location, query, **_):
+        self._check_location(account, location)
+        page, token = _page(
+            self._posts(account, location), query.get("pageSize"), query.get("pageToken"), self._page_size_limit("posts")
+        )
+        return {"localPosts": page, **({"nextPageToken": token} if token else {})}
+
+    def _create_post(self, account, location, body, **_):
+        self._check_location(account, location)
+        post = self._json_body(body)
+        if not post.get("summary"):
+            raise FakeApiError(400, "summary is required.")
+        with self._lock:
+            posts = self._created_posts.setdefault(location, [])
+            post.update(
+                {
+                    "name": f"accounts/{account}/locations/{location}/localPosts/c{len(posts)}",
+                    "state": "LIVE",
+                    "createTime": _timestamp(datetime.now(timezone.utc)),
+                    "updateTime": _timestamp(datetime.now(timezone.utc)),
+                }
+            )
+            posts.append(post)
+        return post
+
+    def _report_post_insights(self, account, location, body, **_):
+        self._check_location(account, location)
+        request = self._json_body(body)
+        metric_requests = (request.get("basicRequest") or {}).get("metricRequests") or []
+        time_range = (request.get("basicRequest") or {}).get("timeRange") or {}
+        local_post_metrics = []
+        for post_name in request.get("localPostNames") or []:
+            metric_values = [
+                {
+                    "metric": metric_request.get("metric"),
+                    "totalValue": {
+                        "metricOption": "AGGREGATED_TOTAL",
+                        "timeDimension": {"timeRange": time_range},
+                        "value": str(self._noise("post", post_name, metric_request.get("metric")) % 300),
+                    },
+                }
+                for metric_request in metric_requests
+            ]
+            local_post_metrics.append({"localPostName": post_name, "metricValues": metric_values})
+        return {"name": f"accounts/{account}/locations/{location}", "localPostMetrics": local_post_metrics}
+
+    def _media_items(self, account, location):
+        with self._lock:
+            created = list(self._created_media.get(location, []))
+        generated = [self._media_item(account, location, index) for index in range(self.media_per_location)]
+        return created + generated
+
+    def _list_media(self, account, location, query, **_):
+        self._check_location(account, location)
+        items = self._media_items(account, location)
+        page, token = _page(items, query.get("pageSize"), query.get("pageToken"), self._page_size_limit("media"))
+        return {"mediaItems": page, "totalMediaItemCount": len(items), **({"nextPageToken": token} if token else {})}
+
+    def _start_upload(self, account, location, **_):
+        self._check_location(account, location)
+        return {"resourceName": f"fake-upload-{location}-{time.monotonic_ns()}"}
+
+    def _upload_bytes(self, body, **_):
+        if not body:
+            raise FakeApiError(400, "Upload body is empty.")
+        return {}
+
+    def _create_media(self, account, location, body, **_):
+        self._check_location(account, location)
+        item = self._json_body(body)
+        with self._lock:
+            items = self._created_media.setdefault(location, [])
+            item.update(
+                {
+                    "name": f"accounts/{account}/locations/{location}/media/c{len(items)}",
+                    "googleUrl": f"https://lh3.example.com/{location}/c{len(items)}.jpg",
+                    "createTime": _timestamp(datetime.now(timezone.utc)),
+                }
+            )
+            item.pop("dataRef", None)
+            items.append(item)
+        return item
+
+    def _get_media(self, account, location, media, **_):
+        self._check_location(account, location)
+        for item in self._media_items(account, location):
+            if item["name"].endswith(f"/media/{media}"):
+                return item
+        raise _not_found(f"media {media}")
+
+    def _list_questions(self, location, query, **_):
+        self.account_of(location)
+        page, token = _page(
+            (self.questions_per_location, lambda index: self._question(location, index)),
+            query.get("pageSize"),
+            query.get("pageToken"),
+            self._page_size_limit("questions"),
+        )
+        return {"questions": page, "totalSize": self.questions_per_location, **({"nextPageToken": token} if token else {})}
+
+    def _drive_files(self):
+        folders = [
+            {"id": f"folder{index}", "name": f"Folder {index}", "mimeType": "application/vnd.google-apps.folder", "parents": ["root"]}
+            for index in range(self.drive_folders)
+        ]
+        with self._lock:
+            return folders + list(self._files.values())
+
+    def _list_files(self, query, **_):
+        files = self._drive_files()
+        q = query.get("q") or ""
+        parent = re.search(r"'([^']+)' in parents", q)
+        if parent:
+            files = [f for f in files if parent.group(1) in f.get("parents", [])]
+        mime_type = re.search(r"mimeType = '([^']+)'", q)
+        if mime_type:
+            files = [f for f in files if f.get("mimeType") == mime_type.group(1)]
+        if query.get("orderBy") == "name":
+            files.sort(key=lambda f: f["name"])
+        page, token = _page(files, query.get("pageSize"), query.get("pageToken"), self._page_size_limit("files"))
+        return {"files": [{"id": f["id"], "name": f["name"]} for f in page], **({"nextPageToken": token} if token else {})}
+
+    def _create_file(self, body, headers, **_):
+        content_type = headers.get("Content-Type", "")
+        metadata = {}
+        if content_type.startswith("multipart/"):
+            message = email.message_from_bytes(f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+            metadata = json.loads(message.get_payload()[0].get_payload())
+        with self._lock:
+            file_id = f"file{len(self._files)}"
+            file = {
+                "id": file_id,
+                "name": metadata.get("name", file_id),
+                "mimeType": metadata.get("mimeType", "application/octet-stream"),
+                "parents": metadata.get("parents", ["root"]),
+                "webViewLink": f"https://drive.example.com/file/{file_id}/view",
+                "webContentLink": f"https://drive.example.com/uc?id={file_id}",
+            }
+            self._files[file_id] = file
+        return file
+
+    def _create_permission(self, file, body, **_):
+        with self._lock:
+            if file not in self._files:
+                raise _not_found(f"file {file}")
+            self._files[file].setdefault("permissions", []).append(self._json_body(body))
+        return {"id": "anyoneWithLink"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self, method):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, headers, payload = self.server.app.handle(method, self.path, body, self.headers)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        self._respond("GET")
+
+    def do_POST(self):
+        self._respond("POST")
+
+    def do_PATCH(self):
+        self._respond("PATCH")
+
+    def do_DELETE(self):
+        self._respond("DELETE")
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for the Google Business Profile and Drive APIs.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--accounts", type=int, default=1)
+    parser.add_argument("--locations-per-account", type=int, default=3)
+    parser.add_argument("--reviews-per-location", type=int, default=30)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--max-page-size", type=int, default=None)
+    args = parser.parse_args()
+
+    api = FakeGoogleApi(
+        accounts=args.accounts,
+        locations_per_account=args.locations_per_account,
+        reviews_per_location=args.reviews_per_location,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        max_page_size=args.max_page_size,
+        port=args.port,
+    ).start()
+    print(f"Serving fake Google APIs on {api.url}")
+    print(f"Run the app with GMB_GOOGLE_API_ENDPOINT={api.url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        api.stop()
+
+
+if __name__ == "__main__":
+    main()
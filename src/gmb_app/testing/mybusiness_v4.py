@@ -0,0 +1,184 @@
+# Discovery document of the parts of mybusiness v4 the app uses. googleapiclient does
+# not ship it (the app downloads it from developers.google.com), so the stand-in
+# server serves this reduced copy instead.
+
+_LOCATION_PATTERN = "^accounts/[^/]+/locations/[^/]+$"
+_STANDARD_PARAMETERS = {
+    "$.xgafv": {"location": "query", "type": "string", "enum": ["1", "2"]},
+    "access_token": {"location": "query", "type": "string"},
+    "alt": {"default": "json", "location": "query", "type": "string", "enum": ["json", "media", "proto"]},
+    "callback": {"location": "query", "type": "string"},
+    "fields": {"location": "query", "type": "string"},
+    "key": {"location": "query", "type": "string"},
+    "oauth_token": {"location": "query", "type": "string"},
+    "prettyPrint": {"default": "true", "location": "query", "type": "boolean"},
+    "quotaUser": {"location": "query", "type": "string"},
+    "uploadType": {"location": "query", "type": "string"},
+    "upload_protocol": {"location": "query", "type": "string"},
+}
+
+
+def _path_param(pattern=_LOCATION_PATTERN):
+    return {"location": "path", "required": True, "type": "string", "pattern": pattern}
+
+
+def _query_param(type_="string", format_=None):
+    param = {"location": "query", "type": type_}
+    if format_:
+        param["format"] = format_
+    return param
+
+
+def _method(method_id, http_method, path, parameters, request=None, response=None):
+    order = [name for name, param in parameters.items() if param.get("location") == "path"]
+    method = {
+        "id": f"mybusiness.{method_id}",
+        "httpMethod": http_method,
+        "path": path,
+        "flatPath": path,
+        "parameters": parameters,
+        "parameterOrder": order,
+        "scopes": ["https://www.googleapis.com/auth/business.manage"],
+    }
+    if request:
+        method["request"] = {"$ref": request}
+    if response:
+        method["response"] = {"$ref": response}
+    return method
+
+
+def _list_params():
+    return {
+        "parent": _path_param(),
+        "pageSize": _query_param("integer", "int32"),
+        "pageToken": _query_param(),
+    }
+
+
+def build_document(root_url):
+    """Returns the v4 discovery document with every URL rooted at `root_url`."""
+    schemas = [
+        "BatchGetReviewsRequest",
+        "BatchGetReviewsResponse",
+        "ListLocalPostsResponse",
+        "ListMediaItemsResponse",
+        "ListReviewsResponse",
+        "LocalPost",
+        "MediaItem",
+        "MediaItemDataRef",
+        "ReportLocalPostInsightsRequest",
+        "ReportLocalPostInsightsResponse",
+        "StartUploadMediaItemDataRequest",
+    ]
+    media_params = _list_params()
+    reviews_params = {**_list_params(), "orderBy": _query_param()}
+    return {
+        "kind": "discovery#restDescription",
+        "discoveryVersion": "v1",
+        "id": "mybusiness:v4",
+        "name": "mybusiness",
+        "version": "v4",
+        "title": "Google My Business API",
+        "protocol": "rest",
+        "rootUrl": root_url,
+        "servicePath": "",
+        "baseUrl": root_url,
+        "batchPath": "batch",
+        "parameters": _STANDARD_PARAMETERS,
+        "auth": {
+            "oauth2": {"scopes": {"https://www.googleapis.com/auth/business.manage": {"description": "Manage your business listings"}}}
+        },
+        "schemas": {name: {"id": name, "type": "object"} for name in schemas},
+        "resources": {
+            "accounts": {
+                "resources": {
+                    "locations": {
+                        "methods": {
+                            "batchGetReviews": _method(
+                                "accounts.locations.batchGetReviews",
+                                "POST",
+                                "v4/{+name}/locations:batchGetReviews",
+                                {"name": _path_param("^accounts/[^/]+$")},
+                                request="BatchGetReviewsRequest",
+                                response="BatchGetReviewsResponse",
+                            ),
+                        },
+                        "resources": {
+                            "reviews": {
+                                "methods": {
+                                    "list": _method(
+                                        "accounts.locations.reviews.list",
+                                        "GET",
+                                        "v4/{+parent}/reviews",
+                                        reviews_params,
+                                        response="ListReviewsResponse",
+                                    ),
+                                }
+                            },
+                            "localPosts": {
+                                "methods": {
+                                    "list": _method(
+                                        "accounts.locations.localPosts.list",
+                                        "GET",
+                                        "v4/{+parent}/localPosts",
+                                        _list_params(),
+                                        response="ListLocalPostsResponse",
+                                    ),
+                                    "create": _method(
+                                        "accounts.locations.localPosts.create",
+                                        "POST",
+                                        "v4/{+parent}/localPosts",
+                                        {"parent": _path_param()},
+                                        request="LocalPost",
+                                        response="LocalPost",
+                                    ),
+                                    "reportInsights": _method(
+                                        "accounts.locations.localPosts.reportInsights",
+                                        "POST",
+                                        "v4/{+name}/localPosts:reportInsights",
+                                        {"name": _path_param()},
+                                        request="ReportLocalPostInsightsRequest",
+                                        response="ReportLocalPostInsightsResponse",
+                                    ),
+                                }
+                            },
+                            "media": {
+                                "methods": {
+                                    "list": _method(
+                                        "accounts.locations.media.list",
+                                        "GET",
+                                        "v4/{+parent}/media",
+                                        media_params,
+                                        response="ListMediaItemsResponse",
+                                    ),
+                                    "get": _method(
+                                        "accounts.locations.media.get",
+                                        "GET",
+                                        "v4/{+name}",
+                                        {"name": _path_param("^accounts/[^/]+/locations/[^/]+/media/[^/]+$")},
+                                        response="MediaItem",
+                                    ),
+                                    "create": _method(
+                                        "accounts.locations.media.create",
+                                        "POST",
+                                        "v4/{+parent}/media",
+                                        {"parent": _path_param()},
+                                        request="MediaItem",
+                                        response="MediaItem",
+                                    ),
+                                    "startUpload": _method(
+                                        "accounts.locations.media.startUpload",
+                                        "POST",
+                                        "v4/{+parent}/media:startUpload",
+                                        {"parent": _path_param()},
+                                        request="StartUploadMediaItemDataRequest",
+                                        response="MediaItemDataRef",
+                                    ),
+                                }
+                            },
+                        },
+                    }
+                }
+            }
+        },
+    }
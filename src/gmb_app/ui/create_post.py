@@ -171,7 +171,7 @@ def render_create_post_tab(credentials, location_id, selected_account_id, t):
         progress.progress(20)
         created = publish_post(credentials, location_id, selected_account_id, payload)
         progress.progress(70)
-        gbp_client.invalidate_posts_cache()
+        gbp_client.invalidate_posts_cache(credentials, location_id)
         st.session_state["posts"] = gbp_client.get_posts(credentials, location_id, selected_account_id)
         progress.progress(100)
         st.session_state["create_post_last_payload_hash"] = digest
@@ -0,0 +1,128 @@
+import plotly.express as px
+import streamlit as st
+
+import data_fetcher
+from src.gmb_app.services.performance_service import (
+    build_portfolio_frame,
+    iter_metrics_backfill,
+    iter_portfolio_data,
+    score_portfolio_health,
+)
+
+VIEW_METRICS = [
+    "BUSINESS_IMPRESSIONS_DESKTOP_MAPS",
+    "BUSINESS_IMPRESSIONS_DESKTOP_SEARCH",
+    "BUSINESS_IMPRESSIONS_MOBILE_MAPS",
+    "BUSINESS_IMPRESSIONS_MOBILE_SEARCH",
+]
+ACTION_METRICS = [
+    "WEBSITE_CLICKS",
+    "CALL_CLICKS",
+    "BUSINESS_DIRECTION_REQUESTS",
+    "BUSINESS_CONVERSATIONS",
+    "BUSINESS_BOOKINGS",
+]
+
+
+def summarize_portfolio(frame, titles, health=None):
+    """One row per location: total views, actions, reviews, average rating, posts and health score."""
+    health = health or {}
+    rows = []
+    for location_id, location_rows in frame.groupby("location_id", sort=False):
+        metrics = location_rows[location_rows["resource"] == "metrics"]
+        reviews = location_rows[location_rows["resource"] == "reviews"]
+        rows.append(
+            {
+                "Location": titles.get(location_id, location_id),
+                "Views": int(metrics.loc[metrics["metric"].isin(VIEW_METRICS), "value"].sum()),
+                "Actions": int(metrics.loc[metrics["metric"].isin(ACTION_METRICS), "value"].sum()),
+                "Reviews": len(reviews),
+                "Avg. Rating": round(reviews["value"].mean(), 2) if len(reviews) else None,
+                "Posts": int((location_rows["resource"] == "posts").sum()),
+                "Health": health.get(location_id),
+            }
+        )
+    return rows
+
+
+def render_portfolio_tab(credentials, start_date, end_date, t):
+    st.header(t("portfolio"))
+
+    if not credentials:
+        st.info(t("auth_first"))
+        return
+
+    locations = data_fetcher.get_location_titles(credentials)
+    titles = {loc["name"]: loc.get("title", loc["name"]) for loc in locations}
+    selected = st.multiselect(
+        t("portfolio_locations"),
+        options=list(titles),
+        format_func=lambda name: titles[name],
+        key="portfolio_selected_locations",
+    )
+
+    if st.button(t("fetch_portfolio"), key="portfolio_fetch_btn", disabled=not selected):
+        progress = st.progress(0.0)
+        status = st.empty()
+        results = []
+        for result in iter_portfolio_data(credentials, selected, start_date, end_date):
+            results.append(result)
+            title = titles.get(result["location_id"], result["location_id"])
+            if result["error"]:
+                st.warning(f"{t('portfolio_location_failed')} {title}: {result['error']}")
+            elif result["data"]["incomplete"]:
+                st.warning(f"{t('portfolio_location_incomplete')} {title}: {', '.join(result['data']['incomplete'])}")
+            progress.progress(len(results) / len(selected))
+            status.caption(f"{len(results)}/{len(selected)} · {title}")
+        st.session_state["portfolio_df"] = build_portfolio_frame(results)
+        status.caption(t("portfolio_health_running"))
+        st.session_state["portfolio_health"] = score_portfolio_health(credentials, results)
+        status.empty()
+
+    if st.button(t("portfolio_backfill"), key="portfolio_backfill_btn", disabled=not selected):
+        render_backfill(credentials, selected, titles, t)
+
+    frame = st.session_state.get("portfolio_df")
+    if frame is None:
+        st.info(t("portfolio_hint"))
+        return
+    if frame.empty:
+        st.info(t("portfolio_empty"))
+        return
+
+    health = st.session_state.get("portfolio_health")
+    st.dataframe(summarize_portfolio(frame, titles, health), hide_index=True, use_container_width=True)
+
+    metrics = frame[(frame["resource"] == "metrics") & frame["metric"].isin(VIEW_METRICS)]
+    if not metrics.empty:
+        daily_views = metrics.groupby(["date", "location_id"], as_index=False)["value"].sum()
+        daily_views["location"] = daily_views["location_id"].map(lambda name: titles.get(name, name))
+        fig = px.line(
+            daily_views,
+            x="date",
+            y="value",
+            color="location",
+            title="Views per Location",
+            labels={"value": "Views", "date": "Date", "location": "Location"},
+            template="plotly_white",
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    st.download_button(
+        label=t("portfolio_download"),
+        data=frame.to_csv(index=False),
+        file_name="gmb_portfolio.csv",
+        mime="text/csv",
+    )
+
+
+def render_backfill(credentials, selected, titles, t):
+    progress = st.progress(0.0)
+    for done, result in enumerate(iter_metrics_backfill(credentials, selected), start=1):
+        title = titles.get(result["location_id"], result["location_id"])
+        if result["error"]:
+            st.warning(f"{t('portfolio_location_failed')} {title}: {result['error']}")
+        elif result["summary"]["failed"]:
+            st.warning(f"{t('portfolio_backfill_partial')} {title}: {len(result['summary']['failed'])}")
+        progress.progress(done / len(selected))
+    st.success(t("portfolio_backfill_done"))
@@ -0,0 +1,33 @@
+import pytest
+
+from src.gmb_app.core.cache import clear_cache
+from src.gmb_app.core.config import DEFAULT_API_QPM
+from src.gmb_app.integrations.client_registry import clear_services
+from src.gmb_app.integrations.http_transport import close_http_pool
+from src.gmb_app.integrations.request_executor import reset_buckets
+from src.gmb_app.testing.fake_google_api import FakeGoogleApi
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keeps on-disk caches out of the working tree and starts each test with a cold memory cache."""
+    monkeypatch.setenv("GMB_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("GMB_STORE_PATH", raising=False)
+    clear_cache()
+
+
+@pytest.fixture
+def fake_google_api(monkeypatch):
+    """Runs the local Google API stand-in and points every client at it, without rate limits."""
+    monkeypatch.setenv("GMB_QUOTA_GOVERNOR", "process")
+    for api_name in DEFAULT_API_QPM:
+        monkeypatch.setenv(f"GMB_QPM_{api_name.upper()}", "1000000")
+    with FakeGoogleApi() as api:
+        monkeypatch.setenv("GMB_GOOGLE_API_ENDPOINT", api.url)
+        reset_buckets()
+        clear_services()
+        yield api
+    # Pooled keep-alive connections point at the stopped server's port
+    close_http_pool()
+    clear_services()
+    reset_buckets()
@@ -0,0 +1,91 @@
+from datetime import date
+from unittest.mock import patch
+
+from google.oauth2.credentials import Credentials
+
+import data_fetcher
+import drive_helper
+from src.gmb_app.storage import review_store
+
+
+def _credentials():
+    return Credentials(token="fake-token")
+
+
+def test_locations_are_listed_across_accounts_and_pages(fake_google_api):
+    fake_google_api.accounts = 2
+    fake_google_api.max_page_size = 2
+
+    locations = data_fetcher.get_locations(_credentials())
+
+    assert [loc["name"] for loc in locations] == fake_google_api.location_names()
+    assert fake_google_api.request_counts["locations.list"] == 4
+
+
+def test_daily_metrics_match_the_served_dataset(fake_google_api):
+    location_id = fake_google_api.location_ids()[0]
+    start, end = date(2024, 1, 1), date(2024, 1, 31)
+
+    df = data_fetcher.get_daily_metrics(_credentials(), location_id, start, end, unsettled_days=0)
+
+    assert len(df) == 31
+    assert not df.attrs["failed_metrics"]
+    metric = "CALL_CLICKS"
+    assert int(df[metric].iloc[0]) == fake_google_api.daily_value(location_id, metric, start)
+    assert fake_google_api.request_counts["performance.fetchMultiDailyMetricsTimeSeries"] == 1
+
+
+def test_reviews_sync_pages_through_every_review(fake_google_api):
+    fake_google_api.reviews_per_location = 120
+    location_name = fake_google_api.location_names()[0]
+
+    credentials = _credentials()
+    fetched = data_fetcher.sync_reviews(credentials, location_name)
+
+    assert fetched == 120
+    assert fake_google_api.request_counts["reviews.list"] == 3
+    assert len(review_store.load_reviews(credentials, data_fetcher._location_key(location_name))) == 120
+
+
+def test_batched_review_sync_costs_a_few_requests_per_account(fake_google_api):
+    fake_google_api.accounts = 2
+    fake_google_api.reviews_per_location = 40
+    names = fake_google_api.location_names()
+
+    credentials = _credentials()
+    fetched = data_fetcher.sync_reviews_batch(credentials, names)
+
+    assert fetched == dict.fromkeys(names, 40)
+    # 3 locations x 40 reviews per account, 50 per page
+    assert fake_google_api.request_counts["reviews.batchGet"] == 6
+    assert fake_google_api.request_counts["reviews.list"] == 0
+    reviews = data_fetcher.get_reviews_batch(credentials, names)
+    assert [len(reviews[name]) for name in names] == [40] * 6
+    assert fake_google_api.request_counts["reviews.batchGet"] == 8
+
+
+def test_injected_errors_are_retried_then_surface_as_empty_results(fake_google_api):
+    fake_google_api.error_rate = 1.0
+
+    with patch("src.gmb_app.integrations.request_executor._sleep"):
+        assert data_fetcher.get_accounts(_credentials()) == []
+
+    assert fake_google_api.request_counts["accounts.list"] == 5
+
+
+def test_media_upload_and_drive_round_trip(fake_google_api):
+    creds = _credentials()
+    location_name = fake_google_api.location_names()[0]
+
+    media_item = data_fetcher.upload_media_from_file(
+        creds, location_name, file_bytes=b"\x89PNG fake", mime_type="image/png"
+    )
+    assert media_item["googleUrl"]
+    assert fake_google_api.request_counts["media.upload"] == 1
+
+    uploaded = drive_helper.upload_file_to_folder(creds, "folder0", "photo.png", b"\x89PNG fake", "image/png")
+    drive_helper.set_file_public(creds, uploaded["id"])
+    folders = drive_helper.list_folders(creds)
+
+    assert uploaded["name"] == "photo.png"
+    assert [folder["name"] for folder in folders] == ["Folder 0", "Folder 1", "Folder 2"]
@@ -0,0 +1,43 @@
+from google.oauth2.credentials import Credentials
+
+import data_fetcher
+from src.gmb_app.integrations.batch_executor import RequestBatch
+
+
+def test_batch_splits_at_max_size_and_maps_responses_to_keys(fake_google_api):
+    fake_google_api.locations_per_account = 5
+    service = data_fetcher.get_business_information_service(Credentials(token="t"))
+    names = fake_google_api.location_names()
+    completed = []
+    batch = RequestBatch(service, max_size=2)
+    for name in names:
+        request = service.locations().get(name=data_fetcher.extract_location_path(name), readMask="name,title")
+        batch.add(request, key=name, callback=lambda key, response, error: completed.append(key))
+    batch.add(service.locations().get(name="locations/1", readMask="name"), key="missing")
+
+    responses = batch.execute()
+
+    assert fake_google_api.request_counts["batch"] == 3
+    assert completed == names
+    assert {key: response["title"] for key, response in responses.items()} == {
+        name: f"Fake Business {name.rsplit('/', 1)[1]}" for name in names
+    }
+    assert batch.errors["missing"].status_code == 404
+    assert len(batch) == 0
+
+
+def test_items_failing_transiently_are_retried_on_their_own(fake_google_api, monkeypatch):
+    monkeypatch.setattr("src.gmb_app.integrations.request_executor._sleep", lambda s: None)
+    credentials = Credentials(token="t")
+    fake_google_api.locations_per_account = 10
+    names = fake_google_api.location_names()
+    fake_google_api.error_rate = 0.3
+
+    questions = data_fetcher.get_questions_batch(credentials, names)
+
+    assert {name: len(items) for name, items in questions.items()} == dict.fromkeys(
+        names, fake_google_api.questions_per_location
+    )
+    assert fake_google_api.request_counts["batch"] == 1
+    # Every failed call was resent alone
+    assert fake_google_api.request_counts["questions.list"] > len(names)
@@ -0,0 +1,31 @@
+import json
+
+from src.gmb_app.testing import benchmarks
+
+
+def _report(**medians):
+    return {"results": {name: {"median_ms": value} for name, value in medians.items()}}
+
+
+def test_compare_flags_only_slowdowns_beyond_threshold_and_noise():
+    baseline = _report(fetch=100.0, render=2.0, pdf=50.0)
+    current = _report(fetch=130.0, render=4.0, pdf=55.0, new=10.0)
+
+    regressions = benchmarks.compare(current, baseline, threshold=0.25)
+
+    assert [r["name"] for r in regressions] == ["fetch"]
+
+
+def test_smoke_profile_writes_report_and_fails_on_regression(tmp_path, monkeypatch):
+    monkeypatch.setitem(benchmarks.PROFILES["smoke"], "reviews", 50)
+    output = tmp_path / "report.json"
+
+    assert benchmarks.main(["--profile", "smoke", "--output", str(output)]) == 0
+    report = json.loads(output.read_text())
+    assert "fetch_dashboard_data.cold" in report["results"]
+    assert "report_generator.generate_pdf" in report["results"]
+
+    baseline = {"results": {name: {"median_ms": 0.001} for name in report["results"]}}
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(json.dumps(baseline))
+    assert benchmarks.main(["--profile", "smoke", "--skip-fetch", "--baseline", str(baseline_path)]) == 1
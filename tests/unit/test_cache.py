@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from data_fetcher import get_posts, invalidate_posts_cache
+from src.gmb_app.core.cache import TTLCache, cached_read
+from src.gmb_app.core.identity import credential_identity
+
+CREDS = SimpleNamespace(client_id="client", refresh_token="refresh")
+
+
+def test_ttl_cache_expires_and_evicts_least_recently_used():
+    cache = TTLCache(max_entries=2)
+    with patch("src.gmb_app.core.cache.time.monotonic", return_value=100):
+        cache.set("a", 1, ttl_s=10)
+        cache.set("b", 2, ttl_s=10)
+        cache.get("a")
+        cache.set("c", 3, ttl_s=10)
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+
+    with patch("src.gmb_app.core.cache.time.monotonic", return_value=111):
+        assert cache.get("a") == (False, None)
+
+
+def _posts_service():
+    service = MagicMock()
+
+    def list_posts(parent, pageSize, pageToken=None):
+        request = MagicMock()
+        request.execute.return_value = {"localPosts": [{"name": f"{parent}/localPosts/1"}]}
+        return request
+
+    service.accounts().locations().localPosts().list.side_effect = list_posts
+    return service
+
+
+def test_reads_are_cached_across_location_formats_and_invalidated_per_location():
+    service = _posts_service()
+    posts_list = service.accounts().locations().localPosts().list
+
+    with patch("data_fetcher.get_mybusiness_service", return_value=service):
+        get_posts(CREDS, "accounts/1/locations/2", "accounts/1")
+        get_posts(CREDS, "accounts/1/locations/3", "accounts/1")
+        get_posts(CREDS, "accounts/1/locations/2", "accounts/1")
+        assert posts_list.call_count == 2
+
+        invalidate_posts_cache(CREDS, "locations/2")
+        get_posts(CREDS, "accounts/1/locations/2", "accounts/1")
+        get_posts(CREDS, "accounts/1/locations/3", "accounts/1")
+
+    assert posts_list.call_count == 3
+
+
+def test_metrics_with_failed_metrics_are_not_cached():
+    calls = []
+
+    @cached_read("partial", credential_identity)
+    def read(credentials, location_id):
+        calls.append(location_id)
+        df = pd.DataFrame({"date": [pd.Timestamp("2024-01-01")], "CALL_CLICKS": [1]})
+        df.attrs["failed_metrics"] = ["WEBSITE_CLICKS"] if len(calls) == 1 else []
+        return df
+
+    read(CREDS, "locations/2")
+    read(CREDS, "locations/2")
+    read(CREDS, "locations/2")
+
+    assert len(calls) == 2
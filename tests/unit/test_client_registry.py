@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.gmb_app.core.identity import credential_identity
+from src.gmb_app.integrations import client_registry
+from src.gmb_app.integrations.discovery_cache import FileDiscoveryCache
+
+
+def test_discovery_cache_round_trip(tmp_path):
+    cache = FileDiscoveryCache(cache_dir=str(tmp_path), ttl_s=60)
+    cache.set("https://example.com/discovery", '{"name": "x"}')
+    assert cache.get("https://example.com/discovery") == '{"name": "x"}'
+    assert cache.get("https://example.com/other") is None
+
+
+def test_discovery_cache_expires_entries(tmp_path):
+    cache = FileDiscoveryCache(cache_dir=str(tmp_path), ttl_s=60)
+    with patch("src.gmb_app.integrations.discovery_cache.time.time", return_value=1000):
+        cache.set("https://example.com/discovery", "{}")
+    with patch("src.gmb_app.integrations.discovery_cache.time.time", return_value=1061):
+        assert cache.get("https://example.com/discovery") is None
+
+
+def test_credential_identity_survives_token_refresh():
+    creds = SimpleNamespace(client_id="client", refresh_token="refresh", token="a")
+    identity = credential_identity(creds)
+    creds.token = "b"
+    assert credential_identity(creds) == identity
+
+
+def test_get_service_builds_once_per_identity():
+    client_registry.clear_services()
+    creds = SimpleNamespace(client_id="client", refresh_token="refresh")
+    other = SimpleNamespace(client_id="client", refresh_token="other")
+
+    with patch("src.gmb_app.integrations.client_registry.build") as mocked_build:
+        mocked_build.side_effect = lambda *args, **kwargs: object()
+        first = client_registry.get_service("drive", "v3", creds)
+        second = client_registry.get_service("drive", "v3", creds)
+        third = client_registry.get_service("drive", "v3", other)
+
+    assert first is second
+    assert third is not first
+    assert mocked_build.call_count == 2
+    client_registry.clear_services()
@@ -0,0 +1,111 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from google.oauth2.credentials import Credentials
+
+from src.gmb_app.integrations import credential_manager
+from src.gmb_app.storage import credential_store
+from src.gmb_app.storage.db import connect
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _credentials(expires_in_s, refresh_token="refresh"):
+    creds = Credentials(
+        token="old",
+        refresh_token=refresh_token,
+        client_id="client",
+        client_secret="secret",
+        token_uri="https://oauth2.googleapis.com/token",
+    )
+    creds.expiry = _utcnow() + timedelta(seconds=expires_in_s)
+    return creds
+
+
+def _fake_refresh(calls, delay_s=0.0):
+    def refresh(self, request):
+        calls.append(self)
+        time.sleep(delay_s)
+        self.token = f"new-{len(calls)}"
+        self.expiry = _utcnow() + timedelta(hours=1)
+
+    return refresh
+
+
+def test_concurrent_refreshes_of_one_identity_are_coalesced():
+    calls = []
+    credentials = [_credentials(-60, refresh_token="coalesce") for _ in range(5)]
+
+    with patch.object(Credentials, "refresh", _fake_refresh(calls, delay_s=0.05)):
+        threads = [threading.Thread(target=credential_manager.ensure_fresh, args=(c,)) for c in credentials]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(calls) == 1
+    assert {c.token for c in credentials} == {"new-1"}
+
+
+def test_token_close_to_expiry_is_renewed_in_the_background():
+    calls = []
+    # Inside the 5 minute renewal window but outside google-auth's own expiry margin
+    creds = _credentials(270, refresh_token="background")
+
+    with patch.object(Credentials, "refresh", _fake_refresh(calls, delay_s=0.05)):
+        assert credential_manager.ensure_fresh(creds).token == "old"
+        thread = credential_manager._background_refreshes.get(credential_manager.credential_identity(creds))
+        thread.join()
+
+    assert len(calls) == 1
+    assert creds.token == "new-1"
+
+
+def test_refreshed_tokens_survive_a_restart(monkeypatch):
+    monkeypatch.setenv("GMB_PERSIST_CREDENTIALS", "true")
+    calls = []
+    creds = _credentials(-60, refresh_token="persisted")
+    session_id = credential_manager.remember_credentials(creds)
+
+    with patch.object(Credentials, "refresh", _fake_refresh(calls)):
+        credential_manager.ensure_fresh(creds)
+
+    restored = credential_manager.restore_credentials(session_id, "secret")
+    assert restored.refresh_token == "persisted"
+    assert restored.token == "new-1"
+    assert restored.client_secret == "secret"
+    assert credential_manager.restore_credentials("unknown", "secret") is None
+
+
+def test_stored_sign_in_holds_no_client_secret_and_expires(monkeypatch):
+    monkeypatch.setenv("GMB_PERSIST_CREDENTIALS", "true")
+    creds = _credentials(3600, refresh_token="expiring")
+    session_id = credential_manager.remember_credentials(creds)
+
+    payload = credential_store.load_session_credentials(session_id, max_age_s=60)
+    assert "secret" not in payload
+
+    monkeypatch.setenv("GMB_SESSION_MAX_AGE_S", "60")
+    with patch("src.gmb_app.storage.credential_store.time.time", return_value=time.time() + 61):
+        assert credential_manager.restore_credentials(session_id, "secret") is None
+    assert credential_store.load_session_credentials(session_id, max_age_s=60) is None
+
+
+def test_sign_out_deletes_stored_credentials(monkeypatch):
+    monkeypatch.setenv("GMB_PERSIST_CREDENTIALS", "true")
+    creds = _credentials(3600, refresh_token="signed-out")
+    session_id = credential_manager.remember_credentials(creds)
+
+    credential_manager.forget_session(session_id)
+
+    assert credential_manager.restore_credentials(session_id, "secret") is None
+    with connect() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM oauth_credentials").fetchone()[0] == 0
+
+
+def test_credentials_are_not_persisted_by_default():
+    assert credential_manager.remember_credentials(_credentials(3600, refresh_token="default")) is None
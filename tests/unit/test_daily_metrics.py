@@ -0,0 +1,169 @@
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+from google.oauth2.credentials import Credentials
+
+import data_fetcher
+from data_fetcher import DAILY_METRICS, build_daily_metrics_frame, get_daily_metrics
+from src.gmb_app.core.errors import AuthError
+
+CREDS = SimpleNamespace(client_id="client", refresh_token="refresh")
+
+
+def _dated_value(day, value):
+    return {"date": {"year": 2024, "month": 1, "day": day}, "value": str(value)}
+
+
+def test_daily_metrics_uses_single_multi_metric_request():
+    service = MagicMock()
+    service.locations().fetchMultiDailyMetricsTimeSeries().execute.return_value = {
+        "multiDailyMetricTimeSeries": [
+            {
+                "dailyMetricTimeSeries": [
+                    {"dailyMetric": "CALL_CLICKS", "timeSeries": {"datedValues": [_dated_value(1, 3), _dated_value(2, 4)]}},
+                    {"dailyMetric": "WEBSITE_CLICKS", "timeSeries": {"datedValues": [_dated_value(2, 7)]}},
+                ]
+            }
+        ]
+    }
+
+    with patch("data_fetcher.get_performance_service", return_value=service):
+        df = get_daily_metrics(CREDS, "accounts/1/locations/2", date(2024, 1, 1), date(2024, 1, 2))
+
+    service.locations().getDailyMetricsTimeSeries.assert_not_called()
+    assert list(df["CALL_CLICKS"]) == [3, 4]
+    assert list(df["WEBSITE_CLICKS"]) == [0, 7]
+    assert set(DAILY_METRICS).issubset(df.columns)
+    assert df.attrs["failed_metrics"] == []
+
+
+def test_daily_metrics_falls_back_per_metric_and_reports_failures():
+    service = MagicMock()
+    service.locations().fetchMultiDailyMetricsTimeSeries().execute.side_effect = RuntimeError("boom")
+
+    def per_metric(name, dailyMetric, **kwargs):
+        request = MagicMock()
+        if dailyMetric == "CALL_CLICKS":
+            request.execute.return_value = {"timeSeries": {"datedValues": [_dated_value(1, 5)]}}
+        else:
+            request.execute.side_effect = RuntimeError("quota")
+        return request
+
+    service.locations().getDailyMetricsTimeSeries.side_effect = per_metric
+
+    with patch("data_fetcher.get_performance_service", return_value=service):
+        df = get_daily_metrics(CREDS, "locations/2", date(2024, 1, 1), date(2024, 1, 1))
+
+    assert list(df["CALL_CLICKS"]) == [5]
+    assert df.attrs["failed_metrics"] == sorted(m for m in DAILY_METRICS if m != "CALL_CLICKS")
+
+
+def test_stored_days_are_not_served_to_other_credentials():
+    owner = SimpleNamespace(client_id="client", refresh_token="owner")
+    stranger = SimpleNamespace(client_id="client", refresh_token="stranger")
+    service = MagicMock()
+    service.locations().fetchMultiDailyMetricsTimeSeries().execute.return_value = {
+        "multiDailyMetricTimeSeries": [
+            {"dailyMetricTimeSeries": [{"dailyMetric": "CALL_CLICKS", "timeSeries": {"datedValues": [_dated_value(1, 42)]}}]}
+        ]
+    }
+    with patch("data_fetcher.get_performance_service", return_value=service):
+        get_daily_metrics(owner, "accounts/1/locations/9", date(2024, 1, 1), date(2024, 1, 1))
+
+    denied = MagicMock()
+    denied.locations().fetchMultiDailyMetricsTimeSeries().execute.side_effect = AuthError("denied", status_code=403)
+    denied.locations().getDailyMetricsTimeSeries().execute.side_effect = AuthError("denied", status_code=403)
+    with patch("data_fetcher.get_performance_service", return_value=denied):
+        df = get_daily_metrics(stranger, "locations/9", date(2024, 1, 1), date(2024, 1, 1))
+
+    assert df.empty
+    assert df.attrs["failed_metrics"] == sorted(DAILY_METRICS)
+
+
+def test_build_daily_metrics_frame_pivots_across_month_boundaries():
+    series = {
+        "CALL_CLICKS": [
+            {"date": {"year": 2024, "month": 3, "day": 1}, "value": "2"},
+            {"date": {"year": 2024, "month": 2, "day": 29}, "value": "1"},
+        ],
+        "WEBSITE_CLICKS": [{"date": {"year": 2024, "month": 3, "day": 1}}],
+    }
+
+    df = build_daily_metrics_frame(series)
+
+    assert list(df["date"]) == [pd.Timestamp("2024-02-29"), pd.Timestamp("2024-03-01")]
+    assert list(df["CALL_CLICKS"]) == [1, 2]
+    assert list(df["WEBSITE_CLICKS"]) == [0, 0]
+    assert list(df.columns) == ["date"] + DAILY_METRICS
+
+
+def test_widening_range_fetches_only_missing_days():
+    service = MagicMock()
+    service.locations().fetchMultiDailyMetricsTimeSeries().execute.return_value = {
+        "multiDailyMetricTimeSeries": []
+    }
+    fetch = service.locations().fetchMultiDailyMetricsTimeSeries
+
+    with patch("data_fetcher.get_performance_service", return_value=service):
+        fetch.reset_mock()
+        get_daily_metrics(CREDS, "locations/2", date(2024, 3, 2), date(2024, 3, 31))
+        get_daily_metrics.clear()
+        get_daily_metrics(CREDS, "locations/2", date(2024, 3, 2), date(2024, 3, 31))
+        assert fetch.call_count == 1
+
+        df = get_daily_metrics(CREDS, "locations/2", date(2024, 1, 2), date(2024, 3, 31))
+
+    assert fetch.call_count == 2
+    _, kwargs = fetch.call_args
+    assert (kwargs["dailyRange_startDate_month"], kwargs["dailyRange_startDate_day"]) == (1, 2)
+    assert (kwargs["dailyRange_endDate_month"], kwargs["dailyRange_endDate_day"]) == (3, 1)
+    assert len(df) == 90
+
+
+def test_backfill_fetches_chunks_in_parallel_and_resumes_after_failures(fake_google_api, monkeypatch):
+    credentials = Credentials(token="t")
+    location_name = fake_google_api.location_names()[0]
+    start, end = date(2023, 1, 1), date(2024, 6, 30)
+    fetch_chunk = data_fetcher._fetch_metrics_chunk
+
+    def flaky_chunk(credentials, service, location_path, location_key, range_start, range_end):
+        if range_start == date(2023, 4, 1):
+            raise RuntimeError("interrupted")
+        return fetch_chunk(credentials, service, location_path, location_key, range_start, range_end)
+
+    monkeypatch.setattr(data_fetcher, "_fetch_metrics_chunk", flaky_chunk)
+    first = data_fetcher.backfill_daily_metrics(credentials, location_name, start, end, max_workers=3)
+
+    # 547 days in chunks of at most METRICS_CHUNK_DAYS
+    assert first["chunks"] == 7
+    assert list(first["failed"]) == ["2023-04-01/2023-06-29"]
+    assert fake_google_api.request_counts["performance.fetchMultiDailyMetricsTimeSeries"] == 6
+
+    monkeypatch.setattr(data_fetcher, "_fetch_metrics_chunk", fetch_chunk)
+    second = data_fetcher.backfill_daily_metrics(credentials, location_name, start, end)
+    assert second == {"chunks": 1, "failed": {}}
+
+    df = data_fetcher.get_daily_metrics(credentials, location_name, start, end)
+    assert len(df) == (end - start).days + 1
+    assert df["date"].is_unique
+    location_id = location_name.rsplit("/", 1)[1]
+    assert int(df.loc[df["date"] == "2023-05-15", "CALL_CLICKS"].iloc[0]) == fake_google_api.daily_value(
+        location_id, "CALL_CLICKS", date(2023, 5, 15)
+    )
+    # Everything came from the store
+    assert fake_google_api.request_counts["performance.fetchMultiDailyMetricsTimeSeries"] == 7
+
+
+def test_backfilled_history_is_not_served_to_other_credentials(fake_google_api):
+    owner, stranger = Credentials(token="owner"), Credentials(token="stranger")
+    location_name = fake_google_api.location_names()[0]
+    start, end = date(2024, 1, 1), date(2024, 1, 31)
+    assert data_fetcher.backfill_daily_metrics(owner, location_name, start, end)["failed"] == {}
+
+    fake_google_api.error_rate, fake_google_api.error_statuses = 1.0, (403,)
+    df = data_fetcher.get_daily_metrics(stranger, location_name, start, end)
+
+    assert df.empty
+    assert df.attrs["failed_metrics"] == sorted(DAILY_METRICS)
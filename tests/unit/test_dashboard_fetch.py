@@ -0,0 +1,62 @@
+import threading
+from datetime import date
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.gmb_app.services import performance_service
+
+
+def test_each_resource_is_available_as_soon_as_it_loads():
+    release_reviews = threading.Event()
+
+    def slow_reviews(*args):
+        release_reviews.wait(5)
+        return [{"name": "reviews/1"}]
+
+    with (
+        patch.object(performance_service, "get_daily_metrics", return_value=pd.DataFrame({"date": []})),
+        patch.object(performance_service, "get_search_keywords", return_value=pd.DataFrame()),
+        patch.object(performance_service, "get_reviews", slow_reviews),
+        patch.object(performance_service, "get_posts", side_effect=RuntimeError("posts down")),
+    ):
+        fetch = performance_service.start_dashboard_fetch(None, "locations/1", None, date(2024, 1, 1), date(2024, 1, 31))
+
+        ready = fetch.wait_any(["metrics_df", "reviews"], timeout=5)
+        assert ready == ["metrics_df"]
+        assert fetch.result("metrics_df", timeout=5).empty
+        assert fetch.wait_any(["posts"], timeout=5) == ["posts"]
+        with pytest.raises(RuntimeError, match="posts down"):
+            fetch.result("posts")
+        assert not fetch.ready("reviews")
+
+        release_reviews.set()
+        assert fetch.result("reviews", timeout=5) == [{"name": "reviews/1"}]
+        assert fetch.done()
+
+
+def test_results_flag_a_resource_still_loading_after_the_deadline():
+    release_reviews = threading.Event()
+
+    def stuck_reviews(*args):
+        release_reviews.wait(5)
+        return [{"name": "reviews/1"}]
+
+    with (
+        patch.object(performance_service, "DEADLINE_GRACE_S", 0),
+        patch.object(performance_service, "get_daily_metrics", return_value=pd.DataFrame({"date": []})),
+        patch.object(performance_service, "get_search_keywords", return_value=pd.DataFrame()),
+        patch.object(performance_service, "get_reviews", stuck_reviews),
+        patch.object(performance_service, "get_posts", return_value=[]),
+    ):
+        fetch = performance_service.start_dashboard_fetch(
+            None, "locations/1", None, date(2024, 1, 1), date(2024, 1, 31), budget_s=0.2
+        )
+        try:
+            data = fetch.results()
+        finally:
+            release_reviews.set()
+
+    assert data["reviews"] == []
+    assert data["incomplete"] == ["reviews"]
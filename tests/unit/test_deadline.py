@@ -0,0 +1,50 @@
+import time
+from datetime import date
+from unittest.mock import patch
+
+import httplib2
+import pytest
+from google.oauth2.credentials import Credentials
+from googleapiclient.errors import HttpError
+
+from src.gmb_app.core import deadline
+from src.gmb_app.core.errors import DeadlineExceeded
+from src.gmb_app.integrations.request_executor import execute_with_retry
+from src.gmb_app.services.performance_service import fetch_dashboard_data
+
+
+def test_retry_backoff_that_would_outlive_the_deadline_is_not_started():
+    def send():
+        raise HttpError(httplib2.Response({"status": 429, "retry-after": "5"}), b"{}")
+
+    with patch("src.gmb_app.integrations.request_executor._sleep") as mocked_sleep:
+        with deadline.within(1.0) as budget, pytest.raises(DeadlineExceeded) as exc_info:
+            execute_with_retry(send, max_retries=3)
+
+    mocked_sleep.assert_not_called()
+    assert isinstance(exc_info.value.__cause__, HttpError)
+    assert budget.exceeded
+
+
+def test_nested_deadline_never_extends_the_outer_one():
+    with deadline.within(0.5) as outer, deadline.within(60) as inner:
+        assert inner.expires_at == outer.expires_at
+        assert deadline.call_timeout_s(60) <= 0.5
+
+
+def test_dashboard_returns_partial_data_within_its_budget(fake_google_api):
+    fake_google_api.reviews_per_location = 400
+    location_name = fake_google_api.location_names()[0]
+    credentials = Credentials(token="t")
+    start, end = date(2024, 1, 1), date(2024, 1, 31)
+    # Build the clients first so only API calls count against the budget
+    fetch_dashboard_data(credentials, fake_google_api.location_names()[1], "accounts/100", start, end)
+    fake_google_api.latency_ms = 300
+
+    started = time.monotonic()
+    data = fetch_dashboard_data(credentials, location_name, "accounts/100", start, end, budget_s=1.0)
+
+    assert time.monotonic() - started < 3.0
+    assert "reviews" in data["incomplete"]
+    assert 0 < len(data["reviews"]) < 400
+    assert len(data["metrics_df"]) == 31
@@ -0,0 +1,62 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from google.auth.credentials import AnonymousCredentials
+
+from drive_helper import validate_public_url
+from src.gmb_app.integrations.http_transport import PooledHttp
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.client_ports.add(self.client_address[1])
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.client_ports = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_pooled_http_reuses_connections_across_threads(server):
+    http = PooledHttp(AnonymousCredentials(), "anonymous")
+    url = f"http://127.0.0.1:{server.server_address[1]}/v1/accounts"
+    responses = []
+
+    def send():
+        responses.append(http.request(url))
+
+    for _ in range(3):
+        worker = threading.Thread(target=send)
+        worker.start()
+        worker.join()
+
+    assert [(resp.status, content) for resp, content in responses] == [(200, b'{"ok": true}')] * 3
+    assert responses[0][0]["content-type"] == "application/json"
+    assert len(server.client_ports) == 1
+
+
+def test_public_url_check_returns_its_connection_to_the_pool(server):
+    url = f"http://127.0.0.1:{server.server_address[1]}/image.png"
+
+    assert validate_public_url(url)
+    assert validate_public_url(url)
+
+    assert len(server.client_ports) == 1
@@ -0,0 +1,87 @@
+import gc
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from google.oauth2.credentials import Credentials
+
+import data_fetcher
+from data_fetcher import extract_location_path, get_account_for_location
+from src.gmb_app.core.identity import credential_identity
+from src.gmb_app.storage import db, location_index
+
+CREDS = SimpleNamespace(client_id="client", refresh_token="refresh")
+
+
+def test_record_and_lookup_location_parent():
+    location_index.record_locations(CREDS, ["accounts/1/locations/10", "accounts/1/locations/11"])
+
+    assert location_index.lookup_location_parent(CREDS, "locations/10") == "accounts/1/locations/10"
+    assert location_index.lookup_location_parent(CREDS, "11") == "accounts/1/locations/11"
+    assert location_index.lookup_location_parent(CREDS, "locations/99") is None
+
+
+def test_full_account_listing_prunes_moved_locations():
+    location_index.record_locations(CREDS, ["accounts/1/locations/10", "accounts/1/locations/11"])
+    location_index.record_locations(CREDS, ["accounts/1/locations/10"], account_name="accounts/1")
+
+    assert location_index.lookup_location_parent(CREDS, "locations/11") is None
+
+
+def test_get_account_for_location_uses_index_before_probing():
+    location_index.record_locations(CREDS, ["accounts/7/locations/70"])
+
+    with patch("data_fetcher.get_accounts") as mocked_accounts:
+        result = get_account_for_location(CREDS, "locations/70")
+
+    assert result == "accounts/7/locations/70"
+    mocked_accounts.assert_not_called()
+
+
+def test_probe_lists_every_account_in_batch_requests(fake_google_api):
+    fake_google_api.accounts = 2
+    fake_google_api.locations_per_account = 5
+    fake_google_api.max_page_size = 2
+    credentials = Credentials(token="t")
+    target = fake_google_api.location_names()[-1]
+
+    assert get_account_for_location(credentials, extract_location_path(target)) == target
+
+    # One round per page: 3 pages of 2 for each of the 2 accounts
+    assert fake_google_api.request_counts["batch"] == 3
+    assert fake_google_api.request_counts["locations.list"] == 6
+    # Locations seen on the way resolve from the index
+    first = fake_google_api.location_names()[0]
+    assert location_index.lookup_location_parent(credentials, extract_location_path(first)) == first
+
+
+def test_stale_indexed_parent_is_forgotten_and_resolved_again(fake_google_api):
+    fake_google_api.accounts = 2
+    fake_google_api.posts_per_location = 2
+    credentials = Credentials(token="t")
+    target = fake_google_api.location_names()[-1]
+    location_id = target.rsplit("/", 1)[1]
+    # The location has since moved away from the account it was indexed under
+    location_index.record_locations(credentials, [f"accounts/999/locations/{location_id}"])
+
+    posts = data_fetcher.get_posts(credentials, f"locations/{location_id}")
+
+    assert len(posts) == 2
+    assert location_index.lookup_location_parent(credentials, location_id) == target
+
+
+def test_token_only_credentials_never_reach_the_on_disk_store():
+    credentials = Credentials(token="t")
+    location_index.record_locations(credentials, ["accounts/1/locations/10"])
+
+    assert location_index.lookup_location_parent(credentials, "locations/10") == "accounts/1/locations/10"
+    with db.connect() as conn:
+        tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+    assert tables == []
+
+    identity = credential_identity(credentials)
+    del credentials
+    gc.collect()
+
+    with db.connect(db._scratch_path()) as conn:
+        rows = conn.execute("SELECT COUNT(*) FROM location_accounts WHERE identity = ?", (identity,)).fetchone()
+    assert rows == (0,)
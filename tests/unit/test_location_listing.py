@@ -0,0 +1,76 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from data_fetcher import (
+    LOCATION_DETAIL_READ_MASK,
+    LOCATION_TITLE_READ_MASK,
+    get_all_accessible_locations,
+    get_location_details,
+    get_location_titles,
+)
+
+CREDS = SimpleNamespace(client_id="client", refresh_token="refresh")
+
+
+def _fake_business_service(pages_by_account):
+    service = MagicMock()
+
+    def list_locations(parent, readMask, pageSize, pageToken=None):
+        if parent == "accounts/broken":
+            raise RuntimeError("forbidden")
+        request = MagicMock()
+        request.execute.return_value = pages_by_account[parent][pageToken]
+        return request
+
+    service.accounts().locations().list.side_effect = list_locations
+    return service
+
+
+def test_all_accessible_locations_keeps_account_order_and_skips_failures():
+    pages_by_account = {
+        "accounts/1": {
+            None: {"locations": [{"name": "locations/10", "title": "A"}], "nextPageToken": "p2"},
+            "p2": {"locations": [{"name": "locations/11", "title": "B"}]},
+        },
+        "accounts/2": {None: {"locations": [{"name": "20", "title": "C"}]}},
+    }
+    accounts = [{"name": "accounts/1"}, {"name": "accounts/broken"}, {"name": "accounts/2"}]
+    pages_seen = []
+
+    with patch("data_fetcher.get_accounts", return_value=accounts), patch(
+        "data_fetcher.get_business_information_service",
+        return_value=_fake_business_service(pages_by_account),
+    ):
+        locations = get_all_accessible_locations(
+            CREDS, on_page=lambda account, page: pages_seen.append((account, len(page)))
+        )
+
+    assert [loc["name"] for loc in locations] == [
+        "accounts/1/locations/10",
+        "accounts/1/locations/11",
+        "accounts/2/locations/20",
+    ]
+    assert sorted(pages_seen) == [("accounts/1", 1), ("accounts/1", 1), ("accounts/2", 1)]
+
+
+def test_location_titles_request_only_name_and_title():
+    service = _fake_business_service({"accounts/1": {None: {"locations": [{"name": "locations/10"}]}}})
+
+    with patch("data_fetcher.get_accounts", return_value=[{"name": "accounts/1"}]), patch(
+        "data_fetcher.get_business_information_service", return_value=service
+    ):
+        get_location_titles(CREDS)
+
+    _, kwargs = service.accounts().locations().list.call_args
+    assert kwargs["readMask"] == LOCATION_TITLE_READ_MASK
+
+
+def test_location_details_fetches_single_location_with_full_mask():
+    service = MagicMock()
+    service.locations().get().execute.return_value = {"name": "locations/10", "title": "A"}
+
+    with patch("data_fetcher.get_business_information_service", return_value=service):
+        details = get_location_details(CREDS, "accounts/1/locations/10")
+
+    service.locations().get.assert_called_with(name="locations/10", readMask=LOCATION_DETAIL_READ_MASK)
+    assert details["name"] == "accounts/1/locations/10"
@@ -0,0 +1,76 @@
+from unittest.mock import MagicMock
+
+from google.oauth2.credentials import Credentials
+
+import data_fetcher
+import drive_helper
+from src.gmb_app.integrations.pagination import PageIterator
+
+PAGES = {None: ([1, 2, 3], "p2"), "p2": ([4, 5, 6], "p3"), "p3": ([7], None)}
+
+
+def _pages(requested):
+    def request_for(page_token):
+        requested.append(page_token)
+        items, next_token = PAGES[page_token]
+        request = MagicMock()
+        request.execute.return_value = {"items": items, **({"nextPageToken": next_token} if next_token else {})}
+        return request
+
+    return request_for
+
+
+def test_pages_are_requested_only_as_items_are_consumed():
+    requested = []
+    pages = PageIterator(_pages(requested), "items")
+
+    for item in pages:
+        if item == 2:
+            break
+
+    assert requested == [None]
+    # Stopping mid-page resumes from that same page
+    assert pages.resume_token is None and not pages.exhausted
+    assert list(PageIterator(_pages(requested), "items")) == [1, 2, 3, 4, 5, 6, 7]
+
+
+def test_limit_and_resume_token_continue_where_the_last_run_stopped():
+    requested = []
+    first = PageIterator(_pages(requested), "items", limit=5)
+    assert list(first) == [1, 2, 3, 4, 5]
+    assert first.resume_token == "p2"
+
+    full_pages = PageIterator(_pages(requested), "items", limit=6)
+    assert list(full_pages.pages()) == [[1, 2, 3], [4, 5, 6]]
+    assert full_pages.resume_token == "p3"
+
+    rest = PageIterator(_pages(requested), "items", page_token=full_pages.resume_token)
+    assert list(rest) == [7]
+    assert rest.exhausted and rest.resume_token is None
+    assert requested == [None, "p2", None, "p2", "p3"]
+
+
+def test_every_list_endpoint_follows_next_page_tokens(fake_google_api):
+    fake_google_api.accounts = 3
+    fake_google_api.drive_folders = 5
+    fake_google_api.media_per_location = 5
+    fake_google_api.max_page_size = 2
+    credentials = Credentials(token="t")
+    location_name = fake_google_api.location_names()[0]
+
+    assert len(data_fetcher.get_accounts(credentials)) == 3
+    assert len(data_fetcher.get_media(credentials, location_name)) == 5
+    assert len(data_fetcher.get_questions(credentials, location_name)) == fake_google_api.questions_per_location
+    assert len(drive_helper.list_folders(credentials)) == 5
+    assert fake_google_api.request_counts["drive.files.list"] == 3
+
+
+def test_streamed_locations_stop_at_the_limit(fake_google_api):
+    fake_google_api.accounts = 3
+    fake_google_api.max_page_size = 2
+
+    locations = list(data_fetcher.iter_locations(Credentials(token="t"), limit=4))
+
+    assert [loc["name"] for loc in locations] == fake_google_api.location_names()[:4]
+    # 2 pages of the first account, 1 of the second; the third is never listed
+    assert fake_google_api.request_counts["locations.list"] == 3
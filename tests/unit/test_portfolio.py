@@ -0,0 +1,69 @@
+from datetime import date
+from unittest.mock import patch
+
+from google.oauth2.credentials import Credentials
+
+from src.gmb_app.services import performance_service
+
+START, END = date(2024, 1, 1), date(2024, 1, 10)
+
+
+def test_portfolio_combines_every_location_into_long_format(fake_google_api):
+    fake_google_api.accounts = 2
+    names = fake_google_api.location_names()
+    streamed = []
+
+    frame = performance_service.fetch_portfolio_data(
+        Credentials(token="t"), names, START, END, max_workers=3, on_result=streamed.append
+    )
+
+    assert sorted(result["location_id"] for result in streamed) == sorted(names)
+    assert list(frame.columns) == performance_service.PORTFOLIO_COLUMNS
+    assert set(frame["location_id"]) == set(names)
+    assert set(frame["resource"]) == {"metrics", "keywords", "reviews", "posts"}
+    assert not frame.attrs["failed_locations"]
+    # Reviews come in bulk per account: 3 locations x 30 reviews is 2 pages of 50
+    assert fake_google_api.request_counts["reviews.batchGet"] == 4
+    assert fake_google_api.request_counts["reviews.list"] == 0
+
+    location_id = names[-1].rsplit("/", 1)[1]
+    calls = frame[
+        (frame["location_id"] == names[-1]) & (frame["resource"] == "metrics") & (frame["metric"] == "CALL_CLICKS")
+    ]
+    assert len(calls) == 10
+    assert int(calls["value"].iloc[0]) == fake_google_api.daily_value(location_id, "CALL_CLICKS", START)
+    reviews = frame[(frame["location_id"] == names[0]) & (frame["resource"] == "reviews")]
+    assert len(reviews) == fake_google_api.reviews_per_location
+    assert reviews["value"].between(1, 5).all()
+
+
+def test_failed_location_is_reported_without_stopping_the_others(fake_google_api):
+    names = fake_google_api.location_names()
+    fetch = performance_service.fetch_dashboard_data
+
+    def flaky_fetch(credentials, location_id, *args, **kwargs):
+        if location_id == names[1]:
+            raise RuntimeError("boom")
+        return fetch(credentials, location_id, *args, **kwargs)
+
+    with patch.object(performance_service, "fetch_dashboard_data", flaky_fetch):
+        frame = performance_service.fetch_portfolio_data(Credentials(token="t"), names, START, END)
+
+    assert frame.attrs["failed_locations"] == {names[1]: "boom"}
+    assert set(frame["location_id"]) == {names[0], names[2]}
+
+
+def test_portfolio_health_reads_profiles_media_and_questions_in_batches(fake_google_api):
+    fake_google_api.accounts = 2
+    names = fake_google_api.location_names()
+    credentials = Credentials(token="t")
+    results = list(performance_service.iter_portfolio_data(credentials, names, START, END))
+    results.append({"location_id": "accounts/100/locations/99999", "data": None, "error": "boom"})
+
+    scores = performance_service.score_portfolio_health(credentials, results)
+
+    assert set(scores) == set(names)
+    assert all(0 <= score <= 100 for score in scores.values())
+    # Profiles, media and questions: one batch request each
+    assert fake_google_api.request_counts["batch"] == 3
+    assert fake_google_api.request_counts["media.list"] == len(names)
@@ -0,0 +1,58 @@
+from google.oauth2.credentials import Credentials
+
+import data_fetcher
+from src.gmb_app.storage import post_store
+
+
+def test_posts_sync_every_page_with_insights_in_bulk(fake_google_api):
+    fake_google_api.posts_per_location = 25
+    fake_google_api.max_page_size = 10
+    location_name = fake_google_api.location_names()[0]
+
+    posts = data_fetcher.get_posts(Credentials(token="t"), location_name)
+
+    assert len(posts) == 25
+    assert fake_google_api.request_counts["localPosts.list"] == 3
+    # 25 posts, POST_INSIGHTS_BATCH_POSTS per request
+    assert fake_google_api.request_counts["localPosts.reportInsights"] == 3
+    assert all(set(post["insights"]) == set(data_fetcher.POST_INSIGHT_METRICS) for post in posts)
+    assert [post["createTime"] for post in posts] == sorted((post["createTime"] for post in posts), reverse=True)
+
+
+def test_only_young_posts_refresh_their_insights(fake_google_api, monkeypatch):
+    monkeypatch.setenv("GMB_POST_INSIGHTS_REFRESH_DAYS", "20")
+    fake_google_api.posts_per_location = 6
+    credentials = Credentials(token="t")
+    location_name = fake_google_api.location_names()[0]
+    data_fetcher.sync_posts(credentials, location_name)
+
+    # Fake posts are 1, 8, 15, 22, 29 and 36 days old
+    assert data_fetcher.sync_posts(credentials, location_name) == 3
+    assert fake_google_api.request_counts["localPosts.reportInsights"] == 2
+
+
+def test_posts_deleted_on_google_are_dropped(fake_google_api):
+    fake_google_api.posts_per_location = 4
+    credentials = Credentials(token="t")
+    location_name = fake_google_api.location_names()[0]
+    data_fetcher.sync_posts(credentials, location_name)
+
+    fake_google_api.posts_per_location = 2
+    data_fetcher.sync_posts(credentials, location_name)
+
+    location_key = location_name.rsplit("/", 1)[1]
+    assert len(post_store.load_posts(credentials, location_key)) == 2
+    assert len(post_store.load_insights(credentials, location_key)) == 2
+
+
+def test_stored_posts_are_not_served_after_access_is_denied(fake_google_api):
+    fake_google_api.posts_per_location = 3
+    owner, stranger = Credentials(token="owner"), Credentials(token="stranger")
+    location_name = fake_google_api.location_names()[0]
+    assert len(data_fetcher.get_posts(owner, location_name)) == 3
+
+    fake_google_api.error_rate, fake_google_api.error_statuses = 1.0, (403,)
+
+    assert data_fetcher.get_posts(stranger, location_name) == []
+    data_fetcher.invalidate_posts_cache()
+    assert data_fetcher.get_posts(owner, location_name) == []
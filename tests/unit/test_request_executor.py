@@ -0,0 +1,92 @@
+from unittest.mock import patch
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from src.gmb_app.core.errors import AuthError, IntegrationError, QuotaError
+from src.gmb_app.integrations.quota_governor import SharedTokenBucket
+from src.gmb_app.integrations.request_executor import (
+    TokenBucket,
+    classify_http_error,
+    execute_with_retry,
+)
+
+
+def _http_error(status, content=b"{}", headers=None):
+    resp = httplib2.Response({"status": status, **(headers or {})})
+    return HttpError(resp, content)
+
+
+def _flaky(*outcomes):
+    outcomes = list(outcomes)
+
+    def send():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return send
+
+
+def test_classify_http_error_maps_statuses():
+    assert isinstance(classify_http_error(_http_error(429)), QuotaError)
+    assert isinstance(classify_http_error(_http_error(401)), AuthError)
+    rate_limited = _http_error(403, b'{"error": {"errors": [{"reason": "userRateLimitExceeded"}]}}')
+    assert classify_http_error(rate_limited).retryable
+    assert classify_http_error(_http_error(503)).retryable
+    assert not classify_http_error(_http_error(404)).retryable
+
+
+def test_retries_retryable_errors_and_honours_retry_after():
+    send = _flaky(_http_error(429, headers={"retry-after": "3"}), _http_error(503), {"ok": True})
+
+    with patch("src.gmb_app.integrations.request_executor._sleep") as mocked_sleep:
+        assert execute_with_retry(send, max_retries=3) == {"ok": True}
+
+    delays = [call.args[0] for call in mocked_sleep.call_args_list]
+    assert delays[0] == 3
+    assert 0 <= delays[1] <= 1.0
+
+
+def test_non_retryable_error_raises_app_error_with_cause():
+    with patch("src.gmb_app.integrations.request_executor._sleep") as mocked_sleep:
+        with pytest.raises(IntegrationError) as exc_info:
+            execute_with_retry(_flaky(_http_error(404)), max_retries=3)
+
+    assert exc_info.value.status_code == 404
+    assert isinstance(exc_info.value.__cause__, HttpError)
+    mocked_sleep.assert_not_called()
+
+
+def test_non_idempotent_requests_are_not_retried_on_server_errors():
+    send = _flaky(_http_error(503), {"created": True})
+
+    with patch("src.gmb_app.integrations.request_executor._sleep"):
+        with pytest.raises(IntegrationError):
+            execute_with_retry(send, max_retries=3, idempotent=False)
+
+
+def test_token_bucket_waits_once_burst_is_spent():
+    bucket = TokenBucket(rate_per_s=2, capacity=2)
+
+    with patch("src.gmb_app.integrations.request_executor._sleep") as mocked_sleep:
+        bucket.acquire()
+        bucket.acquire()
+        bucket.acquire()
+
+    assert mocked_sleep.call_count == 1
+    assert 0.4 < mocked_sleep.call_args.args[0] <= 0.5
+
+
+def test_shared_token_bucket_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "quota.sqlite3")
+    first = SharedTokenBucket("mybusiness", rate_per_s=1, capacity=1, path=path)
+    second = SharedTokenBucket("mybusiness", rate_per_s=1, capacity=1, path=path)
+
+    with patch("src.gmb_app.integrations.quota_governor._sleep") as mocked_sleep:
+        first.acquire()
+        second.acquire()
+
+    assert mocked_sleep.call_count == 1
@@ -0,0 +1,174 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from data_fetcher import get_reviews, sync_reviews, sync_reviews_batch
+from src.gmb_app.core.errors import AuthError
+from src.gmb_app.storage import review_store
+
+CREDS = SimpleNamespace(client_id="client", refresh_token="refresh")
+
+
+def _review(review_id, update_time):
+    return {"name": f"accounts/1/locations/2/reviews/{review_id}", "updateTime": update_time}
+
+
+def _fake_reviews_service(pages):
+    service = MagicMock()
+    calls = []
+
+    def list_reviews(parent, pageSize, orderBy, pageToken=None):
+        calls.append(pageToken)
+        request = MagicMock()
+        request.execute.return_value = pages[pageToken]
+        return request
+
+    service.accounts().locations().reviews().list.side_effect = list_reviews
+    return service, calls
+
+
+def test_first_sync_pages_through_full_history():
+    pages = {
+        None: {"reviews": [_review("c", "2024-03-01T00:00:00Z"), _review("b", "2024-02-01T00:00:00Z")], "nextPageToken": "p2"},
+        "p2": {"reviews": [_review("a", "2024-01-01T00:00:00Z")]},
+    }
+    service, calls = _fake_reviews_service(pages)
+
+    with patch("data_fetcher.get_mybusiness_service", return_value=service):
+        reviews = get_reviews(CREDS, "accounts/1/locations/2", "accounts/1")
+
+    assert calls == [None, "p2"]
+    assert [r["name"].rsplit("/", 1)[1] for r in reviews] == ["c", "b", "a"]
+
+
+def test_incremental_sync_stops_at_last_seen_update_time():
+    first_pages = {
+        None: {"reviews": [_review("b", "2024-02-01T00:00:00Z")], "nextPageToken": "p2"},
+        "p2": {"reviews": [_review("a", "2024-01-01T00:00:00Z")]},
+    }
+    service, _ = _fake_reviews_service(first_pages)
+    with patch("data_fetcher.get_mybusiness_service", return_value=service):
+        sync_reviews(CREDS, "accounts/1/locations/2", "accounts/1")
+
+    second_pages = {
+        None: {
+            "reviews": [
+                _review("a", "2024-04-01T00:00:00.5Z"),
+                _review("c", "2024-03-01T00:00:00Z"),
+                _review("b", "2024-02-01T00:00:00Z"),
+            ],
+            "nextPageToken": "p2",
+        },
+        "p2": {"reviews": [_review("old", "2023-01-01T00:00:00Z")]},
+    }
+    service, calls = _fake_reviews_service(second_pages)
+    with patch("data_fetcher.get_mybusiness_service", return_value=service):
+        fetched = sync_reviews(CREDS, "accounts/1/locations/2", "accounts/1")
+
+    assert fetched == 2
+    assert calls == [None]
+
+    with patch("data_fetcher.get_mybusiness_service", side_effect=RuntimeError("offline")):
+        reviews = get_reviews(CREDS, "accounts/1/locations/2", "accounts/1")
+
+    assert len(reviews) == 3
+    assert reviews[0]["updateTime"] == "2024-04-01T00:00:00.5Z"
+
+
+def test_stored_reviews_are_not_served_after_access_is_denied():
+    owner = SimpleNamespace(client_id="client", refresh_token="owner")
+    stranger = SimpleNamespace(client_id="client", refresh_token="stranger")
+    service, _ = _fake_reviews_service({None: {"reviews": [dict(_review("a", "2024-01-01T00:00:00Z"), comment="secret")]}})
+    with patch("data_fetcher.get_mybusiness_service", return_value=service):
+        assert len(get_reviews(owner, "accounts/1/locations/2", "accounts/1")) == 1
+
+    with patch("data_fetcher.get_mybusiness_service", side_effect=AuthError("denied", status_code=403)):
+        assert get_reviews(stranger, "accounts/1/locations/2", "accounts/1") == []
+        get_reviews.clear()
+        assert get_reviews(owner, "accounts/1/locations/2", "accounts/1") == []
+
+
+def test_reviews_are_ordered_by_instant_not_text():
+    review_store.save_reviews(
+        CREDS,
+        "2",
+        [_review("whole", "2024-04-01T00:00:00Z"), _review("half", "2024-04-01T00:00:00.5Z")],
+    )
+
+    assert [r["name"].rsplit("/", 1)[1] for r in review_store.load_reviews(CREDS, "2")] == ["half", "whole"]
+
+
+def _fake_batch_service(reviews_by_location):
+    """batchGetReviews over {location name: [(review id, updateTime)]}, newest update first."""
+    service = MagicMock()
+    calls = []
+    items = sorted(
+        (
+            {"name": name, "review": {"name": f"{name}/reviews/{review_id}", "updateTime": update_time}}
+            for name, reviews in reviews_by_location.items()
+            for review_id, update_time in reviews
+        ),
+        key=lambda item: item["review"]["updateTime"],
+        reverse=True,
+    )
+
+    def batch_get(name, body):
+        calls.append(body.get("pageToken"))
+        start = int(body.get("pageToken") or 0)
+        end = start + body["pageSize"]
+        request = MagicMock()
+        request.execute.return_value = {
+            "locationReviews": items[start:end],
+            **({"nextPageToken": str(end)} if end < len(items) else {}),
+        }
+        return request
+
+    service.accounts().locations().batchGetReviews.side_effect = batch_get
+    return service, calls
+
+
+def test_repeat_batch_sync_of_busy_and_empty_locations_costs_one_request():
+    busy, empty = "accounts/1/locations/2", "accounts/1/locations/3"
+    history = [(f"r{i}", f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}Z") for i in range(500)]
+    service, calls = _fake_batch_service({busy: history, empty: []})
+
+    with patch("data_fetcher.get_mybusiness_service", return_value=service):
+        assert sync_reviews_batch(CREDS, [busy, empty]) == {busy: 500, empty: 0}
+        first_sync_calls = len(calls)
+        assert sync_reviews_batch(CREDS, [busy, empty]) == {busy: 0, empty: 0}
+
+    assert first_sync_calls == 10
+    assert len(calls) - first_sync_calls == 1
+
+
+def test_reviews_deleted_on_google_disappear_on_the_scheduled_full_sync(monkeypatch):
+    service, _ = _fake_reviews_service(
+        {None: {"reviews": [_review("b", "2024-02-01T00:00:00Z"), _review("a", "2024-01-01T00:00:00Z")]}}
+    )
+    with patch("data_fetcher.get_mybusiness_service", return_value=service):
+        sync_reviews(CREDS, "accounts/1/locations/2", "accounts/1")
+
+    service, calls = _fake_reviews_service({None: {"reviews": [_review("b", "2024-02-01T00:00:00Z")]}})
+    with patch("data_fetcher.get_mybusiness_service", return_value=service):
+        sync_reviews(CREDS, "accounts/1/locations/2", "accounts/1")
+        assert len(review_store.load_reviews(CREDS, "2")) == 2
+
+        monkeypatch.setenv("GMB_REVIEWS_FULL_SYNC_HOURS", "0")
+        sync_reviews(CREDS, "accounts/1/locations/2", "accounts/1")
+
+    assert [r["name"].rsplit("/", 1)[1] for r in review_store.load_reviews(CREDS, "2")] == ["b"]
+
+
+def test_more_stored_reviews_than_google_reports_triggers_a_full_sync():
+    service, _ = _fake_reviews_service(
+        {None: {"reviews": [_review("b", "2024-02-01T00:00:00Z"), _review("a", "2024-01-01T00:00:00Z")]}}
+    )
+    with patch("data_fetcher.get_mybusiness_service", return_value=service):
+        sync_reviews(CREDS, "accounts/1/locations/2", "accounts/1")
+
+    remaining = {None: {"reviews": [_review("b", "2024-02-01T00:00:00Z")], "totalReviewCount": 1}}
+    service, _ = _fake_reviews_service(remaining)
+    with patch("data_fetcher.get_mybusiness_service", return_value=service):
+        sync_reviews(CREDS, "accounts/1/locations/2", "accounts/1")
+        sync_reviews(CREDS, "accounts/1/locations/2", "accounts/1")
+
+    assert len(review_store.load_reviews(CREDS, "2")) == 1
@@ -0,0 +1,72 @@
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from data_fetcher import get_monthly_search_keywords, get_search_keywords
+
+CREDS = SimpleNamespace(client_id="client", refresh_token="refresh")
+
+
+def _fake_keywords_service(counts_by_month):
+    service = MagicMock()
+    requested = []
+
+    def list_keywords(parent, monthlyRange_startMonth_year, monthlyRange_startMonth_month, pageToken=None, **kwargs):
+        month = f"{monthlyRange_startMonth_year:04d}-{monthlyRange_startMonth_month:02d}"
+        requested.append(month)
+        request = MagicMock()
+        request.execute.return_value = {"searchKeywordsCounts": counts_by_month.get(month, [])}
+        return request
+
+    service.locations().searchkeywords().impressions().monthly().list.side_effect = list_keywords
+    return service, requested
+
+
+def test_closed_months_are_fetched_once_and_aggregated():
+    counts_by_month = {
+        "2024-01": [
+            {"searchKeyword": "pizza", "insightsValue": {"value": "30"}},
+            {"searchKeyword": "pasta", "insightsValue": {"threshold": "15"}},
+        ],
+        "2024-02": [{"searchKeyword": "pizza", "insightsValue": {"value": "12"}}],
+    }
+    service, requested = _fake_keywords_service(counts_by_month)
+
+    with patch("data_fetcher.get_performance_service", return_value=service):
+        df = get_search_keywords(CREDS, "locations/2", date(2024, 1, 10), date(2024, 2, 5))
+        monthly_df = get_monthly_search_keywords(CREDS, "locations/2", date(2024, 1, 1), date(2024, 2, 1))
+
+    assert requested == ["2024-01", "2024-02"]
+    assert df.to_dict("records") == [
+        {"keyword": "pizza", "count": 42, "display_count": "42"},
+        {"keyword": "pasta", "count": 15, "display_count": "< 15"},
+    ]
+    assert sorted(monthly_df["month"].unique()) == ["2024-01", "2024-02"]
+
+
+def test_open_month_is_always_refetched():
+    service, requested = _fake_keywords_service({})
+    today = date.today()
+
+    with patch("data_fetcher.get_performance_service", return_value=service):
+        get_monthly_search_keywords(CREDS, "locations/2", today, today)
+        get_monthly_search_keywords(CREDS, "locations/2", today, today)
+
+    assert len(requested) == 2
+
+
+def test_closed_months_stored_for_one_identity_are_fetched_again_for_another():
+    counts_by_month = {"2024-01": [{"searchKeyword": "pizza", "insightsValue": {"value": "30"}}]}
+    service, requested = _fake_keywords_service(counts_by_month)
+    owner = SimpleNamespace(client_id="client", refresh_token="owner")
+    stranger = SimpleNamespace(client_id="client", refresh_token="stranger")
+
+    with patch("data_fetcher.get_performance_service", return_value=service):
+        get_monthly_search_keywords(owner, "locations/2", date(2024, 1, 1), date(2024, 1, 31))
+    denied = MagicMock()
+    denied.locations().searchkeywords().impressions().monthly().list().execute.side_effect = RuntimeError("403")
+    with patch("data_fetcher.get_performance_service", return_value=denied):
+        monthly_df = get_monthly_search_keywords(stranger, "locations/2", date(2024, 1, 1), date(2024, 1, 31))
+
+    assert requested == ["2024-01"]
+    assert monthly_df.empty
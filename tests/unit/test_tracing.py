@@ -0,0 +1,78 @@
+import json
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+import data_fetcher
+from src.gmb_app.core import tracing
+from src.gmb_app.services.performance_service import fetch_dashboard_data
+
+
+@pytest.fixture
+def recorded_spans():
+    exporter = tracing.add_exporter(tracing.InMemoryExporter())
+    yield exporter.spans
+    tracing.remove_exporter(exporter)
+
+
+def test_dashboard_fetch_records_phases_and_api_calls(fake_google_api, recorded_spans):
+    fake_google_api.reviews_per_location = 120
+    location_name = fake_google_api.location_names()[0]
+
+    fetch_dashboard_data(Credentials(token="t"), location_name, "accounts/100", date(2024, 1, 1), date(2024, 1, 31))
+
+    by_name = {}
+    for span in recorded_spans:
+        by_name.setdefault(span.name, []).append(span)
+    root = by_name["dashboard.fetch"][0]
+    phases = {name: by_name[name][0] for name in ("dashboard.metrics", "dashboard.reviews", "dashboard.posts")}
+    assert all(phase.parent_id == root.span_id for phase in phases.values())
+
+    review_calls = by_name["mybusiness.accounts.locations.reviews.list"]
+    assert [call.attributes["page"] for call in review_calls] == [1, 2, 3]
+    assert all(call.parent_id == phases["dashboard.reviews"].span_id for call in review_calls)
+    first = review_calls[0]
+    assert first.kind == "api_call"
+    assert first.outcome == "ok"
+    assert first.attributes["service"] == "mybusiness"
+    assert first.attributes["location"] == location_name.rsplit("/", 1)[1]
+    assert first.attributes["status_code"] == 200
+    assert first.attributes["bytes_received"] > 0
+    assert first.duration_ms >= 0
+
+
+def test_failed_calls_record_retries_and_outcome(fake_google_api, recorded_spans):
+    fake_google_api.error_rate = 1.0
+
+    with patch("src.gmb_app.integrations.request_executor._sleep"):
+        data_fetcher.get_accounts(Credentials(token="t"))
+
+    (call,) = [span for span in recorded_spans if span.name == "mybusinessaccountmanagement.accounts.list"]
+    assert call.outcome == "integration_error"
+    assert call.attributes["retries"] == 4
+    assert call.attributes["attempts"] == 5
+    assert call.attributes["status_code"] == 503
+
+
+def test_exporters_write_json_lines_and_otlp(tmp_path):
+    jsonl = tracing.add_exporter(tracing.JsonLinesExporter(str(tmp_path / "spans.jsonl")))
+    otlp = tracing.add_exporter(tracing.OtlpJsonExporter(str(tmp_path / "spans.otlp.jsonl")))
+    try:
+        with tracing.span("dashboard.fetch", location="123"):
+            with tracing.span("mybusiness.accounts.locations.reviews.list", kind="api_call"):
+                pass
+    finally:
+        tracing.remove_exporter(jsonl)
+        tracing.remove_exporter(otlp)
+
+    lines = [json.loads(line) for line in (tmp_path / "spans.jsonl").read_text().splitlines()]
+    assert [line["name"] for line in lines] == ["mybusiness.accounts.locations.reviews.list", "dashboard.fetch"]
+    assert lines[0]["parent_id"] == lines[1]["span_id"]
+
+    request = json.loads((tmp_path / "spans.otlp.jsonl").read_text().splitlines()[1])
+    (otlp_span,) = request["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert otlp_span["name"] == "dashboard.fetch"
+    assert otlp_span["status"] == {"code": 1}
+    assert {"key": "location", "value": {"stringValue": "123"}} in otlp_span["attributes"]
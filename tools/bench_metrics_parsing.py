@@ -0,0 +1,81 @@
+"""
+Micro-benchmark: parsing a Performance API metrics payload into the metrics DataFrame.
+
+Compares the original per-value loop (f-string + pd.to_datetime per datedValue,
+dict-of-dicts, then DataFrame) with data_fetcher.build_daily_metrics_frame on a
+synthetic 500-day x 10-metric payload.
+
+Run from the repository root:
+    python tools/bench_metrics_parsing.py
+"""
+import os
+import sys
+import timeit
+from datetime import date, timedelta
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_fetcher import DAILY_METRICS, build_daily_metrics_frame  # noqa: E402
+
+DAYS = 500
+REPEATS = 5
+
+
+def build_payload(days=DAYS, metrics=DAILY_METRICS):
+    start = date(2023, 1, 1)
+    series = {}
+    for m, metric in enumerate(metrics):
+        dated_values = []
+        for i in range(days):
+            day = start + timedelta(days=i)
+            entry = {"date": {"year": day.year, "month": day.month, "day": day.day}}
+            # The API omits "value" for zero days; mimic that on a few of them.
+            if (i + m) % 7:
+                entry["value"] = str((i * 31 + m * 17) % 250)
+            dated_values.append(entry)
+        series[metric] = dated_values
+    return series
+
+
+def legacy_parse(series, metrics=DAILY_METRICS):
+    data = {}
+    for metric, dated_values in series.items():
+        for val in dated_values:
+            date_str = f"{val['date']['year']}-{val['date']['month']}-{val['date']['day']}"
+            parsed_date = pd.to_datetime(date_str)
+            value = int(val.get("value", 0))
+            if parsed_date not in data:
+                data[parsed_date] = {"date": parsed_date}
+            data[parsed_date][metric] = value
+
+    df = pd.DataFrame(list(data.values())).sort_values("date")
+    for metric in metrics:
+        if metric not in df.columns:
+            df[metric] = 0
+    return df.fillna(0)
+
+
+def main():
+    series = build_payload()
+
+    legacy_df = legacy_parse(series).reset_index(drop=True)
+    vectorized_df = build_daily_metrics_frame(series)
+    pd.testing.assert_frame_equal(
+        legacy_df[vectorized_df.columns].astype({m: "int64" for m in DAILY_METRICS}),
+        vectorized_df,
+        check_dtype=False,
+    )
+
+    legacy_s = min(timeit.repeat(lambda: legacy_parse(series), number=1, repeat=REPEATS))
+    vectorized_s = min(timeit.repeat(lambda: build_daily_metrics_frame(series), number=1, repeat=REPEATS))
+
+    print(f"payload: {DAYS} days x {len(DAILY_METRICS)} metrics ({DAYS * len(DAILY_METRICS)} values)")
+    print(f"legacy loop:  {legacy_s * 1000:8.2f} ms")
+    print(f"vectorized:   {vectorized_s * 1000:8.2f} ms")
+    print(f"speedup:      {legacy_s / vectorized_s:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
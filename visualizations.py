@@ -127,8 +127,16 @@ def plot_review_sentiment(reviews):
     )
     return fig
 
+POST_INSIGHT_LABELS = {
+    'LOCAL_POST_VIEWS_SEARCH': 'Views',
+    'LOCAL_POST_ACTIONS_CALL_TO_ACTION': 'Button Clicks',
+}
+
 def plot_post_performance(posts):
-    """Plots performance of local posts."""
+    """Plots views and button clicks of each local post over time.
+
+    Falls back to counting posts by type and state when no insights were fetched.
+    """
     if not posts:
         return None
         
@@ -136,15 +144,30 @@ def plot_post_performance(posts):
     
     post_data = []
     for p in posts:
-        post_data.append({
+        row = {
+            'summary': (p.get('summary') or '')[:40],
             'topicType': p.get('topicType', 'UNKNOWN'),
             'state': p.get('state', 'UNKNOWN'),
             'createTime': p.get('createTime')
-        })
+        }
+        for metric, label in POST_INSIGHT_LABELS.items():
+            row[label] = (p.get('insights') or {}).get(metric)
+        post_data.append(row)
         
     df = pd.DataFrame(post_data)
     if df.empty:
         return None
+
+    labels = list(POST_INSIGHT_LABELS.values())
+    if df[labels].notna().any().any():
+        df['createTime'] = pd.to_datetime(df['createTime'], utc=True, format='mixed')
+        df_melted = df.melt(id_vars=['createTime', 'summary'], value_vars=labels, var_name='Metric', value_name='Count')
+        fig = px.bar(df_melted.fillna({'Count': 0}), x='createTime', y='Count', color='Metric', barmode='group',
+                     hover_data=['summary'],
+                     title="Post Views and Clicks",
+                     labels={'createTime': 'Published'},
+                     template='plotly_white')
+        return fig
         
     fig = px.histogram(df, x='topicType', color='state', 
                        title="Posts by Type and State",